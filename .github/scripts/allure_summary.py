@@ -0,0 +1,274 @@
+"""Static summary of an allure-results directory, without the Java Allure CLI.
+
+Streams the *-result.json / *-container.json files one at a time and writes:
+  - a self-contained HTML page (per-test status, duration, step tree, attachments, slowest steps),
+  - optionally a markdown summary (e.g. $GITHUB_STEP_SUMMARY).
+Retries of the same test (same historyId) are folded into the last attempt.
+
+Usage:
+    python .github/scripts/allure_summary.py allure-results --html allure-summary/index.html --markdown summary.md
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import html
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+STATUSES = ("passed", "failed", "broken", "skipped", "unknown")
+_COLORS = {"passed": "#2e7d32", "failed": "#c62828", "broken": "#ef6c00", "skipped": "#757575", "unknown": "#6a1b9a"}
+
+
+@dataclass
+class Step:
+    name: str
+    status: str
+    duration_ms: int
+    attachments: List[Tuple[str, str]] = field(default_factory=list)
+    steps: List["Step"] = field(default_factory=list)
+
+
+@dataclass
+class TestResult:
+    uuid: str
+    key: str
+    name: str
+    full_name: str
+    status: str
+    start: int
+    duration_ms: int
+    message: str = ""
+    steps: List[Step] = field(default_factory=list)
+    attachments: List[Tuple[str, str]] = field(default_factory=list)
+    attempts: int = 1
+
+
+def _duration(node: dict) -> int:
+    start, stop = node.get("start"), node.get("stop")
+    return max(0, int(stop) - int(start)) if start is not None and stop is not None else 0
+
+
+def _attachments(node: dict) -> List[Tuple[str, str]]:
+    return [(a.get("name") or a.get("source", ""), a.get("source", "")) for a in node.get("attachments") or []]
+
+
+class SlowSteps:
+    """Keeps only the N slowest steps seen so far (min-heap), so memory stays flat on large runs."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._heap: List[Tuple[int, int, str, str]] = []
+        self._seq = 0
+
+    def add(self, duration_ms: int, step: str, test: str) -> None:
+        self._seq += 1
+        item = (duration_ms, self._seq, step, test)
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, item)
+        elif duration_ms > self._heap[0][0]:
+            heapq.heapreplace(self._heap, item)
+
+    def threshold(self) -> int:
+        return self._heap[0][0] if len(self._heap) >= self.limit else 0
+
+    def rows(self) -> List[Tuple[int, str, str]]:
+        return [(d, s, t) for d, _, s, t in sorted(self._heap, reverse=True)]
+
+
+def _step(node: dict, test_name: str, slow: SlowSteps) -> Step:
+    step = Step(
+        name=node.get("name", ""),
+        status=node.get("status", "unknown"),
+        duration_ms=_duration(node),
+        attachments=_attachments(node),
+        steps=[_step(child, test_name, slow) for child in node.get("steps") or []],
+    )
+    slow.add(step.duration_ms, step.name, test_name)
+    return step
+
+
+def _load(path: str) -> Optional[dict]:
+    try:
+        with open(path, "rb") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def iter_results(results_dir: str, slow: SlowSteps) -> Iterator[TestResult]:
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith("-result.json"):
+                continue
+            data = _load(entry.path)
+            if not data:
+                continue
+            name = data.get("name", entry.name)
+            full_name = data.get("fullName", name)
+            yield TestResult(
+                uuid=data.get("uuid", entry.name),
+                # historyId tells parametrized cases apart and is shared by reruns
+                key=data.get("historyId") or full_name,
+                name=name,
+                full_name=full_name,
+                status=data.get("status", "unknown"),
+                start=int(data.get("start") or 0),
+                duration_ms=_duration(data),
+                message=((data.get("statusDetails") or {}).get("message") or "").strip(),
+                steps=[_step(s, full_name, slow) for s in data.get("steps") or []],
+                attachments=_attachments(data),
+            )
+
+
+def fixture_durations(results_dir: str, slow: SlowSteps, test_names: Dict[str, str]) -> None:
+    """Setup/teardown fixtures live in *-container.json; count them among the slowest steps."""
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith("-container.json"):
+                continue
+            data = _load(entry.path) or {}
+            children = data.get("children") or []
+            test = test_names.get(children[0], "") if children else ""
+            if len(children) > 1:
+                test += f" (+{len(children) - 1} more)"
+            for kind in ("befores", "afters"):
+                for fixture in data.get(kind) or []:
+                    label = "setup" if kind == "befores" else "teardown"
+                    slow.add(_duration(fixture), f"[{label}] {fixture.get('name', '')}", test)
+
+
+def collect(results_dir: str, top: int) -> Tuple[List[TestResult], SlowSteps]:
+    slow = SlowSteps(top)
+    latest: Dict[str, TestResult] = {}
+    names: Dict[str, str] = {}
+    for result in iter_results(results_dir, slow):
+        names[result.uuid] = result.full_name
+        previous = latest.get(result.key)
+        if previous is None:
+            latest[result.key] = result
+        elif result.start >= previous.start:
+            result.attempts = previous.attempts + 1
+            latest[result.key] = result
+        else:
+            previous.attempts += 1
+    fixture_durations(results_dir, slow, names)
+    ordered = sorted(latest.values(), key=lambda r: (STATUSES.index(r.status) if r.status in STATUSES else 9, r.full_name))
+    return ordered, slow
+
+
+def counts(results: List[TestResult]) -> Dict[str, int]:
+    out = {s: 0 for s in STATUSES}
+    for r in results:
+        out[r.status if r.status in out else "unknown"] += 1
+    return out
+
+
+def _fmt_ms(ms: int) -> str:
+    return f"{ms / 1000:.2f}s" if ms >= 1000 else f"{ms}ms"
+
+
+def _badge(status: str) -> str:
+    return f'<span class="b" style="background:{_COLORS.get(status, "#333")}">{html.escape(status)}</span>'
+
+
+def _links(attachments: List[Tuple[str, str]], base: str) -> str:
+    return "".join(
+        f' <a class="att" href="{html.escape(os.path.join(base, src))}">{html.escape(name)}</a>' for name, src in attachments
+    )
+
+
+def _steps_html(steps: List[Step], base: str, slow_ms: int) -> str:
+    if not steps:
+        return ""
+    items = []
+    for s in steps:
+        cls = ' class="slow"' if slow_ms and s.duration_ms >= slow_ms else ""
+        items.append(
+            f"<li{cls}>{_badge(s.status)} {html.escape(s.name)} <i>{_fmt_ms(s.duration_ms)}</i>"
+            f"{_links(s.attachments, base)}{_steps_html(s.steps, base, slow_ms)}</li>"
+        )
+    return "<ul>" + "".join(items) + "</ul>"
+
+
+def render_html(results: List[TestResult], slow: SlowSteps, results_dir: str, out_path: str, elapsed: float) -> None:
+    base = os.path.relpath(results_dir, os.path.dirname(os.path.abspath(out_path)) or ".")
+    totals = counts(results)
+    slow_ms = slow.threshold()
+    parts = [
+        "<!doctype html><html><head><meta charset='utf-8'><title>Test summary</title><style>"
+        "body{font:14px system-ui,sans-serif;margin:24px}table{border-collapse:collapse}"
+        "td,th{border:1px solid #ddd;padding:4px 8px;text-align:left}.b{color:#fff;border-radius:3px;padding:0 6px}"
+        ".slow{background:#fff3cd}ul{margin:2px 0 2px 8px}.att{font-size:12px}pre{white-space:pre-wrap;color:#c62828}"
+        "</style></head><body>",
+        f"<h1>Test summary</h1><p>{len(results)} tests &middot; "
+        + " &middot; ".join(f"{_badge(s)} {n}" for s, n in totals.items() if n)
+        + f" &middot; generated in {elapsed:.2f}s</p>",
+        "<h2>Slowest steps</h2><table><tr><th>Duration</th><th>Step</th><th>Test</th></tr>",
+    ]
+    parts += [
+        f"<tr class='slow'><td>{_fmt_ms(d)}</td><td>{html.escape(s)}</td><td>{html.escape(t)}</td></tr>"
+        for d, s, t in slow.rows()
+    ]
+    parts.append("</table><h2>Tests</h2>")
+    for r in results:
+        retries = f" <i>({r.attempts} attempts)</i>" if r.attempts > 1 else ""
+        parts.append(
+            f"<details{' open' if r.status in ('failed', 'broken') else ''}><summary>{_badge(r.status)} "
+            f"{html.escape(r.full_name)} <i>{_fmt_ms(r.duration_ms)}</i>{retries}</summary>"
+            + (f"<pre>{html.escape(r.message)}</pre>" if r.message else "")
+            + _links(r.attachments, base)
+            + _steps_html(r.steps, base, slow_ms)
+            + "</details>"
+        )
+    parts.append("</body></html>")
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write("".join(parts))
+
+
+def render_markdown(results: List[TestResult], slow: SlowSteps, limit: int = 10) -> str:
+    totals = counts(results)
+    lines = ["## Allure summary", "", " | ".join(f"{s}: {n}" for s, n in totals.items()), ""]
+    failing = [r for r in results if r.status in ("failed", "broken")]
+    if failing:
+        lines += ["### Failures", ""]
+        for r in failing[:limit]:
+            first = r.message.splitlines()[0] if r.message else ""
+            lines.append(f"- **{r.full_name}** ({r.status}, {_fmt_ms(r.duration_ms)}) {first}")
+        lines.append("")
+    rows = slow.rows()[:limit]
+    if rows:
+        lines += ["### Slowest steps", "", "| Duration | Step | Test |", "|---:|---|---|"]
+        lines += [f"| {_fmt_ms(d)} | {s.replace('|', '/')} | {t.replace('|', '/')} |" for d, s, t in rows]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("results_dir", nargs="?", default="allure-results")
+    parser.add_argument("--html", default="allure-summary/index.html", help="HTML output path")
+    parser.add_argument("--markdown", default=None, help="Append a markdown summary to this file")
+    parser.add_argument("--top", type=int, default=15, help="How many slowest steps to highlight")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.results_dir):
+        # Nothing ran (e.g. the job failed before pytest); not a reason to fail the summary step too
+        print(f"Allure results not found at {args.results_dir}; no summary written")
+        return 0
+    start = time.perf_counter()
+    results, slow = collect(args.results_dir, args.top)
+    render_html(results, slow, args.results_dir, args.html, time.perf_counter() - start)
+    if args.markdown:
+        with open(args.markdown, "a", encoding="utf-8") as f:
+            f.write(render_markdown(results, slow))
+    print(f"{len(results)} tests summarised in {time.perf_counter() - start:.2f}s -> {args.html}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,59 @@ from __future__ import annotations
 import os
 import sys
 import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+
+_COUNTS = ('tests', 'failures', 'errors', 'skipped')
+
+
+@dataclass
+class JUnitSummary:
+    tests: int = 0
+    failures: int = 0
+    errors: int = 0
+    skipped: int = 0
+
+    @property
+    def passed(self) -> int:
+        return self.tests - self.failures - self.errors - self.skipped
+
+    @property
+    def passrate(self) -> float:
+        return 0.0 if self.tests == 0 else round(100.0 * self.passed / self.tests, 2)
+
+    def outputs(self) -> dict:
+        return {
+            'tests': self.tests,
+            'passed': self.passed,
+            'failures': self.failures,
+            'errors': self.errors,
+            'skipped': self.skipped,
+            'passrate': self.passrate,
+        }
+
+
+def _add(summary: JUnitSummary, attrib) -> None:
+    for key in _COUNTS:
+        setattr(summary, key, getattr(summary, key) + int(attrib.get(key, 0)))
+
+
+def parse_junit(path: str) -> JUnitSummary:
+    """Totals from a <testsuite> or <testsuites> report, streamed (only suite start tags are read)."""
+    summary = JUnitSummary()
+    depth = 0
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        if event == 'end':
+            depth -= 1
+            elem.clear()  # testcase bodies (captured output, tracebacks) are never needed
+            continue
+        depth += 1
+        if depth == 1 and elem.tag == 'testsuite':
+            # Single-suite report: the root tag carries the totals
+            _add(summary, elem.attrib)
+            break
+        if depth == 2 and elem.tag == 'testsuite':
+            _add(summary, elem.attrib)
+    return summary
 
 
 def main():
@@ -10,40 +63,15 @@ def main():
     if not os.path.exists(p):
         print(f"JUnit report not found at {p}")
         return 1
-    tree = ET.parse(p)
-    root = tree.getroot()
-    # Handle <testsuite> or <testsuites>
-    if root.tag == 'testsuite':
-        ts = root
-        tests = int(ts.attrib.get('tests', 0))
-        failures = int(ts.attrib.get('failures', 0))
-        errors = int(ts.attrib.get('errors', 0))
-        skipped = int(ts.attrib.get('skipped', 0))
-    else:
-        tests = failures = errors = skipped = 0
-        for ts in root.findall('testsuite'):
-            tests += int(ts.attrib.get('tests', 0))
-            failures += int(ts.attrib.get('failures', 0))
-            errors += int(ts.attrib.get('errors', 0))
-            skipped += int(ts.attrib.get('skipped', 0))
-    passed = tests - failures - errors - skipped
-    rate = 0.0 if tests == 0 else round(100.0 * passed / tests, 2)
+    outputs = parse_junit(p).outputs()
     out_path = os.environ.get('GITHUB_OUTPUT')
     if out_path:
         with open(out_path, 'a') as f:
-            f.write(f"tests={tests}\n")
-            f.write(f"passed={passed}\n")
-            f.write(f"failures={failures}\n")
-            f.write(f"errors={errors}\n")
-            f.write(f"skipped={skipped}\n")
-            f.write(f"passrate={rate}\n")
+            for key, value in outputs.items():
+                f.write(f"{key}={value}\n")
     else:
-        print(f"tests={tests}")
-        print(f"passed={passed}")
-        print(f"failures={failures}")
-        print(f"errors={errors}")
-        print(f"skipped={skipped}")
-        print(f"passrate={rate}")
+        for key, value in outputs.items():
+            print(f"{key}={value}")
     return 0
 
 
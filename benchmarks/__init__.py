@@ -0,0 +1 @@
+"""Benchmarks for the framework's own hot paths (run as `python -m benchmarks.<name>`)."""
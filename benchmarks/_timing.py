@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Callable, Dict, List
+
+
+def measure(fn: Callable[[], object], rounds: int, setup: Callable[[], object] | None = None) -> List[float]:
+    """Run fn `rounds` times and return wall-clock samples in milliseconds (setup is not timed)."""
+    samples: List[float] = []
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {"n": 0, "min": 0.0, "median": 0.0, "mean": 0.0, "max": 0.0}
+    return {
+        "n": len(samples),
+        "min": round(min(samples), 3),
+        "median": round(statistics.median(samples), 3),
+        "mean": round(statistics.fmean(samples), 3),
+        "max": round(max(samples), 3),
+    }
+
+
+def print_table(rows: Dict[str, Dict[str, float]], unit: str = "ms") -> None:
+    width = max([len(k) for k in rows] + [10])
+    print(f"{'name'.ljust(width)}  {'n':>4}  {'min':>10}  {'median':>10}  {'mean':>10}  {'max':>10}  ({unit})")
+    for name, s in rows.items():
+        print(
+            f"{name.ljust(width)}  {s['n']:>4}  {s['min']:>10.3f}  {s['median']:>10.3f}  {s['mean']:>10.3f}  {s['max']:>10.3f}"
+        )
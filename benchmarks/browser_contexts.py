@@ -0,0 +1,111 @@
+"""Per-test isolation cost: a new browser per test vs a BiDi user context in one shared browser.
+
+Throughput: N simulated tests (load the offline careers fixture, read the cards) run back to back
+in each mode. Memory: K isolated sessions held open at once, as K browsers vs K contexts in one
+browser; the figure reported is browser-tree RSS divided by K.
+
+Usage:
+    python -m benchmarks.browser_contexts --browser chrome --tests 20 --concurrent 4
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from src.utils.browser_contexts import SharedBrowser
+from src.utils.driver_factory import create_driver
+from src.utils.process_metrics import driver_browser_rss
+
+from ._timing import print_table, summarize
+from .fixtures import write_page
+
+_MIB = 1024 * 1024
+
+
+def _simulated_test(driver, page_uri: str) -> None:
+    driver.get(page_uri)
+    driver.execute_script("return document.querySelectorAll('.position-list-item').length")
+
+
+def bench_throughput(browser: str, tests: int, page_uri: str) -> dict:
+    per_process, per_context = [], []
+    for _ in range(tests):
+        start = time.perf_counter()
+        driver = create_driver(browser=browser, headless=True)
+        try:
+            _simulated_test(driver, page_uri)
+        finally:
+            driver.quit()
+        per_process.append((time.perf_counter() - start) * 1000.0)
+
+    shared = SharedBrowser(lambda: create_driver(browser=browser, headless=True, bidi=True))
+    try:
+        shared.driver.get("about:blank")  # startup is paid once per worker, outside the timed loop
+        for _ in range(tests):
+            start = time.perf_counter()
+            context = shared.open_context()
+            try:
+                _simulated_test(context.driver, page_uri)
+            finally:
+                context.close()
+            per_context.append((time.perf_counter() - start) * 1000.0)
+    finally:
+        shared.quit()
+    return {"process": per_process, "context": per_context}
+
+
+def bench_memory(browser: str, concurrent: int, page_uri: str) -> dict:
+    drivers = []
+    try:
+        for _ in range(concurrent):
+            driver = create_driver(browser=browser, headless=True)
+            drivers.append(driver)
+            _simulated_test(driver, page_uri)
+        processes = sum(driver_browser_rss(d) or 0 for d in drivers)
+    finally:
+        for d in drivers:
+            d.quit()
+
+    shared = SharedBrowser(lambda: create_driver(browser=browser, headless=True, bidi=True))
+    try:
+        contexts = [shared.open_context() for _ in range(concurrent)]
+        for context in contexts:
+            context.driver.switch_to.window(context.handle)
+            _simulated_test(context.driver, page_uri)
+        shared_rss = shared.rss() or 0
+    finally:
+        shared.quit()
+    return {"process": [processes / concurrent / _MIB], "context": [shared_rss / concurrent / _MIB]}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--tests", type=int, default=20)
+    parser.add_argument("--concurrent", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    page_uri = write_page(cards=100, noise=1000).as_uri()
+    try:
+        timings = bench_throughput(args.browser, args.tests, page_uri)
+        memory = bench_memory(args.browser, args.concurrent, page_uri)
+    except Exception as e:
+        print(f"{args.browser}: skipped ({str(e).splitlines()[0]})")
+        return 1
+    print_table({"browser per test": summarize(timings["process"]), "context per test": summarize(timings["context"])})
+    total = {mode: sum(values) / 1000.0 for mode, values in timings.items()}
+    print(f"\nthroughput: {args.tests / total['process']:.2f} tests/s per process, "
+          f"{args.tests / total['context']:.2f} tests/s per context")
+    print()
+    print_table(
+        {
+            f"{args.concurrent} browsers, rss/test": summarize(memory["process"]),
+            f"{args.concurrent} contexts, rss/test": summarize(memory["context"]),
+        },
+        unit="MiB",
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,62 @@
+"""Browser session startup time (cold vs warm) and RSS per session for each create_driver path.
+
+Cold = first session of the process (binary/driver resolution, empty OS caches for the profile);
+warm = every following session. RSS is the browser process tree after loading an offline fixture page.
+
+Usage:
+    python -m benchmarks.browser_startup --browsers chrome chrome-headless-shell firefox --rounds 5
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from src.utils.driver_factory import create_driver
+from src.utils.process_metrics import driver_browser_rss
+
+from ._timing import print_table, summarize
+from .fixtures import write_page
+
+
+def bench_browser(browser: str, rounds: int, page_uri: str) -> dict:
+    startup, rss = [], []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        driver = create_driver(browser=browser, headless=True)
+        driver.get("about:blank")
+        startup.append((time.perf_counter() - start) * 1000.0)
+        try:
+            driver.get(page_uri)
+            mem = driver_browser_rss(driver)
+            if mem is not None:
+                rss.append(mem / (1024 * 1024))
+        finally:
+            driver.quit()
+    return {"cold": startup[:1], "warm": startup[1:], "rss": rss}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--browsers", nargs="+", default=["chrome", "chrome-headless-shell", "firefox"])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    page_uri = write_page(cards=100, noise=1000).as_uri()
+    timings, memory = {}, {}
+    for browser in args.browsers:
+        try:
+            result = bench_browser(browser, max(2, args.rounds), page_uri)
+        except Exception as e:
+            print(f"{browser}: skipped ({str(e).splitlines()[0]})")
+            continue
+        timings[f"{browser} cold"] = summarize(result["cold"])
+        timings[f"{browser} warm"] = summarize(result["warm"])
+        memory[f"{browser} rss"] = summarize(result["rss"])
+    print_table(timings)
+    print()
+    print_table(memory, unit="MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,48 @@
+"""Time-to-verify for the Careers page blocks: legacy scroll walk + XPath waits vs the snapshot fast path.
+
+Usage:
+    python -m benchmarks.careers_blocks --browser chrome --headless --rounds 5
+"""
+from __future__ import annotations
+
+import argparse
+
+from src.pages.careers_page import CareersPage
+from src.utils.config import get_env_config
+from src.utils.driver_factory import create_driver
+
+from ._timing import measure, print_table, summarize
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--url", default=None, help="Careers page URL (defaults to EnvConfig.careers_url)")
+    args = parser.parse_args(argv)
+
+    url = args.url or get_env_config().careers_url
+    driver = create_driver(browser=args.browser, headless=args.headless)
+    try:
+        page = CareersPage(driver)
+
+        def reload():
+            # Page load itself is not part of the measurement
+            page.open(url)
+
+        # Warm-up load so cookie banners / caches do not skew the first sample
+        reload()
+        page.blocks_are_visible()
+        rows = {
+            "legacy blocks_are_visible": summarize(measure(page.blocks_are_visible, args.rounds, setup=reload)),
+            "fast snapshot_blocks": summarize(measure(page.snapshot_blocks, args.rounds, setup=reload)),
+        }
+    finally:
+        driver.quit()
+    print_table(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+"""Synthetic, offline HTML fixtures shaped like the Insider pages the page objects target."""
+from __future__ import annotations
+
+import html
+import tempfile
+from pathlib import Path
+
+DEPARTMENTS = ["Quality Assurance", "Software Development", "Sales", "Customer Success", "Product"]
+LOCATIONS = ["Istanbul, Turkiye", "London, United Kingdom", "New York, US", "Singapore", "Warsaw, Poland"]
+
+
+def _noise(count: int) -> str:
+    # Filler markup so locator strategies are measured against a realistically large DOM
+    return "\n".join(
+        f'<div class="row filler-{i}"><span class="col">Item {i}</span><a class="link" href="/x/{i}">More {i}</a></div>'
+        for i in range(count)
+    )
+
+
+def job_card(idx: int, department: str, location: str, href: str | None = None) -> str:
+    title = f"Senior Software {department} Engineer {idx}"
+    href = href or f"https://jobs.lever.co/useinsider/{idx:08d}-0000-0000-0000-000000000000"
+    return (
+        '<div class="position-list-item">'
+        f'<p class="position-title">{html.escape(title)}</p>'
+        f'<span class="position-department">{html.escape(department)}</span>'
+        f'<div class="position-location">{html.escape(location)}</div>'
+        f'<a class="btn btn-navy rounded" href="{html.escape(href)}" target="_blank">View Role</a>'
+        "</div>"
+    )
+
+
+def select2_filter(name: str, options: list[str]) -> str:
+    items = "".join(
+        f'<li class="select2-results__option" role="option">{html.escape(o)}</li>' for o in ["All"] + options
+    )
+    return (
+        f'<select id="filter-by-{name}" style="display:none"></select>'
+        '<span class="select2 select2-container"><span class="selection">'
+        f'<span class="select2-selection select2-selection--single" role="combobox" tabindex="0">'
+        f'<span class="select2-selection__rendered" id="select2-filter-by-{name}-container">All</span>'
+        "</span></span></span>"
+        f'<ul class="select2-results__options" id="select2-filter-by-{name}-results">{items}</ul>'
+    )
+
+
+def build_page(cards: int = 200, noise: int = 3000) -> str:
+    """Single page containing every structure the page objects look up."""
+    job_items = "\n".join(
+        job_card(i, DEPARTMENTS[i % len(DEPARTMENTS)], LOCATIONS[i % len(LOCATIONS)]) for i in range(cards)
+    )
+    return f"""<!doctype html>
+<html><head><meta charset="utf-8"><title>Insider Careers (fixture)</title></head>
+<body>
+<nav><a class="nav-link dropdown-toggle" href="#">Product</a><a class="nav-link dropdown-toggle" href="#">Company</a>
+<a class="dropdown-sub" href="/careers/">Careers</a></nav>
+{_noise(noise // 2)}
+<section id="career-our-location"><h3 class="category-title-media">Our Locations</h3></section>
+<section id="career-find-our-calling"><h3>Find your calling</h3></section>
+<section data-id="life"><h2>Life at Insider</h2></section>
+<a class="btn btn-outline-secondary" href="/careers/open-positions/?department=qualityassurance">See all QA jobs</a>
+<div id="filters">{select2_filter("department", DEPARTMENTS)}{select2_filter("location", LOCATIONS)}</div>
+<p id="resultCounter">{cards} results</p>
+<div class="position-list">
+{job_items}
+</div>
+{_noise(noise // 2)}
+</body></html>
+"""
+
+
+def write_page(cards: int = 200, noise: int = 3000, directory: str | Path | None = None) -> Path:
+    directory = Path(directory or tempfile.mkdtemp(prefix="bench-fixture-"))
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"careers-{cards}-{noise}.html"
+    path.write_text(build_page(cards, noise), encoding="utf-8")
+    return path
+
+
+def write_junit_report(tests: int = 5000, suites: int = 4, directory: str | Path | None = None) -> Path:
+    """pytest-style <testsuites> report with captured output on every case (failures every 50th)."""
+    directory = Path(directory or tempfile.mkdtemp(prefix="bench-junit-"))
+    directory.mkdir(parents=True, exist_ok=True)
+    per_suite = max(1, tests // suites)
+    parts = ['<?xml version="1.0" encoding="utf-8"?><testsuites>']
+    for s in range(suites):
+        failures = len(range(0, per_suite, 50))
+        parts.append(f'<testsuite name="pytest-{s}" errors="0" failures="{failures}" skipped="0" tests="{per_suite}">')
+        for i in range(per_suite):
+            parts.append(f'<testcase classname="tests.api.test_{s}" name="test_{i}" time="0.01">')
+            if i % 50 == 0:
+                parts.append(f'<failure message="AssertionError">{"Traceback line&#10;" * 40}</failure>')
+            parts.append(f"<system-out>{html.escape('log line ' * 60)}</system-out></testcase>")
+        parts.append("</testsuite>")
+    parts.append("</testsuites>")
+    path = directory / f"report-{tests}.xml"
+    path.write_text("".join(parts), encoding="utf-8")
+    return path
@@ -0,0 +1,79 @@
+"""Per-locator lookup latency: legacy XPath unions vs compiled Loc (CSS / JS text matcher) vs cached Loc.
+
+Runs offline against a large synthetic DOM (see benchmarks/fixtures.py).
+
+Usage:
+    python -m benchmarks.locators --browser chrome --headless --iterations 50 --cards 500
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+
+from selenium.webdriver.common.by import By
+
+from src.pages.base_page import BasePage
+from src.pages.careers_page import CareersPage
+from src.pages.home_page import HomePage
+from src.pages.qa_jobs_page import QAJobsPage
+from src.utils.driver_factory import create_driver
+
+from ._timing import measure, print_table, summarize
+from .fixtures import write_page
+
+# The XPath locators the page objects used before the Loc layer, kept as the comparison baseline
+LEGACY_XPATHS = {
+    "HomePage.COMPANY_MENU": "//a[contains(@class,'nav-link') and normalize-space()='Company']",
+    "HomePage.CAREERS_LINK": "//a[contains(@href,'/careers') and normalize-space()='Careers']",
+    "CareersPage.LOCATIONS_BLOCK": "//section[contains(@id,'career-our-location')] | //section[.//h2[contains(normalize-space(),'Locations')] or .//h3[contains(normalize-space(),'Locations')]]",
+    "CareersPage.TEAMS_BLOCK": "//section[contains(@id,'career-find-our-calling')] | //section[.//h2[contains(.,'Teams') or contains(.,'Find your calling')] or .//h3[contains(.,'Teams') or contains(.,'Find your calling')]]",
+    "CareersPage.LIFE_BLOCK": "//section[contains(@id,'career-life-at-insider')] | //section[.//h2[contains(.,'Life at Insider')] or .//h3[contains(.,'Life at Insider')]]",
+    "QAJobsPage.SEE_ALL_QA": "//a[contains(@href,'positions')][contains(translate(.,'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'see all qa jobs')] | //button[contains(translate(.,'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'see all qa jobs')]",
+    "QAJobsPage.FILTER_DEPT_ARROW": "//span[@id='select2-filter-by-department-container']/ancestor::span[contains(@class,'select2-selection')]",
+    "QAJobsPage.FILTER_LOC_ARROW": "//span[@id='select2-filter-by-location-container']/ancestor::span[contains(@class,'select2-selection')]",
+}
+
+CURRENT = {
+    "HomePage.COMPANY_MENU": HomePage.COMPANY_MENU,
+    "HomePage.CAREERS_LINK": HomePage.CAREERS_LINK,
+    "CareersPage.LOCATIONS_BLOCK": CareersPage.LOCATIONS_BLOCK,
+    "CareersPage.TEAMS_BLOCK": CareersPage.TEAMS_BLOCK,
+    "CareersPage.LIFE_BLOCK": CareersPage.LIFE_BLOCK,
+    "QAJobsPage.SEE_ALL_QA": QAJobsPage.SEE_ALL_QA,
+    "QAJobsPage.FILTER_DEPT_ARROW": QAJobsPage.FILTER_DEPT_ARROW,
+    "QAJobsPage.FILTER_LOC_ARROW": QAJobsPage.FILTER_LOC_ARROW,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--cards", type=int, default=500)
+    parser.add_argument("--noise", type=int, default=5000, help="Filler nodes added to the fixture DOM")
+    args = parser.parse_args(argv)
+
+    fixture = write_page(cards=args.cards, noise=args.noise)
+    driver = create_driver(browser=args.browser, headless=args.headless)
+    rows = {}
+    try:
+        page = BasePage(driver)
+        page.open(fixture.as_uri())
+        for name, loc in CURRENT.items():
+            xpath = LEGACY_XPATHS[name]
+            uncached = replace(loc, cache=False)
+            cached = replace(loc, cache=True)
+            page.find(cached)  # prime the per-page cache
+            rows[f"{name} [xpath]"] = summarize(measure(lambda: driver.find_element(By.XPATH, xpath), args.iterations))
+            rows[f"{name} [loc]"] = summarize(measure(lambda: page.find(uncached), args.iterations))
+            rows[f"{name} [loc+cache]"] = summarize(measure(lambda: page.find(cached), args.iterations))
+    finally:
+        driver.quit()
+    print(f"fixture: {fixture} ({args.cards} cards, {args.noise} filler nodes)")
+    print_table(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
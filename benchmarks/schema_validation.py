@@ -0,0 +1,101 @@
+"""Per-response validation cost on large `findByStatus`-style payloads.
+
+Compares, for the same list of Pets:
+- per-field: hand-written checks per pet and field, the way `assert_json_has_keys` style helpers grow
+- interpreted: walking the raw schema dicts on every call (what the explain pass does on failure)
+- compiled: the cached closure validator from `src.utils.response_schema` (fast boolean pass)
+
+Usage:
+    python -m benchmarks.schema_validation --pets 1000 10000 --rounds 20
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from src.utils.response_schema import SwaggerSpec
+
+from ._timing import measure, print_table, summarize
+
+STATUSES = ("available", "pending", "sold")
+
+
+def make_pets(n: int, seed: int = 7) -> list:
+    rnd = random.Random(seed)
+    return [
+        {
+            "id": 9_000_000 + i,
+            "category": {"id": rnd.randint(1, 9), "name": f"cat-{rnd.randint(1, 9)}"},
+            "name": f"pet-{i}",
+            "photoUrls": [f"https://example.test/{i}/{k}.png" for k in range(rnd.randint(0, 3))],
+            "tags": [{"id": k, "name": f"tag-{k}"} for k in range(rnd.randint(0, 3))],
+            "status": rnd.choice(STATUSES),
+        }
+        for i in range(n)
+    ]
+
+
+def per_field(pets: list) -> list:
+    """Hand-rolled Pet checks with an error message per field, as the assertion helpers do today."""
+    errors = []
+    for i, pet in enumerate(pets):
+        if not isinstance(pet, dict):
+            errors.append(f"[{i}] not an object")
+            continue
+        for key in ("name", "photoUrls"):
+            if key not in pet:
+                errors.append(f"[{i}] missing '{key}'")
+        if "id" in pet and not (isinstance(pet["id"], int) and not isinstance(pet["id"], bool)):
+            errors.append(f"[{i}].id not an integer")
+        if "name" in pet and not isinstance(pet["name"], str):
+            errors.append(f"[{i}].name not a string")
+        if "status" in pet and pet["status"] not in STATUSES:
+            errors.append(f"[{i}].status not in {STATUSES}")
+        for j, url in enumerate(pet.get("photoUrls", [])):
+            if not isinstance(url, str):
+                errors.append(f"[{i}].photoUrls[{j}] not a string")
+        category = pet.get("category")
+        if category is not None:
+            if not isinstance(category, dict):
+                errors.append(f"[{i}].category not an object")
+            else:
+                for key, kind in (("id", int), ("name", str)):
+                    if key in category and not isinstance(category[key], kind):
+                        errors.append(f"[{i}].category.{key} wrong type")
+        for j, tag in enumerate(pet.get("tags", [])):
+            if not isinstance(tag, dict):
+                errors.append(f"[{i}].tags[{j}] not an object")
+                continue
+            for key, kind in (("id", int), ("name", str)):
+                if key in tag and not isinstance(tag[key], kind):
+                    errors.append(f"[{i}].tags[{j}].{key} wrong type")
+    return errors
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pets", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    spec = SwaggerSpec.load()
+    start = time.perf_counter()
+    validator = spec.validator("GET", "/v2/pet/findByStatus", 200)
+    print(f"compile findByStatus 200 validator: {(time.perf_counter() - start) * 1000:.3f} ms (once per session)")
+
+    rows = {}
+    for n in args.pets:
+        pets = make_pets(n)
+        assert validator(pets) and not per_field(pets)
+        rows[f"per-field      {n} pets"] = summarize(measure(lambda: per_field(pets), args.rounds))
+        rows[f"interpreted    {n} pets"] = summarize(
+            measure(lambda: spec._explain(validator.schema, pets, "$", [], 20), args.rounds)
+        )
+        rows[f"compiled       {n} pets"] = summarize(measure(lambda: validator.errors(pets), args.rounds))
+    print_table(rows)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
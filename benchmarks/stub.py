@@ -0,0 +1,75 @@
+"""Local HTTP stub for the benchmark suite: the careers fixture page plus Petstore-shaped pet endpoints."""
+from __future__ import annotations
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .fixtures import build_page
+
+_PET = re.compile(r"^/v2/pet/(\d+)$")
+
+
+def _pet(pet_id: int) -> dict:
+    return {
+        "id": pet_id,
+        "category": {"id": 1, "name": "dogs"},
+        "name": f"pet-{pet_id}",
+        "photoUrls": [],
+        "tags": [{"id": 1, "name": "bench"}],
+        "status": "available",
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API behind its load balancer
+    disable_nagle_algorithm = True  # headers and body are separate writes; avoid delayed-ACK stalls
+    pages: dict = {}
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path in self.pages:
+            self._send(200, self.pages[path], "text/html; charset=utf-8")
+            return
+        match = _PET.match(path)
+        if match:
+            self._send(200, json.dumps(_pet(int(match.group(1)))).encode(), "application/json")
+            return
+        self._send(404, b'{"code":1,"type":"error","message":"Pet not found"}', "application/json")
+
+    def do_POST(self):
+        # Echo the posted pet, as the Petstore does on create/update
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self._send(200, body or b"{}", "application/json")
+
+    do_PUT = do_POST
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer:
+    """`with StubServer(cards=500) as base:` serves `/careers/open-positions/` and `/v2/pet/<id>`."""
+
+    def __init__(self, cards: int = 200, noise: int = 3000):
+        handler = type("BoundStubHandler", (StubHandler,), {"pages": {}})
+        handler.pages["/careers/open-positions/"] = build_page(cards, noise).encode("utf-8")
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self) -> str:
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.base_url
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
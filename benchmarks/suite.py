@@ -0,0 +1,282 @@
+"""Offline benchmark suite with a stored baseline and a regression gate.
+
+Everything runs against a local HTTP stub (benchmarks/stub.py) serving the synthetic careers page
+and Petstore-shaped pet endpoints, so results only depend on the code and the machine:
+
+- driver.startup            create_driver() + first navigation (quit not timed)
+- locator.*                 BasePage waits/lookups for page-object locators on a large DOM
+- select2.collect_options   QAJobsPage._collect_select2_options() on an open Select2 list
+- cards.snapshot            QAJobsPage.snapshot_job_cards() over every rendered card
+- api.sequential/concurrent ApiClient batches of GET /v2/pet/<id> (time per batch)
+- junit.parse               parse_junit() on a large pytest-style report.xml
+
+All metrics are wall-clock milliseconds, lower is better. Browser metrics are skipped when no
+browser can be started; `compare` then fails on them as missing unless `--allow-missing` is given.
+
+Usage:
+    python -m benchmarks.suite run --browser chrome --output bench-results.json
+    python -m benchmarks.suite run --browser chrome --save-baseline
+    python -m benchmarks.suite compare bench-results.json --threshold 15 --min-delta-ms 1
+    python -m benchmarks.suite compare bench-results.json --allow-missing   # API/parse metrics only
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.pages.qa_jobs_page import QAJobsPage
+from src.utils.api_client import ApiClient
+from src.utils.driver_factory import create_driver
+
+from ._timing import measure, print_table, summarize
+from .fixtures import write_junit_report
+from .stub import StubServer
+
+BASELINE = Path(__file__).with_name("baseline.json")
+PARSE_JUNIT = Path(__file__).resolve().parents[1] / ".github" / "scripts" / "parse_junit.py"
+CAREERS_PATH = "/careers/open-positions/"
+
+
+def _load_parse_junit():
+    spec = importlib.util.spec_from_file_location("parse_junit", PARSE_JUNIT)
+    module = importlib.util.module_from_spec(spec)
+    # Scripts are not a package; dataclasses need the module registered to resolve annotations
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module.parse_junit
+
+
+def bench_driver_startup(browser: str, rounds: int, page_url: str) -> List[float]:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        driver = create_driver(browser=browser, headless=True)
+        try:
+            driver.get(page_url)
+            samples.append((time.perf_counter() - start) * 1000.0)
+        finally:
+            driver.quit()
+    return samples
+
+
+def bench_page(browser: str, rounds: int, page_url: str) -> Dict[str, List[float]]:
+    driver = create_driver(browser=browser, headless=True)
+    try:
+        page = QAJobsPage(driver)
+        page.open(page_url)
+
+        def wait_arrow():
+            page.invalidate_cache()
+            page.wait_visible(QAJobsPage.FILTER_DEPT_ARROW)
+
+        return {
+            "locator.wait_visible[FILTER_DEPT_ARROW]": measure(wait_arrow, rounds),
+            "locator.wait_visible[FILTER_DEPT_ARROW, cached]": measure(
+                lambda: page.wait_visible(QAJobsPage.FILTER_DEPT_ARROW), rounds
+            ),
+            "locator.find[SEE_ALL_QA text match]": measure(lambda: page.find(QAJobsPage.SEE_ALL_QA), rounds),
+            "locator.wait_all_present[JOB_LIST]": measure(lambda: page.wait_all_present(QAJobsPage.JOB_LIST), rounds),
+            "select2.collect_options": measure(
+                lambda: page._collect_select2_options("select2-filter-by-department"), rounds
+            ),
+            "cards.snapshot": measure(lambda: page.snapshot_job_cards(wait=False), rounds),
+        }
+    finally:
+        driver.quit()
+
+
+def bench_api(base_url: str, rounds: int, batch: int, workers: int) -> Dict[str, List[float]]:
+    client = ApiClient(f"{base_url}/v2", pool_size=workers)
+    paths = [f"/pet/{i}" for i in range(1, batch + 1)]
+    # One Session per worker thread on the shared connection pool, as LinkChecker does
+    local = threading.local()
+    clones: List[ApiClient] = []
+    clones_lock = threading.Lock()
+
+    def thread_get(path: str):
+        worker = getattr(local, "client", None)
+        if worker is None:
+            worker = local.client = client.clone()
+            with clones_lock:
+                clones.append(worker)
+        return worker.get(path)
+
+    def sequential():
+        for path in paths:
+            client.get(path).json()
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+
+    def concurrent():
+        for resp in pool.map(thread_get, paths):
+            resp.json()
+
+    try:
+        # Open the keep-alive connections and per-thread clients outside the timed rounds
+        sequential()
+        concurrent()
+        return {
+            f"api.sequential[{batch} GET]": measure(sequential, rounds),
+            f"api.concurrent[{batch} GET x{workers}]": measure(concurrent, rounds),
+        }
+    finally:
+        pool.shutdown()
+        for c in clones + [client]:
+            c.session.close()
+
+
+def bench_junit(rounds: int, tests: int) -> Dict[str, List[float]]:
+    parse_junit = _load_parse_junit()
+    report = write_junit_report(tests=tests)
+    return {f"junit.parse[{tests} cases]": measure(lambda: parse_junit(str(report)), rounds)}
+
+
+def run(args) -> dict:
+    samples: Dict[str, List[float]] = {}
+    skipped: Dict[str, str] = {}
+    with StubServer(cards=args.cards, noise=args.noise) as base_url:
+        page_url = base_url + CAREERS_PATH
+        try:
+            samples["driver.startup"] = bench_driver_startup(args.browser, args.startup_rounds, page_url)
+            samples.update(bench_page(args.browser, args.rounds, page_url))
+        except Exception as e:
+            skipped["browser"] = str(e).splitlines()[0] if str(e) else type(e).__name__
+            print(f"{args.browser}: browser metrics skipped ({skipped['browser']})")
+        samples.update(bench_api(base_url, args.rounds, args.batch, args.workers))
+    samples.update(bench_junit(args.rounds, args.junit_tests))
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "browser": args.browser,
+            "cards": args.cards,
+            "skipped": skipped,
+        },
+        "metrics": {name: summarize(values) for name, values in samples.items()},
+    }
+
+
+@dataclass
+class Comparison:
+    metric: str
+    baseline: Optional[float]
+    current: Optional[float]
+    status: str  # ok | regressed | improved | new | missing
+
+    @property
+    def delta_pct(self) -> Optional[float]:
+        if not self.baseline or self.current is None:
+            return None
+        return round(100.0 * (self.current - self.baseline) / self.baseline, 1)
+
+
+def compare(
+    baseline: dict, current: dict, threshold_pct: float, min_delta_ms: float = 0.0, stat: str = "median"
+) -> List[Comparison]:
+    """Metric-by-metric verdicts; a regression must exceed both the % threshold and the noise floor."""
+    base_metrics, cur_metrics = baseline.get("metrics", {}), current.get("metrics", {})
+    rows = []
+    for name in list(base_metrics) + [n for n in cur_metrics if n not in base_metrics]:
+        before = base_metrics.get(name, {}).get(stat)
+        after = cur_metrics.get(name, {}).get(stat)
+        if after is None:
+            rows.append(Comparison(name, before, None, "missing"))
+            continue
+        if before is None:
+            rows.append(Comparison(name, None, after, "new"))
+            continue
+        row = Comparison(name, before, after, "ok")
+        if abs(after - before) >= min_delta_ms and row.delta_pct is not None:
+            if row.delta_pct > threshold_pct:
+                row.status = "regressed"
+            elif row.delta_pct < -threshold_pct:
+                row.status = "improved"
+        rows.append(row)
+    return rows
+
+
+def _print_comparison(rows: List[Comparison], stat: str, threshold_pct: float) -> None:
+    width = max([len(r.metric) for r in rows] + [10])
+    print(f"{'metric'.ljust(width)}  {'baseline':>10}  {'current':>10}  {'delta':>8}  status  ({stat} ms, threshold {threshold_pct:g}%)")
+    for r in rows:
+        before = "-" if r.baseline is None else f"{r.baseline:.3f}"
+        after = "-" if r.current is None else f"{r.current:.3f}"
+        delta = "-" if r.delta_pct is None else f"{r.delta_pct:+.1f}%"
+        print(f"{r.metric.ljust(width)}  {before:>10}  {after:>10}  {delta:>8}  {r.status}")
+
+
+def _read(path: Path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="Run every benchmark and write the results JSON")
+    run_p.add_argument("--browser", default="chrome")
+    run_p.add_argument("--rounds", type=int, default=20)
+    run_p.add_argument("--startup-rounds", type=int, default=3)
+    run_p.add_argument("--cards", type=int, default=500)
+    run_p.add_argument("--noise", type=int, default=5000, help="Filler nodes added to the fixture DOM")
+    run_p.add_argument("--batch", type=int, default=50, help="Requests per ApiClient batch")
+    run_p.add_argument("--workers", type=int, default=8, help="Threads for the concurrent ApiClient batch")
+    run_p.add_argument("--junit-tests", type=int, default=5000)
+    run_p.add_argument("--output", type=Path, default=Path("bench-results.json"))
+    run_p.add_argument("--save-baseline", action="store_true", help=f"Also store the results as {BASELINE.name}")
+    run_p.add_argument("--baseline", type=Path, default=BASELINE)
+
+    cmp_p = sub.add_parser(
+        "compare", help="Compare a results JSON with the baseline; exit 1 on regressions or missing metrics"
+    )
+    cmp_p.add_argument("current", type=Path)
+    cmp_p.add_argument("--baseline", type=Path, default=BASELINE)
+    cmp_p.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent")
+    cmp_p.add_argument("--min-delta-ms", type=float, default=0.5, help="Ignore differences smaller than this")
+    cmp_p.add_argument("--stat", choices=["min", "median", "mean", "max"], default="median")
+    cmp_p.add_argument(
+        "--allow-missing", action="store_true", help="Do not fail on baseline metrics absent from the results"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(args)
+        print_table(results["metrics"])
+        text = json.dumps(results, indent=2)
+        args.output.write_text(text, encoding="utf-8")
+        print(f"results: {args.output}")
+        if args.save_baseline:
+            args.baseline.write_text(text, encoding="utf-8")
+            print(f"baseline: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; create one with `python -m benchmarks.suite run --save-baseline`")
+        return 2
+    rows = compare(_read(args.baseline), _read(args.current), args.threshold, args.min_delta_ms, args.stat)
+    _print_comparison(rows, args.stat, args.threshold)
+    regressed = [r.metric for r in rows if r.status == "regressed"]
+    missing = [r.metric for r in rows if r.status == "missing"]
+    failed = False
+    if regressed:
+        print(f"{len(regressed)} metric(s) regressed by more than {args.threshold:g}%: {', '.join(regressed)}")
+        failed = True
+    if missing:
+        print(f"{len(missing)} baseline metric(s) missing from the results: {', '.join(missing)}")
+        failed = failed or not args.allow_missing
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
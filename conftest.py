@@ -1,23 +1,56 @@
 from __future__ import annotations
 
+import math
 import os
 import uuid
+import warnings
+from dataclasses import replace
 import pytest
-import allure
 """Pytest configuration and shared fixtures."""
 from dotenv import load_dotenv
 
-from src.utils.driver_factory import create_driver
+# Only API-side helpers are imported eagerly. The UI stack (Selenium, webdriver-manager, browser
+# downloader, page-state helpers) is imported inside the browser fixtures, so API-only runs and
+# xdist workers that never request `driver` do not pay for it.
 from src.utils.config import get_env_config
 from src.utils.api_client import ApiClient
 from src.utils.auth import get_auth_token
+from src.utils.petstore_pool import PetPool
+from src.utils.artifacts import ArtifactCollector
+
+pytest_plugins = ["src.plugins.startup_profile", "src.plugins.test_impact", "src.plugins.resources"]
+
+_PET_POOL_STATS = pytest.StashKey[list]()
+_CONTEXTS_UNSUPPORTED = pytest.StashKey[bool]()
 
 
 def pytest_addoption(parser):
-    parser.addoption("--browser", action="store", default=os.environ.get("BROWSER", "chrome"), help="Browser: chrome or firefox")
+    parser.addoption("--browser", action="store", default=os.environ.get("BROWSER", "chrome"), help="Browser: chrome, chrome-headless-shell or firefox")
     parser.addoption("--env", action="store", default=os.environ.get("TEST_ENV", "qa"), help="Environment: dev/qa/uat")
     parser.addoption("--tags", action="store", default=os.environ.get("TAGS", ""), help="Markers to run (e.g., smoke)")
     parser.addoption("--headless", action="store_true", help="Run browsers in headless mode")
+    parser.addoption(
+        "--replay",
+        action="store",
+        default=os.environ.get("REPLAY_ARCHIVE", ""),
+        help="Serve the UI suite hermetically from a capture archive (see src/replay)",
+    )
+    parser.addoption("--replay-latency-ms", action="store", type=float, default=0.0, help="Latency injected per replayed response")
+    parser.addoption(
+        "--capture-network",
+        action="store_true",
+        help="Chromium: record the DevTools performance log so failure artifacts include full network events",
+    )
+    parser.addoption(
+        "--no-consent-seed",
+        action="store_true",
+        help="Do not inject stored cookie-consent state into new browsers (exercise the banner)",
+    )
+    parser.addoption(
+        "--browser-contexts",
+        action="store_true",
+        help="Share one browser per worker and give each test an isolated BiDi user context instead of a new browser",
+    )
 
 
 def pytest_configure(config):
@@ -33,8 +66,15 @@ def pytest_configure(config):
 @pytest.fixture(scope="session")
 def env(request):
     env_name = request.config.getoption("--env")
-    cfg = get_env_config(env_name)
-    return cfg
+    archive = request.config.getoption("--replay")
+    if not archive:
+        yield get_env_config(env_name)
+        return
+    from src.replay.server import ReplayServer
+
+    with ReplayServer(archive, latency_ms=request.config.getoption("--replay-latency-ms")) as server:
+        config = get_env_config(env_name, base_url=server.url)
+        yield replace(config, positions_feed_url=server.local_url(config.positions_feed_url))
 
 
 @pytest.fixture(scope="session")
@@ -46,6 +86,26 @@ def api_client(env):
     return client
 
 
+@pytest.fixture(scope="session")
+def pet_pool(request, api_client):
+    """Pets pre-created concurrently for this worker's share of the tests using the `pet` fixture."""
+    users = sum(1 for item in request.session.items if "pet" in getattr(item, "fixturenames", ()))
+    workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    pool = PetPool(api_client)
+    pool.provision(math.ceil(users / workers))
+    yield pool
+    pool.close()
+    request.config.stash.setdefault(_PET_POOL_STATS, []).append(pool.summary())
+
+
+@pytest.fixture()
+def pet(pet_pool):
+    """An existing, verified pet owned exclusively by this test; deleted in the background afterwards."""
+    payload = pet_pool.acquire()
+    yield payload
+    pet_pool.release(payload["id"])
+
+
 @pytest.fixture(scope="session", autouse=True)
 def auth_token():
     """Fetch auth token once before all tests to support API-UI collaboration."""
@@ -55,25 +115,132 @@ def auth_token():
     return token
 
 
+@pytest.fixture(scope="session")
+def auth_state(env):
+    """Browser auth state per env, bootstrapped from the API token and cached under .state/."""
+    from src.utils.session_state import AuthStateCache
+
+    return AuthStateCache(env.name)
+
+
+@pytest.fixture(scope="session")
+def link_checker():
+    """Concurrent HTTP link checker sharing one connection pool per worker."""
+    from src.utils.link_checker import LinkChecker
+
+    checker = LinkChecker()
+    yield checker
+    checker.close()
+
+
+@pytest.fixture(scope="session")
+def artifact_collector():
+    return ArtifactCollector()
+
+
+def _start_browser(config, bidi: bool = False):
+    from src.utils.driver_factory import create_driver
+
+    return create_driver(
+        browser=config.getoption("--browser"),
+        headless=config.getoption("--headless"),
+        performance_log=config.getoption("--capture-network"),
+        bidi=bidi,
+    )
+
+
+@pytest.fixture(scope="session")
+def shared_browser(request):
+    """Per-worker browser for --browser-contexts; None when every test gets its own browser."""
+    if not request.config.getoption("--browser-contexts"):
+        yield None
+        return
+    from src.utils.browser_contexts import SharedBrowser
+
+    recycle_mb = request.config.getoption("--browser-recycle-mb")
+    shared = SharedBrowser(
+        lambda: _start_browser(request.config, bidi=True), recycle_rss=recycle_mb * 1024 * 1024 if recycle_mb else None
+    )
+    yield shared
+    shared.quit()
+
+
+def _open_isolated_context(request, shared_browser):
+    if shared_browser is None or request.config.stash.get(_CONTEXTS_UNSUPPORTED, False):
+        return None
+    try:
+        return shared_browser.open_context()
+    except Exception as e:
+        # Browser/driver without BiDi user contexts: fall back to a browser per test for the session
+        request.config.stash[_CONTEXTS_UNSUPPORTED] = True
+        shared_browser.quit()
+        warnings.warn(f"--browser-contexts unavailable, starting a browser per test: {str(e).splitlines()[0]}")
+        return None
+
+
 @pytest.fixture()
-def driver(request, env):
-    browser = request.config.getoption("--browser")
-    headless = request.config.getoption("--headless")
-    driver = create_driver(browser=browser, headless=headless)
+def driver(request, env, auth_token, auth_state, artifact_collector, shared_browser):
+    from src.utils.consent import get_consent_store
+    from src.utils.tracing import get_tracer
+
+    tracer = get_tracer()
+    tracer.clear()
+    context = _open_isolated_context(request, shared_browser)
+    driver = context.driver if context is not None else _start_browser(request.config)
+    if not request.config.getoption("--no-consent-seed"):
+        get_consent_store().seed(driver, env.base_url)
+    # Only for tests that ask for it (or an explicitly configured cookie): never leak the API token
+    if auth_token and (request.node.get_closest_marker("authenticated") or auth_state.opted_in):
+        auth_state.apply(driver, env.base_url)
     yield driver
-    # Teardown: take screenshot on failure
+    # Teardown: on failure grab diagnostics while the browser is alive, encode/attach them in the
+    # background while the browser quits
+    job = None
     rep_call = getattr(request.node, "rep_call", None)
-    if rep_call is not None and getattr(rep_call, "failed", False):
-        try:
-            png = driver.get_screenshot_as_png()
-            allure.attach(png, name=f"screenshot-{uuid.uuid4().hex}", attachment_type=allure.attachment_type.PNG)
-        except Exception:
-            pass
-    driver.quit()
+    if rep_call is not None and rep_call.failed:
+        job = artifact_collector.collect(driver, uuid.uuid4().hex[:8], tracer=tracer)
+    if context is not None:
+        context.close()
+    else:
+        driver.quit()
+    if job is not None:
+        job.join(timeout=30)
 
 
+@pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    # Attach test result to the item for fixture teardown to know outcome
+    # Attach test report to the item for fixture teardown to know outcome (incl. pytest-check failures)
+    outcome = yield
+    rep = outcome.get_result()
     if "driver" in item.fixturenames:
-        setattr(item, "rep_" + call.when, call)
-    return None
+        setattr(item, "rep_" + rep.when, rep)
+
+
+def pytest_sessionfinish(session):
+    # xdist worker: hand pet pool stats to the controller
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["pet_pool"] = session.config.stash.get(_PET_POOL_STATS, [])
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    stats = getattr(node, "workeroutput", {}).get("pet_pool") or []
+    node.config.stash.setdefault(_PET_POOL_STATS, []).extend(stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    stats = config.stash.get(_PET_POOL_STATS, [])
+    if not stats:
+        return
+
+    def total(key):
+        return sum(s[key] for s in stats)
+
+    terminalreporter.write_sep("-", "petstore pet pool")
+    terminalreporter.write_line(
+        f"seeded={total('seeded')} create_failures={total('create_failures')} on_demand={total('on_demand')} "
+        f"provision={total('provision_seconds'):.2f}s (serial equivalent {total('sequential_seconds'):.2f}s, "
+        f"setup saved {total('saved_seconds'):.2f}s) "
+        f"deleted={total('deleted')} delete_failures={total('delete_failures')}"
+    )
@@ -1,61 +1,192 @@
 from __future__ import annotations
 
-from typing import Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
 
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+from src.utils.tracing import get_tracer
 
 
 Locator = Tuple[str, str]
 
 
+@dataclass(frozen=True)
+class Loc:
+    """Richer locator definition, precompiled into the fastest form the browser supports.
+
+    - `css` alone resolves natively as (By.CSS_SELECTOR, css).
+    - `text` filters the CSS matches by normalized text (like `contains(normalize-space(), ...)`);
+      `within` tests the text of a descendant instead of the element itself. Text matching runs as
+      one cached JS matcher call instead of an XPath union with translate().
+    - `fallback` is tried (in the same roundtrip) when the primary definition matches nothing.
+    - `cache=True` keeps the resolved element per page load; stale references are re-resolved.
+    """
+
+    css: str
+    text: Union[str, Tuple[str, ...], None] = None
+    exact: bool = False
+    ignore_case: bool = False
+    within: Optional[str] = None
+    fallback: Optional["Loc"] = None
+    cache: bool = False
+
+    @property
+    def native(self) -> Optional[Locator]:
+        """Selenium locator tuple when no JS matcher is needed, else None."""
+        if self.text is None and self.within is None and self.fallback is None:
+            return (By.CSS_SELECTOR, self.css)
+        return None
+
+    def specs(self) -> List[dict]:
+        """Matcher specs for the primary definition followed by its fallbacks."""
+        out = []
+        loc: Optional[Loc] = self
+        while loc is not None:
+            texts = (loc.text,) if isinstance(loc.text, str) else tuple(loc.text or ())
+            out.append({
+                "css": loc.css,
+                "texts": [t.lower() for t in texts] if loc.ignore_case else list(texts),
+                "exact": loc.exact,
+                "ci": loc.ignore_case,
+                "within": loc.within,
+            })
+            loc = loc.fallback
+        return out
+
+
+AnyLocator = Union[Locator, Loc]
+
+
+# Shared matcher for text-based Loc lookups. The whole source is sent with every such find() call;
+# what saves time is one roundtrip per lookup (fallbacks included) instead of an XPath union.
+_TEXT_MATCHER_SCRIPT = """
+const specs = arguments[0], root = arguments[1] || document, all = arguments[2];
+const norm = (s, ci) => { s = (s || '').replace(/\\s+/g, ' ').trim(); return ci ? s.toLowerCase() : s; };
+const matches = (el, spec) => {
+  if (!spec.texts.length) return true;
+  const targets = spec.within ? Array.from(el.querySelectorAll(spec.within)) : [el];
+  return targets.some((t) => {
+    const text = norm(t.textContent, spec.ci);
+    return spec.texts.some((x) => spec.exact ? text === x : text.includes(x));
+  });
+};
+for (const spec of specs) {
+  const found = Array.from(root.querySelectorAll(spec.css)).filter((el) => matches(el, spec));
+  if (found.length) return all ? found : found[0];
+}
+return all ? [] : null;
+"""
+
+
 class BasePage:
     def __init__(self, driver: WebDriver, timeout: int = 20):
         self.driver = driver
         self.timeout = timeout
+        self.trace = get_tracer()
+        self._element_cache: Dict[Loc, WebElement] = {}
+
+    # Locator resolution
+    def find(self, locator: AnyLocator, root: Optional[WebElement] = None) -> WebElement:
+        """Resolve a single element immediately (no waiting); raises NoSuchElementException."""
+        if not isinstance(locator, Loc):
+            return (root or self.driver).find_element(*locator)
+        if locator.cache and root is None:
+            cached = self._element_cache.get(locator)
+            if cached is not None and not self._is_stale(cached):
+                return cached
+        native = locator.native
+        if native is not None:
+            el = (root or self.driver).find_element(*native)
+        else:
+            el = self.driver.execute_script(_TEXT_MATCHER_SCRIPT, locator.specs(), root, False)
+            if el is None:
+                raise NoSuchElementException(f"No element matches {locator}")
+        if locator.cache and root is None:
+            self._element_cache[locator] = el
+        return el
+
+    def find_all(self, locator: AnyLocator, root: Optional[WebElement] = None) -> List[WebElement]:
+        if not isinstance(locator, Loc):
+            return (root or self.driver).find_elements(*locator)
+        native = locator.native
+        if native is not None:
+            return (root or self.driver).find_elements(*native)
+        return self.driver.execute_script(_TEXT_MATCHER_SCRIPT, locator.specs(), root, True) or []
+
+    def invalidate_cache(self) -> None:
+        self._element_cache.clear()
+
+    @staticmethod
+    def _is_stale(el: WebElement) -> bool:
+        try:
+            el.is_enabled()
+            return False
+        except StaleElementReferenceException:
+            return True
+
+    def _condition(self, locator: AnyLocator, state: str):
+        """Expected condition for a Loc, mirroring the EC.*_located semantics."""
+
+        def check(_driver):
+            try:
+                el = self.find(locator)
+                if state == "present":
+                    return el
+                if not el.is_displayed():
+                    return False
+                if state == "clickable" and not el.is_enabled():
+                    return False
+                return el
+            except StaleElementReferenceException:
+                self._element_cache.pop(locator, None)
+                return False
+
+        return check
 
     # Wait helpers
-    def wait_visible(self, locator: Locator):
-        return WebDriverWait(self.driver, self.timeout).until(
-            EC.visibility_of_element_located(locator)
-        )
-
-    def wait_clickable(self, locator: Locator):
-        return WebDriverWait(self.driver, self.timeout).until(
-            EC.element_to_be_clickable(locator)
-        )
-
-    def wait_present(self, locator: Locator):
-        return WebDriverWait(self.driver, self.timeout).until(
-            EC.presence_of_element_located(locator)
-        )
-
-    def wait_all_present(self, locator: Locator):
-        return WebDriverWait(self.driver, self.timeout).until(
-            EC.presence_of_all_elements_located(locator)
-        )
+    def wait_visible(self, locator: AnyLocator):
+        cond = self._condition(locator, "visible") if isinstance(locator, Loc) else EC.visibility_of_element_located(locator)
+        return WebDriverWait(self.driver, self.timeout).until(cond)
+
+    def wait_clickable(self, locator: AnyLocator):
+        cond = self._condition(locator, "clickable") if isinstance(locator, Loc) else EC.element_to_be_clickable(locator)
+        return WebDriverWait(self.driver, self.timeout).until(cond)
+
+    def wait_present(self, locator: AnyLocator):
+        cond = self._condition(locator, "present") if isinstance(locator, Loc) else EC.presence_of_element_located(locator)
+        return WebDriverWait(self.driver, self.timeout).until(cond)
+
+    def wait_all_present(self, locator: AnyLocator):
+        if not isinstance(locator, Loc):
+            return WebDriverWait(self.driver, self.timeout).until(EC.presence_of_all_elements_located(locator))
+        return WebDriverWait(self.driver, self.timeout).until(lambda d: self.find_all(locator) or False)
 
     # Actions
-    def click(self, locator: Locator):
+    def click(self, locator: AnyLocator):
         el = self.wait_clickable(locator)
         el.click()
 
-    def hover(self, locator: Locator):
+    def hover(self, locator: AnyLocator):
         el = self.wait_visible(locator)
         ActionChains(self.driver).move_to_element(el).perform()
 
-    def send_keys(self, locator: Locator, text: str, clear: bool = True):
+    def send_keys(self, locator: AnyLocator, text: str, clear: bool = True):
         el = self.wait_visible(locator)
         if clear:
             el.clear()
         el.send_keys(text)
 
-    def scroll_into_view(self, locator: Locator):
+    def scroll_into_view(self, locator: AnyLocator):
         el = self.wait_present(locator)
         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
 
     def open(self, url: str):
+        self.invalidate_cache()
         self.driver.get(url)
@@ -1,27 +1,121 @@
 from __future__ import annotations
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from dataclasses import dataclass, field
+from typing import Dict
 
-from .base_page import BasePage
+from selenium.common.exceptions import TimeoutException
+
+from src.utils.consent import get_consent_store
+
+from .base_page import BasePage, Loc
+
+
+@dataclass(frozen=True)
+class SectionSnapshot:
+    key: str
+    found: bool
+    id: str = ""
+    heading: str = ""
+    visible: bool = False
+    in_viewport: bool = False
+    rect: Dict[str, float] = field(default_factory=dict)
 
 
 class CareersPage(BasePage):
     # Primary IDs + fallback to headings text
-    LOCATIONS_BLOCK = (
-        By.XPATH,
-        "//section[contains(@id,'career-our-location')] | //section[.//h2[contains(normalize-space(),'Locations')] or .//h3[contains(normalize-space(),'Locations')]]",
+    LOCATIONS_BLOCK = Loc(
+        "section[id*='career-our-location']",
+        fallback=Loc("section", text="Locations", within="h2, h3"),
     )
-    TEAMS_BLOCK = (
-        By.XPATH,
-        "//section[contains(@id,'career-find-our-calling')] | //section[.//h2[contains(.,'Teams') or contains(.,'Find your calling')] or .//h3[contains(.,'Teams') or contains(.,'Find your calling')]]",
+    TEAMS_BLOCK = Loc(
+        "section[id*='career-find-our-calling']",
+        fallback=Loc("section", text=("Teams", "Find your calling"), within="h2, h3"),
     )
-    LIFE_BLOCK = (
-        By.XPATH,
-        "//section[contains(@id,'career-life-at-insider')] | //section[.//h2[contains(.,'Life at Insider')] or .//h3[contains(.,'Life at Insider')]]",
+    LIFE_BLOCK = Loc(
+        "section[id*='career-life-at-insider']",
+        fallback=Loc("section", text="Life at Insider", within="h2, h3"),
     )
 
+    # Same sections as the block locators above, expressed for the in-page snapshot script
+    SECTION_SPECS = {
+        "locations": {"id": "career-our-location", "headings": ["Locations"]},
+        "teams": {"id": "career-find-our-calling", "headings": ["Teams", "Find your calling"]},
+        "life": {"id": "career-life-at-insider", "headings": ["Life at Insider"]},
+    }
+
+    # One async roundtrip: incremental scroll to trigger lazy loading, wait (MutationObserver) until
+    # every section exists, then let an IntersectionObserver report each one and return a snapshot.
+    _SNAPSHOT_SCRIPT = """
+const specs = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+const norm = (s) => (s || '').replace(/\\s+/g, ' ').trim();
+const nextFrame = () => new Promise((r) => requestAnimationFrame(() => setTimeout(r, 0)));
+const findSection = (spec) => {
+  const sections = Array.from(document.querySelectorAll('section'));
+  const byId = sections.find((s) => s.id && s.id.includes(spec.id));
+  if (byId) return byId;
+  return sections.find((s) => Array.from(s.querySelectorAll('h2, h3')).some(
+    (h) => spec.headings.some((t) => norm(h.textContent).includes(t)))) || null;
+};
+const findAll = () => specs.map(findSection);
+const isRendered = (el) => {
+  const st = getComputedStyle(el);
+  const r = el.getBoundingClientRect();
+  return st.display !== 'none' && st.visibility !== 'hidden' && parseFloat(st.opacity || '1') > 0
+    && r.width > 0 && r.height > 0;
+};
+const scrollThrough = async () => {
+  const step = Math.max(200, Math.floor(window.innerHeight * 0.8));
+  for (let y = 0, i = 0; y < document.documentElement.scrollHeight && i < 60; y += step, i++) {
+    window.scrollTo(0, y);
+    await nextFrame();
+  }
+};
+const waitAll = () => new Promise((resolve) => {
+  let found = findAll();
+  if (found.every(Boolean)) return resolve(found);
+  let pending = false;
+  const finish = () => { mo.disconnect(); clearTimeout(timer); resolve(found); };
+  const mo = new MutationObserver(() => {
+    if (pending) return;
+    pending = true;
+    requestAnimationFrame(() => {
+      pending = false;
+      found = findAll();
+      if (found.every(Boolean)) finish();
+    });
+  });
+  mo.observe(document.documentElement, {childList: true, subtree: true});
+  const timer = setTimeout(() => { found = findAll(); finish(); }, timeoutMs);
+});
+const intersections = (els) => new Promise((resolve) => {
+  const present = els.filter(Boolean);
+  const seen = new Map();
+  if (!present.length) return resolve(seen);
+  const io = new IntersectionObserver((entries) => {
+    entries.forEach((e) => seen.set(e.target, e));
+    if (seen.size >= present.length) { io.disconnect(); resolve(seen); }
+  });
+  present.forEach((el) => io.observe(el));
+});
+(async () => {
+  await scrollThrough();
+  const els = await waitAll();
+  const seen = await intersections(els);
+  return els.map((el, i) => {
+    if (!el) return {key: specs[i].key, found: false};
+    const r = el.getBoundingClientRect();
+    const h = el.querySelector('h1, h2, h3');
+    const entry = seen.get(el);
+    return {
+      key: specs[i].key, found: true, id: el.id || '', heading: h ? norm(h.textContent) : '',
+      visible: isRendered(el), in_viewport: !!(entry && entry.isIntersecting),
+      rect: {x: r.left + window.scrollX, y: r.top + window.scrollY, width: r.width, height: r.height},
+    };
+  });
+})().then(done, (e) => done({error: String(e)}));
+"""
 
     def blocks_are_visible(self) -> bool:
         # Some content loads as you scroll; also cookie banners can block clicks
@@ -38,20 +132,27 @@ class CareersPage(BasePage):
         self.wait_visible(self.LIFE_BLOCK)
         return True
 
+    def snapshot_blocks(self) -> Dict[str, SectionSnapshot]:
+        """Fast-path verifier: scroll, wait and describe every required section in a single roundtrip.
+        Sections that never appear within the timeout are returned with found=False.
+        """
+        self._dismiss_cookies_if_any()
+        specs = [dict(spec, key=key) for key, spec in self.SECTION_SPECS.items()]
+        # The script waits up to self.timeout in-page; restore the driver-wide limit afterwards
+        previous = self.driver.timeouts.script
+        self.driver.set_script_timeout(self.timeout + 10)
+        try:
+            result = self.driver.execute_async_script(self._SNAPSHOT_SCRIPT, specs, self.timeout * 1000)
+        finally:
+            self.driver.set_script_timeout(previous)
+        if isinstance(result, dict) and "error" in result:
+            raise TimeoutException(f"[careers] section snapshot failed: {result['error']}")
+        return {item["key"]: SectionSnapshot(**item) for item in result}
+
     def go_to_qa_jobs_direct(self, base_url: str):
         qa_url = base_url.rstrip("/") + "/careers/quality-assurance/"
         self.open(qa_url)
         self._dismiss_cookies_if_any()
 
     def _dismiss_cookies_if_any(self):
-        candidates = [
-            (By.ID, "onetrust-accept-btn-handler"),
-            (By.XPATH, "//button[contains(@id,'onetrust-accept') or normalize-space()='Accept All']"),
-            (By.XPATH, "//a[contains(@class,'icon-close')]")
-        ]
-        for loc in candidates:
-            try:
-                WebDriverWait(self.driver, 3).until(EC.element_to_be_clickable(loc)).click()
-                break
-            except Exception:
-                continue
+        get_consent_store().handle_banner(self.driver, timeout=3)
@@ -1,20 +1,17 @@
 from __future__ import annotations
 
-from selenium.webdriver.common.by import By
+from src.utils.consent import get_consent_store
 
-from .base_page import BasePage, Locator
+from .base_page import BasePage, Loc
 
 
 class HomePage(BasePage):
-    COMPANY_MENU = (By.XPATH, "//a[contains(@class,'nav-link') and normalize-space()='Company']")
-    CAREERS_LINK = (By.XPATH, "//a[contains(@href,'/careers') and normalize-space()='Careers']")
-    COOKIE_ACCEPT = (By.XPATH, "//a[contains(@class,'icon-close') or .='Accept All' or contains(@id,'onetrust-accept')]" )
+    COMPANY_MENU = Loc("a[class*='nav-link']", text="Company", exact=True, cache=True)
+    CAREERS_LINK = Loc("a[href*='/careers']", text="Careers", exact=True)
 
-    def accept_cookies_if_present(self):
-        try:
-            self.click(self.COOKIE_ACCEPT)
-        except Exception:
-            pass
+    def accept_cookies_if_present(self) -> bool:
+        # Zero-wait when the browser was seeded with stored consent; bounded poll otherwise
+        return get_consent_store().handle_banner(self.driver, timeout=self.timeout)
 
     def open_careers(self):
         self.hover(self.COMPANY_MENU)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Sequence
 import time
 
 from selenium.webdriver.common.by import By
@@ -9,24 +10,41 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException
 
-from .base_page import BasePage
+from .base_page import BasePage, Loc
+
+
+@dataclass(frozen=True)
+class JobCard:
+    title: str
+    department: str
+    location: str
+    href: str
 
 
 class QAJobsPage(BasePage):
-    SEE_ALL_QA = (
-        By.XPATH,
-        "//a[contains(@href,'positions')][contains(translate(.,'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'see all qa jobs')] | //button[contains(translate(.,'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'see all qa jobs')]",
-    )
+    SEE_ALL_QA = Loc("a[href*='positions'], button", text="see all qa jobs", ignore_case=True)
     FILTER_DEPT_DROPDOWN = (By.ID, "select2-filter-by-department-container")
-    FILTER_DEPT_ARROW = (By.XPATH, "//span[@id='select2-filter-by-department-container']/ancestor::span[contains(@class,'select2-selection')]")
+    FILTER_DEPT_ARROW = Loc("span[class*='select2-selection']:has(#select2-filter-by-department-container)", cache=True)
     FILTER_LOC_DROPDOWN = (By.ID, "select2-filter-by-location-container")
-    FILTER_LOC_ARROW = (By.XPATH, "//span[@id='select2-filter-by-location-container']/ancestor::span[contains(@class,'select2-selection')]")
-    SELECT2_INPUT = (By.XPATH, "//input[@class='select2-search__field']")
+    FILTER_LOC_ARROW = Loc("span[class*='select2-selection']:has(#select2-filter-by-location-container)", cache=True)
+    SELECT2_INPUT = (By.CSS_SELECTOR, "input[class='select2-search__field']")
     JOB_LIST = (By.CSS_SELECTOR, "div.position-list div.position-list-item")
     JOB_POS = (By.CSS_SELECTOR, ".position-title")
     JOB_DEPT = (By.CSS_SELECTOR, ".position-department")
     JOB_LOC = (By.CSS_SELECTOR, ".position-location")
-    VIEW_ROLE_BTN = (By.XPATH, ".//a[contains(@class,'btn') and contains(.,'View Role')]")
+    VIEW_ROLE_BTN = Loc("a[class*='btn']", text="View Role")
+
+    # Every card's fields and View Role href in one roundtrip (same selectors as the locators above)
+    _CARDS_SCRIPT = """
+const [cardCss, posCss, deptCss, locCss, btnCss] = arguments;
+const text = (el) => (el ? el.textContent.replace(/\\s+/g, ' ').trim() : '');
+return Array.from(document.querySelectorAll(cardCss)).map((card) => {
+  const buttons = Array.from(card.querySelectorAll(btnCss));
+  const view = buttons.find((a) => text(a).includes('View Role')) || buttons[0] || card.querySelector('a[href]');
+  return {title: text(card.querySelector(posCss)), department: text(card.querySelector(deptCss)),
+          location: text(card.querySelector(locCss)), href: view ? view.href : ''};
+});
+"""
 
     def click_see_all_qa(self):
         self.scroll_into_view(self.SEE_ALL_QA)
@@ -58,44 +76,54 @@ class QAJobsPage(BasePage):
         Extended wait: up to 5 minutes (300s) retrying every 3s.
         No URL/query param tricks, no counter polling.
         """
-        print(f"[dept] START collecting options (pure retry, max {max_wait}s)")
+        self.trace.event("dept", "start", target=department, max_wait=max_wait)
         opts = self._retry_collect_options(
             self.FILTER_DEPT_ARROW,
             prefix="select2-filter-by-department",
             max_wait=max_wait,
             interval=interval,
         )
-        print(f"[dept] options collected: {[t for _, t in opts]}")
+        self.trace.event("dept", "collected", options=[t for _, t in opts])
         chosen = self._choose_best_match(department, opts)
         if not chosen:
             raise TimeoutException(f"[dept] No matching option for '{department}' in {[t for _, t in opts]}")
         el = chosen[0]
         self.driver.execute_script("arguments[0].scrollIntoView({block:'nearest'});", el)
         el.click()
-        print(f"[dept] clicked '{chosen[1]}'")
+        self.trace.event("dept", "clicked", option=chosen[1])
 
     def filter_by_location(self, location: str, max_wait: int = 300, interval: int = 3):
         """Pure user-action approach for location dropdown (same pattern as department)."""
-        print(f"[loc] START collecting options (pure retry, max {max_wait}s)")
+        self.trace.event("loc", "start", target=location, max_wait=max_wait)
         opts = self._retry_collect_options(
             self.FILTER_LOC_ARROW,
             prefix="select2-filter-by-location",
             max_wait=max_wait,
             interval=interval,
         )
-        print(f"[loc] options collected: {[t for _, t in opts]}")
+        self.trace.event("loc", "collected", options=[t for _, t in opts])
         chosen = self._choose_best_match(location, opts)
         if not chosen:
             raise TimeoutException(f"[loc] No matching option for '{location}' in {[t for _, t in opts]}")
         el = chosen[0]
         self.driver.execute_script("arguments[0].scrollIntoView({block:'nearest'});", el)
         el.click()
-        print(f"[loc] clicked '{chosen[1]}'")
-        self._debug_dump_cards(limit=5)
+        self.trace.event("loc", "clicked", option=chosen[1])
+        # Only read back if the test fails (attached with the failure artifacts)
+        self.trace.defer("cards", lambda: self._debug_dump_cards(limit=5))
 
     def get_job_cards(self):
         return self.wait_all_present(self.JOB_LIST)
 
+    def snapshot_job_cards(self, wait: bool = True) -> List[JobCard]:
+        """Title/department/location/View Role href of every listed card, read in a single script."""
+        if wait:
+            self.get_job_cards()
+        rows = self.driver.execute_script(
+            self._CARDS_SCRIPT, self.JOB_LIST[1], self.JOB_POS[1], self.JOB_DEPT[1], self.JOB_LOC[1], self.VIEW_ROLE_BTN.css
+        )
+        return [JobCard(**row) for row in rows or []]
+
     def _wait_select2_results(self, results_ul_id: str, min_items: int = 1):
         """Wait until Select2 results ul has at least min_items li elements."""
         ul_locator = (By.ID, results_ul_id)
@@ -113,9 +141,9 @@ class QAJobsPage(BasePage):
             return True
         except TimeoutException:
             # Look for any select2 results list for department/location
-            pattern_xpath = "//ul[starts-with(@id,'select2-filter-by-') and contains(@id,'-results') and count(li) > 0]"
+            pattern_css = "ul[id^='select2-filter-by-'][id*='-results']:has(li)"
             try:
-                WebDriverWait(self.driver, 5).until(EC.presence_of_element_located((By.XPATH, pattern_xpath)))
+                WebDriverWait(self.driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, pattern_css)))
                 return True
             except TimeoutException:
                 return False
@@ -149,14 +177,16 @@ class QAJobsPage(BasePage):
             time.sleep(0.5)
         return last_text
 
-    def assert_jobs_match(self, position_contains: str, dept_contains: str, loc_contains: str) -> list[str]:
+    def assert_jobs_match(
+        self, position_contains: str, dept_contains: str, loc_contains: str, cards: Optional[Sequence[JobCard]] = None
+    ) -> list[str]:
+        """Mismatch messages for every card; pass `cards` to reuse a snapshot the caller already took."""
         errors: List[str] = []
-        self.wait_jobs_counter_stable()
-        cards = self.get_job_cards()
+        if cards is None:
+            self.wait_jobs_counter_stable()
+            cards = self.snapshot_job_cards()
         for idx, card in enumerate(cards, start=1):
-            pos = card.find_element(*self.JOB_POS).text
-            dept = card.find_element(*self.JOB_DEPT).text
-            loc = card.find_element(*self.JOB_LOC).text
+            pos, dept, loc = card.title, card.department, card.location
             if position_contains not in pos:
                 errors.append(f"Card {idx} position mismatch: '{pos}'")
             if dept_contains not in dept:
@@ -172,7 +202,7 @@ class QAJobsPage(BasePage):
         card = cards[0]
         # Hover before clicking View Role
         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
-        view_btn = card.find_element(*self.VIEW_ROLE_BTN)
+        view_btn = self.find(self.VIEW_ROLE_BTN, root=card)
         ActionChains(self.driver).move_to_element(view_btn).perform()
         before = set(self.driver.window_handles)
         view_btn.click()
@@ -200,39 +230,23 @@ class QAJobsPage(BasePage):
                 pass
             opts = self._collect_select2_options(results_ul_id_prefix=prefix)
             texts = [t for _, t in opts]
-            print(f"[select2] attempt {attempt} options: {texts}")
+            self.trace.event("select2", "attempt", prefix=prefix, attempt=attempt, options=texts)
             last_seen = texts
             if len(opts) > 1:
                 return opts
             time.sleep(interval)
         raise TimeoutException(f"[select2] Timeout after {max_wait}s; last seen options: {last_seen}")
 
-    def _debug_dump_cards(self, limit: int = 5):
-        try:
-            cards = self.get_job_cards()
-            print(f"[cards] total: {len(cards)}")
-            for i, c in enumerate(cards[:limit], start=1):
-                try:
-                    pos = c.find_element(*self.JOB_POS).text
-                except Exception:
-                    pos = ""
-                try:
-                    dept = c.find_element(*self.JOB_DEPT).text
-                except Exception:
-                    dept = ""
-                try:
-                    loc = c.find_element(*self.JOB_LOC).text
-                except Exception:
-                    loc = ""
-                print(f"[cards] {i}: pos='{pos}' dept='{dept}' loc='{loc}'")
-        except Exception as e:
-            print(f"[cards] dump failed: {e}")
+    def _debug_dump_cards(self, limit: int = 5) -> dict:
+        """First `limit` rendered cards as plain data (one script, no waiting)."""
+        cards = self.snapshot_job_cards(wait=False)
+        return {"total": len(cards), "cards": [asdict(c) for c in cards[:limit]]}
 
     # Removed URL/counter-based fallback helpers (_any_card_contains, _has_result_counter, _get_result_counter, _wait_param_and_counter)
 
     def _collect_select2_options(self, results_ul_id_prefix: str):
         # Find any ul whose id starts with prefix and ends with -results
-        uls = self.driver.find_elements(By.XPATH, f"//ul[starts-with(@id,'{results_ul_id_prefix}') and contains(@id,'-results')]")
+        uls = self.driver.find_elements(By.CSS_SELECTOR, f"ul[id^='{results_ul_id_prefix}'][id*='-results']")
         for ul in uls:
             if not ul.is_displayed():
                 continue
@@ -0,0 +1,204 @@
+"""Resource-aware xdist worker count and browser memory tracking.
+
+With `-n auto` the worker count comes from usable CPUs, available memory (cgroup limits included)
+and the per-browser RSS measured on earlier runs (pytest cache), using separate caps for UI runs
+(one browser per worker) and API-only runs. During the run each worker samples its browser's RSS
+after every UI test; with `--browser-contexts` the shared browser is recycled once it grows past
+`--browser-recycle-mb`. The terminal summary reports the chosen concurrency and peak memory.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from src.utils.process_metrics import available_cpus, available_memory, driver_browser_rss
+
+CACHE_KEY = "resources/browser_rss"
+_MIB = 1024 * 1024
+# Used until a run has measured the real figure for the selected browser
+DEFAULT_BROWSER_RSS = 450 * _MIB
+# pytest worker process itself (interpreter, plugins, imported stack)
+WORKER_RSS = 120 * _MIB
+_PLAN = pytest.StashKey["WorkerPlan"]()
+_USAGE = pytest.StashKey[list]()
+
+
+@dataclass
+class WorkerPlan:
+    workers: int
+    profile: str
+    cpus: int
+    available_bytes: Optional[int]
+    browser_rss: int
+    limited_by: str
+
+
+@dataclass
+class WorkerUsage:
+    worker: str
+    ui_tests: int = 0
+    peak_browser_rss: int = 0
+    recycles: int = 0
+
+
+def plan_workers(
+    cpus: int,
+    available_bytes: Optional[int],
+    ui: bool,
+    browser_rss: int = DEFAULT_BROWSER_RSS,
+    reserve_bytes: int = 1024 * _MIB,
+    max_ui: Optional[int] = None,
+    max_api: Optional[int] = None,
+) -> WorkerPlan:
+    """UI workers: one browser each, bounded by CPUs and memory. API workers: I/O bound, 2 per CPU."""
+    per_worker = WORKER_RSS + (browser_rss if ui else 0)
+    limits = {"cpu": cpus if ui else cpus * 2}
+    if available_bytes is not None:
+        limits["memory"] = max(1, (available_bytes - reserve_bytes) // per_worker)
+    cap = max_ui if ui else max_api
+    if cap:
+        limits["cap"] = cap
+    limited_by = min(limits, key=limits.get)
+    return WorkerPlan(
+        workers=max(1, int(limits[limited_by])),
+        profile="ui" if ui else "api",
+        cpus=cpus,
+        available_bytes=available_bytes,
+        browser_rss=browser_rss if ui else 0,
+        limited_by=limited_by,
+    )
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("resources")
+    group.addoption("--max-ui-workers", type=int, default=None, help="Upper bound for -n auto when UI tests run")
+    group.addoption("--max-api-workers", type=int, default=16, help="Upper bound for -n auto on API-only runs")
+    group.addoption(
+        "--memory-reserve-mb", type=int, default=1024, help="Memory left free for the OS/CI agent when sizing -n auto"
+    )
+    group.addoption(
+        "--browser-recycle-mb",
+        type=int,
+        default=int(os.environ.get("BROWSER_RECYCLE_MB", "1500")),
+        help="With --browser-contexts: restart a worker's shared browser once its RSS exceeds this (0 disables)",
+    )
+
+
+def _expects_ui(config) -> bool:
+    """Best guess before collection: API-only paths or an api marker expression mean no browsers."""
+    markexpr = f"{config.getoption('markexpr', '') or ''} {config.getoption('--tags', '') or ''}"
+    # Whole marker names only: "rapid" or "build" must not read as api/ui; "not api" still means browsers
+    words = set(re.findall(r"\w+", markexpr))
+    if "api" in words and not words & {"ui", "not"}:
+        return False
+    paths = [Path(a.split("::")[0]).as_posix() for a in config.args]
+    if paths and all("tests/api" in p or "tests/unit" in p for p in paths):
+        return False
+    return True
+
+
+def _browser(config) -> str:
+    return config.getoption("--browser", default=os.environ.get("BROWSER", "chrome"))
+
+
+def _cached_rss(config) -> dict:
+    # -n auto is resolved before the cache plugin configures config.cache; read its file directly
+    path = Path(str(config.rootpath), config.getini("cache_dir"), "v", *CACHE_KEY.split("/"))
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_xdist_auto_num_workers(config):
+    if os.environ.get("PYTEST_XDIST_AUTO_NUM_WORKERS"):
+        return None  # explicit override: let xdist use it
+    measured = _cached_rss(config).get(_browser(config))
+    plan = plan_workers(
+        cpus=available_cpus(),
+        available_bytes=available_memory(),
+        ui=_expects_ui(config),
+        browser_rss=int(measured or DEFAULT_BROWSER_RSS),
+        reserve_bytes=config.getoption("--memory-reserve-mb") * _MIB,
+        max_ui=config.getoption("--max-ui-workers"),
+        max_api=config.getoption("--max-api-workers"),
+    )
+    config.stash[_PLAN] = plan
+    return plan.workers
+
+
+def _usage(config) -> WorkerUsage:
+    usage = config.stash.get(_USAGE, None)
+    if usage is None:
+        usage = config.stash[_USAGE] = [WorkerUsage(os.environ.get("PYTEST_XDIST_WORKER", "main"))]
+    return usage[0]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    yield
+    driver = getattr(item, "funcargs", {}).get("driver")
+    if driver is None:
+        return
+    usage = _usage(item.config)
+    usage.ui_tests += 1
+    rss = driver_browser_rss(driver)
+    if rss:
+        usage.peak_browser_rss = max(usage.peak_browser_rss, rss)
+    shared = item.funcargs.get("shared_browser")
+    if shared is not None:
+        usage.recycles = shared.recycles
+        usage.peak_browser_rss = max(usage.peak_browser_rss, shared.peak_rss)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    workeroutput = getattr(config, "workeroutput", None)
+    if workeroutput is not None:
+        if _USAGE in config.stash:
+            workeroutput["resources"] = asdict(_usage(config))
+        return
+    peaks = [u.peak_browser_rss for u in config.stash.get(_USAGE, []) if u.peak_browser_rss]
+    if peaks and config.cache is not None:
+        # Next run sizes -n auto from this run's worst per-browser figure
+        measured = config.cache.get(CACHE_KEY, {})
+        measured[_browser(config)] = max(peaks)
+        config.cache.set(CACHE_KEY, measured)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    usage = getattr(node, "workeroutput", {}).get("resources")
+    if usage:
+        node.config.stash.setdefault(_USAGE, []).append(WorkerUsage(**usage))
+
+
+def _mib(n: Optional[int]) -> str:
+    return "n/a" if n is None else f"{n / _MIB:.0f}MiB"
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    plan = config.stash.get(_PLAN, None)
+    usage: List[WorkerUsage] = [u for u in config.stash.get(_USAGE, []) if u.ui_tests]
+    if plan is None and not usage:
+        return
+    terminalreporter.write_sep("-", "resources")
+    if plan is not None:
+        terminalreporter.write_line(
+            f"-n auto -> {plan.workers} workers ({plan.profile} profile, limited by {plan.limited_by}): "
+            f"cpus={plan.cpus} available={_mib(plan.available_bytes)} per-browser={_mib(plan.browser_rss)}"
+        )
+    for u in sorted(usage, key=lambda u: u.worker):
+        terminalreporter.write_line(
+            f"{u.worker}: ui tests={u.ui_tests} peak browser rss={_mib(u.peak_browser_rss)} recycles={u.recycles}"
+        )
+    if usage:
+        total = sum(u.peak_browser_rss for u in usage)
+        terminalreporter.write_line(f"peak browser memory (sum of worker peaks): {_mib(total)}")
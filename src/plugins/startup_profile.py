@@ -0,0 +1,207 @@
+"""Collection/startup profiling: import time per module and startup phases, per xdist worker.
+
+Enable with `--startup-profile[=PATH]` (PATH receives the JSON report). Imports are timed from the
+moment this plugin is imported; load it with `-p src.plugins.startup_profile` to also cover conftest.
+`--startup-budget SECONDS` fails the run when any worker needs longer than that to finish collection.
+"""
+from __future__ import annotations
+
+import builtins
+import importlib.util
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+_ENV_FLAG = "PYTEST_STARTUP_PROFILE"
+_REPORTS = pytest.StashKey[list]()
+# Modules whose presence means the UI stack was loaded
+UI_STACK_MODULES = ("selenium", "webdriver_manager", "src.utils.driver_factory")
+
+
+class ImportTimer:
+    """Times first-time imports by wrapping builtins.__import__ (self and cumulative time per module)."""
+
+    def __init__(self):
+        self.records: Dict[str, List[float]] = {}
+        self._local = threading.local()
+        self._orig = None
+
+    def install(self) -> None:
+        if self._orig is None:
+            self._orig = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self) -> None:
+        if self._orig is not None:
+            builtins.__import__ = self._orig
+            self._orig = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        target = name
+        if level:
+            try:
+                target = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+            except (ImportError, ValueError):
+                target = name
+        if target in sys.modules:
+            return self._orig(name, globals, locals, fromlist, level)
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._orig(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            if target in sys.modules and target not in self.records:
+                self.records[target] = [elapsed - children, elapsed]
+
+    def top(self, limit: int = 15) -> List[dict]:
+        rows = sorted(self.records.items(), key=lambda kv: kv[1][0], reverse=True)[:limit]
+        return [{"module": m, "self_ms": round(s * 1000, 2), "cumulative_ms": round(c * 1000, 2)} for m, (s, c) in rows]
+
+
+def _process_age() -> Optional[float]:
+    """Seconds since this process started (Linux /proc or psutil); None if unknown."""
+    try:
+        import psutil  # optional
+
+        return time.time() - psutil.Process().create_time()
+    except Exception:
+        pass
+    try:
+        start_ticks = int(Path("/proc/self/stat").read_text().rsplit(")", 1)[1].split()[19])
+        uptime = float(Path("/proc/uptime").read_text().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except Exception:
+        return None
+
+
+_timer = ImportTimer()
+_loaded_at = time.perf_counter()
+_age_at_load = _process_age()
+_phases: Dict[str, float] = {}
+if os.environ.get(_ENV_FLAG) or any(a.startswith("--startup-profile") for a in sys.argv):
+    _timer.install()
+
+
+def _mark(phase: str) -> None:
+    _phases[phase] = round((time.perf_counter() - _loaded_at) * 1000, 2)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("startup profile")
+    group.addoption(
+        "--startup-profile",
+        action="store",
+        nargs="?",
+        const="startup-profile.json",
+        default=None,
+        help="Profile imports/startup per worker and write a JSON report (default path: startup-profile.json)",
+    )
+    group.addoption(
+        "--startup-budget",
+        action="store",
+        type=float,
+        default=None,
+        help="Fail the run if any worker takes longer than this many seconds from process start to collection finish",
+    )
+
+
+def _enabled(config) -> bool:
+    return bool(config.getoption("--startup-profile") or config.getoption("--startup-budget"))
+
+
+def pytest_configure(config):
+    if not _enabled(config):
+        _timer.uninstall()
+        return
+    # Inherited by xdist workers, which are spawned after configure
+    os.environ[_ENV_FLAG] = "1"
+    _timer.install()
+    _mark("configure")
+
+
+def pytest_collection(session):
+    if _enabled(session.config):
+        _mark("collection_start")
+
+
+def pytest_collection_finish(session):
+    config = session.config
+    if not _enabled(config):
+        return
+    _mark("collection_finish")
+    _timer.uninstall()
+    report = {
+        "worker": os.environ.get("PYTEST_XDIST_WORKER", "main"),
+        "startup_seconds": round((_age_at_load or 0.0) + _phases["collection_finish"] / 1000, 3)
+        if _age_at_load is not None
+        else None,
+        "process_age_at_plugin_load_seconds": round(_age_at_load, 3) if _age_at_load is not None else None,
+        "phases_ms": dict(_phases),
+        "items": len(session.items),
+        "modules_timed": len(_timer.records),
+        "ui_stack_loaded": [m for m in UI_STACK_MODULES if m in sys.modules],
+        "top_imports": _timer.top(),
+    }
+    config.stash.setdefault(_REPORTS, []).append(report)
+    workeroutput = getattr(config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["startup_profile"] = report
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    report = getattr(node, "workeroutput", {}).get("startup_profile")
+    if report:
+        node.config.stash.setdefault(_REPORTS, []).append(report)
+
+
+def _over_budget(config) -> List[dict]:
+    budget = config.getoption("--startup-budget")
+    if budget is None:
+        return []
+    reports = config.stash.get(_REPORTS, [])
+    return [r for r in reports if r.get("startup_seconds") is not None and r["startup_seconds"] > budget]
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    if not _enabled(config) or getattr(config, "workeroutput", None) is not None:
+        return
+    path = config.getoption("--startup-profile")
+    if path:
+        Path(path).write_text(json.dumps(config.stash.get(_REPORTS, []), indent=2), encoding="utf-8")
+    if _over_budget(config) and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    reports = config.stash.get(_REPORTS, [])
+    if not _enabled(config) or not reports:
+        return
+    terminalreporter.write_sep("-", "startup profile")
+    for r in sorted(reports, key=lambda r: r["worker"]):
+        ui = ", ".join(r["ui_stack_loaded"]) or "no"
+        terminalreporter.write_line(
+            f"{r['worker']}: startup={r['startup_seconds']}s collection_finish=+{r['phases_ms'].get('collection_finish')}ms "
+            f"items={r['items']} UI stack loaded: {ui}"
+        )
+        for row in r["top_imports"][:5]:
+            terminalreporter.write_line(
+                f"    {row['module']:<45} self {row['self_ms']:>8.1f}ms  cumulative {row['cumulative_ms']:>8.1f}ms"
+            )
+    for r in _over_budget(config):
+        terminalreporter.write_line(
+            f"startup budget exceeded on {r['worker']}: {r['startup_seconds']}s > {config.getoption('--startup-budget')}s",
+            red=True,
+        )
@@ -0,0 +1,259 @@
+"""Change-aware test selection: which `src/` modules does each test use, and which tests did a change touch.
+
+`--impact-record` profiles every test (fixture setup included) and stores `{nodeid: [src files]}` in
+the pytest cache (`.pytest_cache/v/test_impact/map`). `--changed-since REF` diffs the work tree
+against the merge base with REF and deselects tests whose recorded files, and own test file, are all
+unchanged. Tests without a record are always selected, and changes to conftest/pytest configuration,
+src/plugins/ or non-Python files under src/ select everything.
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+import pytest
+
+CACHE_KEY = "test_impact/map"
+# Changes to these select every test
+GLOBAL_FILES = ("conftest.py", "pytest.ini", "requirements.txt", "setup.cfg", "pyproject.toml")
+_RECORDER = pytest.StashKey["ImpactRecorder"]()
+_RECORDED = pytest.StashKey[dict]()
+_SELECTION = pytest.StashKey[dict]()
+
+
+class ImpactRecorder:
+    """Collects the src/ files whose functions run, attributed to the current test or fixture."""
+
+    def __init__(self, rootdir: Path, package: str = "src"):
+        self.rootdir = rootdir
+        self.src_root = str(rootdir / package) + os.sep
+        # Pytest plugins run around every test; changes to them count as global instead
+        self.plugins_root = str(rootdir / package / "plugins") + os.sep
+        self.fixture_files: Dict[str, Set[str]] = {}
+        self._paths: Dict[str, Optional[str]] = {}
+        self._stack: List[Set[str]] = []
+
+    def start(self) -> None:
+        sys.setprofile(self._profile)
+        threading.setprofile(self._profile)
+
+    def stop(self) -> None:
+        sys.setprofile(None)
+        threading.setprofile(None)
+
+    def _profile(self, frame, event, arg):
+        if event != "call" or not self._stack:
+            return
+        filename = frame.f_code.co_filename
+        path = self._paths.get(filename, "")
+        if path == "":
+            path = self._paths[filename] = self._relative(filename)
+        if path is not None:
+            self._stack[-1].add(path)
+
+    def _relative(self, filename: str) -> Optional[str]:
+        if not filename.startswith(self.src_root) or filename.startswith(self.plugins_root):
+            return None
+        return Path(filename).relative_to(self.rootdir).as_posix()
+
+    def push(self) -> None:
+        self._stack.append(set())
+
+    def pop(self) -> Set[str]:
+        files = self._stack.pop()
+        if self._stack:
+            self._stack[-1] |= files
+        return files
+
+    def module_imports(self, module) -> Set[str]:
+        """src/ files the test module imported at collection time (classes, functions, modules)."""
+        files = set()
+        for value in vars(module).values():
+            if isinstance(value, types.ModuleType):
+                name = value.__name__
+            else:
+                name = getattr(value, "__module__", None)
+            source = getattr(sys.modules.get(name or ""), "__file__", None)
+            path = self._relative(source) if source else None
+            if path:
+                files.add(path)
+        return files
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("test impact")
+    group.addoption(
+        "--impact-record",
+        action="store_true",
+        help="Record which src/ files each test uses into the pytest cache (for --changed-since)",
+    )
+    group.addoption(
+        "--changed-since",
+        action="store",
+        default=None,
+        metavar="REF",
+        help="Only run tests affected by changes since the merge base with this git ref (plus uncommitted changes)",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--impact-record"):
+        config.stash[_RECORDED] = {}
+        config.stash[_RECORDER] = ImpactRecorder(Path(str(config.rootpath)))
+
+
+def _recorder(config) -> Optional[ImpactRecorder]:
+    return config.stash.get(_RECORDER, None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    recorder = _recorder(request.config)
+    if recorder is None:
+        yield
+        return
+    recorder.push()
+    try:
+        yield
+    finally:
+        # Session fixtures run once; remember their files so every test using them inherits them
+        recorder.fixture_files.setdefault(fixturedef.argname, set()).update(recorder.pop())
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    recorder = _recorder(item.config)
+    if recorder is None:
+        yield
+        return
+    recorder.push()
+    recorder.start()
+    try:
+        yield
+    finally:
+        recorder.stop()
+        files = recorder.pop()
+        for name in getattr(item, "fixturenames", ()):
+            files |= recorder.fixture_files.get(name, set())
+        module = getattr(item, "module", None)
+        if module is not None:
+            files |= recorder.module_imports(module)
+        item.config.stash[_RECORDED][item.nodeid] = sorted(files)
+
+
+def changed_files(ref: str, cwd: Path) -> List[str]:
+    """Files changed between the merge base with `ref` and the work tree, plus untracked files."""
+
+    def git(*args: str) -> str:
+        return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True).stdout
+
+    try:
+        base = git("merge-base", ref, "HEAD").strip()
+    except subprocess.CalledProcessError:
+        base = ref
+    names = git("diff", "--name-only", base).splitlines()
+    names += git("ls-files", "--others", "--exclude-standard").splitlines()
+    return sorted({n.strip() for n in names if n.strip()})
+
+
+def is_global_change(path: str) -> bool:
+    name = path.rsplit("/", 1)[-1]
+    if name in GLOBAL_FILES or path.startswith("src/plugins/"):
+        return True
+    return path.startswith("src/") and not path.endswith(".py")
+
+
+def affected(nodeid: str, test_file: str, impact_map: Dict[str, List[str]], changed: Set[str]) -> bool:
+    if nodeid not in impact_map or test_file in changed:
+        return True
+    return not changed.isdisjoint(impact_map[nodeid])
+
+
+def pytest_collection_modifyitems(session, config, items):
+    ref = config.getoption("--changed-since")
+    if not ref:
+        return
+    start = time.perf_counter()
+    rootdir = Path(str(config.rootpath))
+    try:
+        changed = changed_files(ref, rootdir)
+    except (OSError, subprocess.CalledProcessError) as e:
+        config.stash[_SELECTION] = {"ref": ref, "error": f"git diff failed, running everything: {e}"}
+        return
+    impact_map = config.cache.get(CACHE_KEY, {})
+    run_all = not impact_map or any(is_global_change(p) for p in changed)
+    changed_set = set(changed)
+    selected, deselected = [], []
+    for item in items:
+        test_file = item.nodeid.split("::", 1)[0]
+        if run_all or affected(item.nodeid, test_file, impact_map, changed_set):
+            selected.append(item)
+        else:
+            deselected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    config.stash[_SELECTION] = {
+        "ref": ref,
+        "changed": len(changed),
+        "run_all": run_all,
+        "mapped": len(impact_map),
+        "selected": len(selected),
+        "deselected": len(deselected),
+        "selection_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    workeroutput = getattr(config, "workeroutput", None)
+    if workeroutput is not None:
+        # xdist worker: the controller merges and writes the map; selection stats are identical per worker
+        workeroutput["test_impact"] = {
+            "recorded": config.stash.get(_RECORDED, {}),
+            "selection": config.stash.get(_SELECTION, None),
+        }
+        return
+    recorded = config.stash.get(_RECORDED, None)
+    if recorded:
+        impact_map = config.cache.get(CACHE_KEY, {})
+        impact_map.update(recorded)
+        config.cache.set(CACHE_KEY, impact_map)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    output = getattr(node, "workeroutput", {}).get("test_impact")
+    if not output:
+        return
+    if _RECORDED in node.config.stash:
+        node.config.stash[_RECORDED].update(output["recorded"])
+    if output["selection"] and _SELECTION not in node.config.stash:
+        node.config.stash[_SELECTION] = output["selection"]
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    selection = config.stash.get(_SELECTION, None)
+    recorded = config.stash.get(_RECORDED, None)
+    if selection is None and not recorded:
+        return
+    terminalreporter.write_sep("-", "test impact")
+    if recorded:
+        terminalreporter.write_line(f"recorded src/ dependencies for {len(recorded)} tests ({CACHE_KEY})")
+    if selection is None:
+        return
+    if "error" in selection:
+        terminalreporter.write_line(f"--changed-since {selection['ref']}: {selection['error']}", yellow=True)
+        return
+    reason = " (global change or no recorded map: running everything)" if selection["run_all"] else ""
+    terminalreporter.write_line(
+        f"--changed-since {selection['ref']}: {selection['changed']} changed files, "
+        f"selected {selection['selected']}, skipped {selection['deselected']} "
+        f"(map covers {selection['mapped']} tests) in {selection['selection_ms']}ms{reason}"
+    )
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import zipfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+# Response headers worth replaying; everything else (cookies, caching, CSP, ...) is dropped
+KEPT_HEADERS = ("content-type", "location")
+
+
+@dataclass
+class Entry:
+    url: str
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: str = ""  # sha1 of the body blob inside the archive ("" for empty bodies)
+
+    @property
+    def host(self) -> str:
+        return urlsplit(self.url).netloc
+
+    @property
+    def path(self) -> str:
+        parts = urlsplit(self.url)
+        return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+
+class ArchiveWriter:
+    """Compact capture archive: a zip with index.json plus deduplicated, deflated body blobs."""
+
+    def __init__(self):
+        self.entries: Dict[str, Entry] = {}
+        self.blobs: Dict[str, bytes] = {}
+
+    def add(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        digest = hashlib.sha1(body).hexdigest() if body else ""
+        if digest:
+            self.blobs[digest] = body
+        kept = {k.lower(): v for k, v in headers.items() if k.lower() in KEPT_HEADERS}
+        self.entries[url] = Entry(url=url, status=status, headers=kept, body=digest)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.entries
+
+    def save(self, path: Path | str) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+            zf.writestr("index.json", json.dumps([asdict(e) for e in self.entries.values()], indent=1))
+            for digest, body in self.blobs.items():
+                zf.writestr(f"blobs/{digest}", body)
+        return path
+
+
+class Archive:
+    """Read side of the capture archive, fully loaded in memory for fast serving."""
+
+    def __init__(self, entries: Iterable[Entry], blobs: Dict[str, bytes]):
+        self.entries: List[Entry] = list(entries)
+        self._blobs = blobs
+        self._by_key = {(e.host, e.path): e for e in self.entries}
+        # Fallback ignoring query strings (cache busters, tracking params)
+        self._by_path: Dict[tuple, Entry] = {}
+        for e in self.entries:
+            self._by_path.setdefault((e.host, urlsplit(e.url).path or "/"), e)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "Archive":
+        with zipfile.ZipFile(path) as zf:
+            entries = [Entry(**item) for item in json.loads(zf.read("index.json"))]
+            blobs = {name.split("/", 1)[1]: zf.read(name) for name in zf.namelist() if name.startswith("blobs/")}
+        return cls(entries, blobs)
+
+    @property
+    def hosts(self) -> List[str]:
+        return sorted({e.host for e in self.entries})
+
+    def lookup(self, host: str, path: str) -> Optional[Entry]:
+        return self._by_key.get((host, path)) or self._by_path.get((host, path.split("?", 1)[0] or "/"))
+
+    def body(self, entry: Entry) -> bytes:
+        return self._blobs.get(entry.body, b"") if entry.body else b""
@@ -0,0 +1,135 @@
+"""Record the pages and assets visited by the Insider careers UI flow into a replay archive.
+
+Drives the same page-object steps as tests/ui/test_insider_careers_ui.py in Chrome with performance
+logging on, collects every GET response (documents, scripts, styles, images, XHR such as the
+positions feed) and stores them deduplicated in a zip archive for src.replay.server.
+
+Usage:
+    python -m src.replay.capture --out .replay/insider-careers.zip --headless
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+from pathlib import Path
+from typing import Dict
+from urllib.parse import urljoin
+
+import requests
+
+from src.pages.careers_page import CareersPage
+from src.pages.home_page import HomePage
+from src.pages.qa_jobs_page import QAJobsPage
+from src.utils.config import get_env_config
+from src.utils.driver_factory import create_driver
+
+from .archive import ArchiveWriter
+
+
+class Recorder:
+    """Turns Chrome performance-log network events into archive entries."""
+
+    def __init__(self, driver, writer: ArchiveWriter):
+        self.driver = driver
+        self.writer = writer
+        self._methods: Dict[str, str] = {}
+
+    def drain(self) -> int:
+        """Record responses logged since the last call; bodies are read before the page moves on."""
+        added = 0
+        for record in self.driver.get_log("performance"):
+            message = json.loads(record["message"])["message"]
+            params = message.get("params", {})
+            if message.get("method") == "Network.requestWillBeSent":
+                self._methods[params["requestId"]] = params["request"]["method"]
+                # Redirect hops only show up as redirectResponse on the follow-up request
+                redirect = params.get("redirectResponse")
+                if redirect and redirect["url"] not in self.writer:
+                    self.writer.add(redirect["url"], redirect["status"], redirect.get("headers", {}), b"")
+                    added += 1
+            elif message.get("method") == "Network.responseReceived":
+                response = params["response"]
+                url = response["url"]
+                if not url.startswith("http") or url in self.writer:
+                    continue
+                if self._methods.get(params["requestId"], "GET") != "GET":
+                    continue
+                headers = dict(response.get("headers", {}))
+                headers.setdefault("content-type", response.get("mimeType", ""))
+                self.writer.add(url, response["status"], headers, self._body(params["requestId"], url))
+                added += 1
+        return added
+
+    def fetch(self, url: str, max_hops: int = 10) -> int:
+        """Record url (and its redirect hops) over plain HTTP, for links the flow checks without a browser."""
+        added = 0
+        for _ in range(max_hops):
+            if url in self.writer:
+                break
+            try:
+                resp = requests.get(url, allow_redirects=False, timeout=30)
+            except requests.RequestException:
+                break
+            self.writer.add(url, resp.status_code, dict(resp.headers), resp.content)
+            added += 1
+            if not resp.is_redirect:
+                break
+            url = urljoin(url, resp.headers["location"])
+        return added
+
+    def _body(self, request_id: str, url: str) -> bytes:
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            body = result.get("body", "")
+            return base64.b64decode(body) if result.get("base64Encoded") else body.encode("utf-8")
+        except Exception:
+            # Body already evicted from the renderer; fetch it directly instead
+            try:
+                return requests.get(url, timeout=30).content
+            except Exception:
+                return b""
+
+
+def capture(out: Path, headless: bool = True) -> Path:
+    # Always record the live site: a BASE_URL pointing at a replay server would archive the archive
+    env = get_env_config(base_url="https://useinsider.com/")
+    writer = ArchiveWriter()
+    driver = create_driver(browser="chrome", headless=headless, performance_log=True)
+    recorder = Recorder(driver, writer)
+    home, careers, qa = HomePage(driver), CareersPage(driver), QAJobsPage(driver)
+    steps = [
+        ("home", lambda: (home.open(env.base_url), home.accept_cookies_if_present())),
+        ("careers", lambda: (home.open_careers(), careers.snapshot_blocks())),
+        ("qa jobs", lambda: (careers.go_to_qa_jobs_direct(env.base_url), qa.click_see_all_qa())),
+        ("filters", lambda: (qa.filter_by_department("Quality Assurance"), qa.filter_by_location("Istanbul, Turkiye"))),
+        ("links", lambda: [recorder.fetch(card.href) for card in qa.snapshot_job_cards() if card.href]),
+        # Fetched explicitly: --replay serves env.positions_feed_url from the archive
+        ("positions feed", lambda: recorder.fetch(env.positions_feed_url)),
+        ("lever", qa.open_first_job_in_lever),
+    ]
+    try:
+        for name, step in steps:
+            try:
+                step()
+            except Exception as e:
+                print(f"[capture] step '{name}' failed: {e}")
+            print(f"[capture] {name}: +{recorder.drain()} responses")
+    finally:
+        driver.quit()
+    path = writer.save(out)
+    print(f"[capture] {len(writer.entries)} responses, {len(writer.blobs)} unique bodies -> {path}")
+    return path
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", type=Path, default=Path(".replay/insider-careers.zip"))
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args(argv)
+    capture(args.out, headless=args.headless)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,180 @@
+"""Local HTTP server replaying a capture archive, optionally with injected latency.
+
+Usage:
+    python -m src.replay.server .replay/insider-careers.zip --port 8765 --latency-ms 50
+    pytest tests/ui --replay .replay/insider-careers.zip
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .archive import Archive, Entry
+
+DEFAULT_PRIMARY_HOST = "useinsider.com"
+# Bodies that may embed absolute URLs and therefore get rewritten to point at the replay server
+_TEXT_TYPES = ("text/", "javascript", "json", "xml", "svg")
+
+
+class ReplayServer:
+    """Serves `primary_host` at the server root and every other recorded host under /_h/<host>/."""
+
+    def __init__(
+        self,
+        archive: Archive | Path | str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        primary_host: str = DEFAULT_PRIMARY_HOST,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+    ):
+        self.archive = archive if isinstance(archive, Archive) else Archive.load(archive)
+        self.primary_host = primary_host
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+        self._rendered: Dict[str, Tuple[int, Dict[str, str], bytes]] = {}
+        self._rewrite = self._compile_rewrite()
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def local_url(self, original: str) -> str:
+        """Replay-server URL for an originally recorded URL."""
+        parts = urlsplit(original)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        if parts.netloc == self.primary_host:
+            return self.url.rstrip("/") + path
+        return f"{self.url}_h/{parts.netloc}{path}"
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _compile_rewrite(self):
+        hosts = sorted(self.archive.hosts, key=len, reverse=True)
+        if not hosts:
+            return lambda text: text
+        # https://host, http://host, //host and their JSON-escaped forms (https:\/\/host)
+        pattern = re.compile(
+            r"(?:https?:)?(?:\\/\\/|//)(" + "|".join(re.escape(h) for h in hosts) + r")(?=[/\\\"'?#)\s]|$)"
+        )
+
+        def rewrite(text: str) -> str:
+            def repl(m: re.Match) -> str:
+                escaped = "\\/" in m.group(0)
+                local = self.local_url(f"https://{m.group(1)}/").rstrip("/")
+                return local.replace("/", "\\/") if escaped else local
+
+            return pattern.sub(repl, text)
+
+        return rewrite
+
+    def _render(self, entry: Entry) -> Tuple[int, Dict[str, str], bytes]:
+        cached = self._rendered.get(entry.url)
+        if cached is not None:
+            return cached
+        headers = dict(entry.headers)
+        body = self.archive.body(entry)
+        if "location" in headers:
+            location = headers["location"]
+            if location.startswith("/"):
+                location = f"https://{entry.host}{location}"
+            if urlsplit(location).netloc in self.archive.hosts:
+                headers["location"] = self.local_url(location)
+        if body and any(t in headers.get("content-type", "") for t in _TEXT_TYPES):
+            body = self._rewrite(body.decode("utf-8", errors="surrogateescape")).encode("utf-8", errors="surrogateescape")
+        rendered = (entry.status, headers, body)
+        self._rendered[entry.url] = rendered
+        return rendered
+
+    def _resolve(self, path: str) -> Optional[Entry]:
+        if path.startswith("/_h/"):
+            host, _, rest = path[len("/_h/"):].partition("/")
+            return self.archive.lookup(host, "/" + rest)
+        return self.archive.lookup(self.primary_host, path)
+
+    def _delay(self) -> None:
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self, with_body: bool) -> None:
+                server._delay()
+                entry = server._resolve(self.path)
+                if entry is None:
+                    status, headers, body = 404, {"content-type": "text/plain"}, b"not in replay archive"
+                else:
+                    status, headers, body = server._render(entry)
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                if with_body:
+                    self.wfile.write(body)
+
+            def do_GET(self):
+                self._serve(True)
+
+            def do_HEAD(self):
+                self._serve(False)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("archive", type=Path)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--primary-host", default=DEFAULT_PRIMARY_HOST)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    args = parser.parse_args(argv)
+    server = ReplayServer(args.archive, args.host, args.port, args.primary_host, args.latency_ms, args.jitter_ms)
+    print(f"Replaying {len(server.archive.entries)} responses from {args.archive} at {server.url}")
+    print(f"Run the UI suite with: BASE_URL={server.url} pytest tests/ui")
+    try:
+        server.start()
+        server._thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
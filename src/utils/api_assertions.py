@@ -4,6 +4,8 @@ from typing import Any, Iterable
 
 import pytest_check as check
 
+from .response_schema import get_spec
+
 
 def assert_status(resp, expected: int, msg: str | None = None):
     actual = getattr(resp, "status_code", None)
@@ -32,5 +34,30 @@ def assert_json_field_equals(resp, field: str, expected: Any):
     check.equal(actual, expected, f"Field '{field}' mismatch. Expected {expected}, got {actual}. Body: {str(data)[:500]}")
 
 
+def assert_response_schema(resp, definition: str | None = None):
+    """Validate the whole JSON body against the spec's schema for this request's operation and status.
+
+    `definition` validates against a named definition instead (e.g. "Pet").
+    """
+    request = getattr(resp, "request", None)
+    method = getattr(request, "method", "GET")
+    url = getattr(request, "url", "") or getattr(resp, "url", "")
+    spec = get_spec()
+    if definition is not None:
+        validator = spec.definition(definition)
+    else:
+        validator = spec.validator(method, url, resp.status_code)
+    if validator is None:
+        check.is_true(False, f"No response schema in the spec for {method} {url} -> {resp.status_code}")
+        return
+    try:
+        data = resp.json()
+    except Exception as e:
+        check.is_true(False, f"Response is not JSON: {e}. Body: {getattr(resp, 'text', '')[:300]}")
+        return
+    errors = validator.errors(data)
+    check.equal(errors, [], f"Body does not match {validator.name}: {errors}. Body: {str(data)[:500]}")
+
+
 # Previously we allowed asserting membership in a list of acceptable status codes.
 # Simplified tests now require exact status codes, so the helper was removed for clarity.
@@ -3,16 +3,39 @@ from __future__ import annotations
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class ApiClient:
-    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None):
+    def __init__(
+        self,
+        base_url: str,
+        headers: Optional[Dict[str, str]] = None,
+        pool_size: Optional[int] = None,
+        adapter: Optional[HTTPAdapter] = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
         if headers:
             self.session.headers.update(headers)
+        if adapter is None and pool_size:
+            # Keep-alive connections per host, sized for the threads that share them (default is 10)
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.adapter = adapter
+        if adapter is not None:
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+    def clone(self) -> "ApiClient":
+        """Same base URL/headers with its own Session, for another thread (Sessions are not thread-safe).
+
+        The connection pool (urllib3, thread-safe) is shared when this client has a mounted adapter.
+        """
+        return ApiClient(self.base_url, headers=dict(self.session.headers), adapter=self.adapter)
 
     def _url(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
         path = path if path.startswith("/") else "/" + path
         return self.base_url + path
 
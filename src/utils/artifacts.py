@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import allure
+
+from .tracing import Tracer
+
+# In-page Resource Timing entries: a network log that works in every browser without extra logging
+_RESOURCE_TIMING_SCRIPT = """
+return performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'))
+  .map((e) => ({name: e.name, type: e.initiatorType || e.entryType, start: Math.round(e.startTime),
+                duration: Math.round(e.duration), size: e.transferSize || 0,
+                status: e.responseStatus || null}));
+"""
+
+
+@dataclass
+class RawArtifacts:
+    """Whatever could be grabbed from the browser before it is quit; encoding happens later."""
+
+    screenshot_b64: Optional[str] = None
+    dom: Optional[str] = None
+    console: Optional[list] = None
+    network: Optional[list] = None
+    performance: Optional[list] = None
+    trace: Optional[str] = None
+    errors: List[str] = field(default_factory=list)
+
+
+def _grab(label: str, raw: RawArtifacts, fn: Callable[[], object]):
+    try:
+        return fn()
+    except Exception as e:
+        raw.errors.append(f"{label}: {str(e).splitlines()[0] if str(e) else type(e).__name__}")
+        return None
+
+
+class ArtifactCollector:
+    """Failure diagnostics with a cheap synchronous part and a background encoding part.
+
+    `collect()` only does the WebDriver roundtrips that need a live browser (screenshot, DOM, console,
+    network) and returns at once; decoding, JSON encoding, gzip and Allure attachment run on a
+    background thread while the driver shuts down. Attachments are kept within `budget_bytes`, in
+    priority order: screenshot, trace, console, network, DOM.
+    """
+
+    def __init__(self, budget_bytes: Optional[int] = None, compress_over: int = 64 * 1024):
+        self.budget_bytes = budget_bytes or int(os.environ.get("ARTIFACT_BUDGET_BYTES", str(5 * 1024 * 1024)))
+        self.compress_over = compress_over
+
+    def grab(self, driver, tracer: Optional[Tracer] = None) -> RawArtifacts:
+        raw = RawArtifacts()
+        if tracer is not None:
+            # Deferred debug collectors need the live page; the buffer is only formatted here, on failure
+            tracer.collect_deferred()
+            raw.trace = tracer.format() or None
+        raw.screenshot_b64 = _grab("screenshot", raw, driver.get_screenshot_as_base64)
+        raw.dom = _grab("dom", raw, lambda: driver.page_source)
+        raw.network = _grab("network", raw, lambda: driver.execute_script(_RESOURCE_TIMING_SCRIPT))
+        # Chromium only; other drivers raise and the error is noted in the manifest
+        raw.console = _grab("console", raw, lambda: driver.get_log("browser"))
+        if "performance" in (_grab("log types", raw, lambda: driver.log_types) or []):
+            raw.performance = _grab("performance", raw, lambda: driver.get_log("performance"))
+        return raw
+
+    def collect(self, driver, name: str, tracer: Optional[Tracer] = None) -> threading.Thread:
+        raw = self.grab(driver, tracer)
+        # A fresh thread per failure: Allure binds a thread's context to the test that was current when
+        # the thread first attached, so pooled threads would attach to stale tests.
+        job = threading.Thread(target=self.process, args=(raw, name), name=f"artifacts-{name}", daemon=True)
+        job.start()
+        return job
+
+    def process(self, raw: RawArtifacts, name: str) -> Dict[str, str]:
+        items = []
+        if raw.screenshot_b64:
+            items.append(("screenshot", base64.b64decode(raw.screenshot_b64), allure.attachment_type.PNG, "png"))
+        if raw.trace:
+            items.append(("trace", raw.trace.encode("utf-8", errors="replace"), allure.attachment_type.TEXT, "txt"))
+        if raw.console is not None:
+            items.append(("console", json.dumps(raw.console, indent=1).encode(), allure.attachment_type.JSON, "json"))
+        if raw.network is not None or raw.performance is not None:
+            network = {"resources": raw.network or [], "performance_log": raw.performance or []}
+            items.append(("network", json.dumps(network).encode(), allure.attachment_type.JSON, "json"))
+        if raw.dom is not None:
+            items.append(("dom", raw.dom.encode("utf-8", errors="replace"), allure.attachment_type.HTML, "html"))
+
+        remaining = self.budget_bytes
+        manifest: Dict[str, str] = {}
+        for label, body, attachment_type, ext in items:
+            if len(body) > self.compress_over and label != "screenshot":
+                body, attachment_type, ext = gzip.compress(body, compresslevel=6), "application/gzip", f"{ext}.gz"
+            if len(body) > remaining:
+                manifest[label] = f"skipped: {len(body)} bytes over remaining budget {remaining}"
+                continue
+            remaining -= len(body)
+            allure.attach(body, name=f"{label}-{name}", attachment_type=attachment_type, extension=ext)
+            manifest[label] = f"{len(body)} bytes ({ext})"
+        for error in raw.errors:
+            label, _, reason = error.partition(": ")
+            manifest.setdefault(label, f"unavailable: {reason}")
+        allure.attach(json.dumps(manifest, indent=1), name=f"artifacts-{name}", attachment_type=allure.attachment_type.JSON)
+        return manifest
@@ -1,9 +1,188 @@
+from __future__ import annotations
+
+import errno
+import hashlib
+import json
 import os
+import tempfile
+import threading
+import time
+from pathlib import Path
 from typing import Optional
 
+import requests
+
+
+class _FileLock:
+    """Exclusive cross-process lock on a sidecar file (fcntl on POSIX, msvcrt on Windows)."""
+
+    def __init__(self, path: Path, timeout: float = 60.0):
+        self.path = path
+        self.timeout = timeout
+        self._fh = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, "a+")
+        if os.name == "nt":
+            import msvcrt
+
+            deadline = time.monotonic() + self.timeout
+            while True:
+                try:
+                    msvcrt.locking(self._fh.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError as e:
+                    # Only contention is worth waiting for; any other error is real
+                    contended = e.errno in (errno.EACCES, errno.EDEADLK)
+                    if contended and time.monotonic() < deadline:
+                        time.sleep(0.05)
+                        continue
+                    self._fh.close()
+                    self._fh = None
+                    if contended:
+                        raise TimeoutError(f"Could not lock {self.path} within {self.timeout:g}s") from e
+                    raise
+        else:
+            import fcntl
+
+            fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if os.name == "nt":
+                import msvcrt
+
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._fh.close()
+            self._fh = None
+
+
+class TokenProvider:
+    """OAuth2 client-credentials token provider shared by every fixture and xdist worker.
+
+    Tokens are cached in memory and in an on-disk JSON cache; they are refreshed `refresh_margin`
+    seconds before expiry (at most half the token's lifetime, so short-lived tokens are still reused). Refreshes happen under a file lock, so when several processes need a new
+    token only one of them calls the identity endpoint and the rest pick the result up from disk.
+    """
+
+    def __init__(
+        self,
+        token_url: str,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        scope: Optional[str] = None,
+        cache_path: Path | str = ".state/token-cache.json",
+        refresh_margin: float = 60.0,
+        default_ttl: float = 3600.0,
+        timeout: float = 10.0,
+    ):
+        self.token_url = token_url
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.scope = scope
+        self.cache_path = Path(cache_path)
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self.timeout = timeout
+        self._key = hashlib.sha256(f"{token_url}|{client_id}|{scope}".encode()).hexdigest()[:16]
+        self._token: Optional[str] = None
+        self._refresh_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _fresh(refresh_at: float) -> bool:
+        return time.time() < refresh_at
+
+    def _entry_refresh_at(self, entry: dict) -> float:
+        # Entries written without refresh_at fall back to the plain margin
+        return entry.get("refresh_at", entry["expires_at"] - self.refresh_margin)
+
+    def get_token(self, force_refresh: bool = False) -> str:
+        if not force_refresh and self._token and self._fresh(self._refresh_at):
+            return self._token
+        stale = self._token
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self._token and self._fresh(self._refresh_at) and (not force_refresh or self._token != stale):
+                return self._token
+            with _FileLock(self.cache_path.with_name(self.cache_path.name + ".lock")):
+                entry = self._read_cache().get(self._key)
+                if entry and self._fresh(self._entry_refresh_at(entry)):
+                    # On force_refresh, a token different from the one we hold means another
+                    # process already refreshed it while we waited for the lock.
+                    if not force_refresh or entry["token"] != stale:
+                        self._token, self._refresh_at = entry["token"], self._entry_refresh_at(entry)
+                        return self._token
+                token, expires_at, ttl = self._fetch()
+                refresh_at = expires_at - min(self.refresh_margin, ttl / 2)
+                self._write_cache(token, expires_at, refresh_at)
+                self._token, self._refresh_at = token, refresh_at
+                return token
+
+    def _fetch(self) -> tuple[str, float, float]:
+        data = {"grant_type": "client_credentials"}
+        if self.client_id:
+            data["client_id"] = self.client_id
+        if self.client_secret:
+            data["client_secret"] = self.client_secret
+        if self.scope:
+            data["scope"] = self.scope
+        resp = requests.post(self.token_url, data=data, timeout=self.timeout)
+        resp.raise_for_status()
+        body = resp.json()
+        ttl = float(body.get("expires_in") or self.default_ttl)
+        return body["access_token"], time.time() + ttl, ttl
+
+    def _read_cache(self) -> dict:
+        try:
+            return json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+
+    def _write_cache(self, token: str, expires_at: float, refresh_at: float) -> None:
+        cache = self._read_cache()
+        cache[self._key] = {"token": token, "expires_at": expires_at, "refresh_at": refresh_at}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, prefix=self.cache_path.name, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        if os.name != "nt":
+            os.chmod(tmp, 0o600)
+        os.replace(tmp, self.cache_path)
+
+
+_provider: Optional[TokenProvider] = None
+
+
+def get_token_provider() -> Optional[TokenProvider]:
+    """Provider configured from AUTH_TOKEN_URL / AUTH_CLIENT_ID / AUTH_CLIENT_SECRET / AUTH_SCOPE, if any."""
+    global _provider
+    token_url = os.environ.get("AUTH_TOKEN_URL")
+    if not token_url:
+        return None
+    if _provider is None or _provider.token_url != token_url:
+        _provider = TokenProvider(
+            token_url,
+            client_id=os.environ.get("AUTH_CLIENT_ID"),
+            client_secret=os.environ.get("AUTH_CLIENT_SECRET"),
+            scope=os.environ.get("AUTH_SCOPE"),
+            cache_path=os.environ.get("AUTH_TOKEN_CACHE", ".state/token-cache.json"),
+        )
+    return _provider
+
 
 def get_auth_token(force_refresh: bool = False) -> Optional[str]:
-    # Placeholder for real auth retrieval. For demo, read from env or return None.
-    # In a real project, exchange credentials for a token here.
+    # Real token exchange when AUTH_TOKEN_URL is configured; otherwise a static API_TOKEN (or None).
+    provider = get_token_provider()
+    if provider is not None:
+        return provider.get_token(force_refresh=force_refresh)
     token = os.environ.get("API_TOKEN")
     return token
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .process_metrics import driver_browser_rss
+
+
+@dataclass
+class IsolatedContext:
+    """A BiDi user context (own cookies, storage and cache) with one tab, inside a shared browser."""
+
+    owner: "SharedBrowser"
+    user_context: str
+    handle: str
+
+    @property
+    def driver(self):
+        return self.owner.driver
+
+    def close(self) -> None:
+        self.owner.close_context(self)
+
+
+class SharedBrowser:
+    """One browser process per worker, serving each test from a fresh isolated user context.
+
+    Starting a browser costs seconds and a few hundred MiB; a user context costs milliseconds and a
+    renderer. Contexts share nothing observable (cookies, localStorage, IndexedDB, HTTP cache,
+    permissions), so tests stay as independent as with a process each. `factory` must return a driver
+    created with `bidi=True`. If the browser dies it is restarted on the next `open_context()`.
+    With `recycle_rss` (bytes) the browser is also replaced after any test that leaves its process
+    tree above that size, so renderer/GPU leaks cannot accumulate over a long worker session.
+    """
+
+    def __init__(self, factory: Callable[[], object], window_size: str = "1920,1080", recycle_rss: Optional[int] = None):
+        self._factory = factory
+        self._driver = None
+        self._home: Optional[str] = None
+        self._window_size = tuple(map(int, window_size.split(",")))
+        self.recycle_rss = recycle_rss
+        self.contexts_served = 0
+        self.restarts = 0
+        self.recycles = 0
+        self.peak_rss = 0
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            self._driver = self._factory()
+            self._home = self._driver.current_window_handle
+        return self._driver
+
+    def open_context(self) -> IsolatedContext:
+        driver = self.driver
+        try:
+            user_context = driver.browser.create_user_context()
+        except Exception:
+            # Browser gone or wedged: replace it once, then let errors surface
+            self.restarts += 1
+            self.restart()
+            driver = self.driver
+            user_context = driver.browser.create_user_context()
+        handle = driver.browsing_context.create(type="tab", user_context=user_context)
+        driver.switch_to.window(handle)
+        driver.set_window_size(*self._window_size)
+        self.contexts_served += 1
+        return IsolatedContext(self, user_context, handle)
+
+    def close_context(self, context: IsolatedContext) -> None:
+        if self._driver is None:
+            return
+        try:
+            # Removing the user context closes its tabs and drops its storage
+            self._driver.browser.remove_user_context(context.user_context)
+            self._driver.switch_to.window(self._home)
+        except Exception:
+            self.restarts += 1
+            self.restart()
+            return
+        rss = self.rss() or 0
+        self.peak_rss = max(self.peak_rss, rss)
+        if self.recycle_rss and rss > self.recycle_rss:
+            self.recycles += 1
+            self.restart()
+
+    def rss(self) -> Optional[int]:
+        return driver_browser_rss(self._driver) if self._driver is not None else None
+
+    def restart(self) -> None:
+        self.quit()
+
+    def quit(self) -> None:
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+            self._home = None
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+# Keys Selenium's add_cookie accepts; anything else returned by get_cookies() is dropped
+_SELENIUM_COOKIE_KEYS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+def origin_of(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+@dataclass
+class BrowserState:
+    """Cookies + localStorage for one origin, serializable to disk."""
+
+    origin: str
+    cookies: List[dict] = field(default_factory=list)
+    local_storage: Dict[str, str] = field(default_factory=dict)
+    expires_at: Optional[float] = None
+    # Fingerprint of the API token the state was built from (None for state captured from a UI login)
+    token_fingerprint: Optional[str] = None
+
+    def is_expired(self, margin: float = 0.0) -> bool:
+        return self.expires_at is not None and time.time() + margin >= self.expires_at
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BrowserState":
+        return cls(
+            origin=data["origin"],
+            cookies=list(data.get("cookies") or []),
+            local_storage=dict(data.get("local_storage") or {}),
+            expires_at=data.get("expires_at"),
+            token_fingerprint=data.get("token_fingerprint"),
+        )
+
+
+def load_states(path: Path) -> Dict[str, BrowserState]:
+    """Read {origin: BrowserState} from a JSON file; missing or corrupt files yield {}."""
+    try:
+        raw = json.loads(Path(path).read_text(encoding="utf-8"))
+        return {origin: BrowserState.from_dict(item) for origin, item in raw.items()}
+    except Exception:
+        return {}
+
+
+def save_states(path: Path, states: Dict[str, BrowserState]) -> None:
+    """Atomic write so parallel workers never observe a half-written file.
+
+    States hold session cookies and tokens, so the file is owner-only (like the token cache).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({origin: st.to_dict() for origin, st in states.items()}, f, indent=2)
+    if os.name != "nt":
+        os.chmod(tmp, 0o600)
+    os.replace(tmp, path)
+
+
+def capture_state(
+    driver: WebDriver,
+    cookie_prefixes: Iterable[str] | None = None,
+    storage_prefixes: Iterable[str] | None = None,
+) -> BrowserState:
+    """Capture cookies/localStorage of the current page, optionally filtered by name prefix."""
+    cookie_prefixes = tuple(cookie_prefixes or ())
+    storage_prefixes = tuple(storage_prefixes or ())
+    cookies = [
+        {k: c[k] for k in _SELENIUM_COOKIE_KEYS if k in c}
+        for c in driver.get_cookies()
+        if not cookie_prefixes or c.get("name", "").startswith(cookie_prefixes)
+    ]
+    storage = driver.execute_script(
+        "const out = {}; for (let i = 0; i < localStorage.length; i++) {"
+        " const k = localStorage.key(i); out[k] = localStorage.getItem(k); } return out;"
+    ) or {}
+    if storage_prefixes:
+        storage = {k: v for k, v in storage.items() if k.startswith(storage_prefixes)}
+    expiries = [c["expiry"] for c in cookies if c.get("expiry")]
+    return BrowserState(
+        origin=origin_of(driver.current_url),
+        cookies=cookies,
+        local_storage=storage,
+        expires_at=float(min(expiries)) if expiries else None,
+    )
+
+
+def _cdp_cookie(cookie: dict, origin: str) -> dict:
+    out = {"name": cookie["name"], "value": cookie["value"], "path": cookie.get("path", "/")}
+    if cookie.get("domain"):
+        out["domain"] = cookie["domain"]
+    else:
+        out["url"] = origin
+    for key in ("secure", "httpOnly", "sameSite"):
+        if key in cookie:
+            out[key] = cookie[key]
+    if cookie.get("expiry"):
+        out["expires"] = cookie["expiry"]
+    return out
+
+
+def inject_state(driver: WebDriver, state: BrowserState) -> None:
+    """Make `state` visible to the next navigation to its origin.
+
+    Chromium: cookies via CDP and localStorage via a new-document script, so no extra page load.
+    Other browsers: a single cheap navigation to the origin is needed before cookies can be set.
+    """
+    if hasattr(driver, "execute_cdp_cmd"):
+        if state.cookies:
+            driver.execute_cdp_cmd(
+                "Network.setCookies", {"cookies": [_cdp_cookie(c, state.origin) for c in state.cookies]}
+            )
+        if state.local_storage:
+            source = (
+                f"if (location.origin === {json.dumps(state.origin)}) {{ try {{"
+                f" const items = {json.dumps(state.local_storage)};"
+                " for (const [k, v] of Object.entries(items)) {"
+                " if (localStorage.getItem(k) === null) localStorage.setItem(k, v); }"
+                " } catch (e) {} }"
+            )
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+        return
+    driver.get(state.origin.rstrip("/") + "/robots.txt")
+    for cookie in state.cookies:
+        try:
+            driver.add_cookie(dict(cookie))
+        except Exception:
+            continue
+    if state.local_storage:
+        driver.execute_script(
+            "for (const [k, v] of Object.entries(arguments[0])) localStorage.setItem(k, v);",
+            state.local_storage,
+        )
@@ -15,13 +15,26 @@ class EnvConfig:
     base_url: str
     careers_url: str = "https://useinsider.com/careers/"
     qa_jobs_url: str = "https://useinsider.com/careers/quality-assurance/"
+    # Public Lever postings feed behind the careers page listing
+    positions_feed_url: str = "https://api.lever.co/v0/postings/useinsider?mode=json"
 
 
-def get_env_config(env: str | None = None) -> EnvConfig:
+def get_env_config(env: str | None = None, base_url: str | None = None) -> EnvConfig:
     env = (env or os.environ.get("TEST_ENV") or "qa").lower()
-    # Using public site, same across envs; pattern supports dev/uat if ever differ
-    base_url = "https://useinsider.com/"
-    return EnvConfig(name=env, base_url=base_url)
+    # Using public site, same across envs; pattern supports dev/uat if ever differ.
+    # BASE_URL (or base_url) points the suite elsewhere, e.g. at a local replay server.
+    base_url = base_url or os.environ.get("BASE_URL")
+    feed = {"positions_feed_url": os.environ["POSITIONS_FEED_URL"]} if os.environ.get("POSITIONS_FEED_URL") else {}
+    if not base_url:
+        return EnvConfig(name=env, base_url="https://useinsider.com/", **feed)
+    base_url = base_url.rstrip("/") + "/"
+    return EnvConfig(
+        name=env,
+        base_url=base_url,
+        careers_url=base_url + "careers/",
+        qa_jobs_url=base_url + "careers/quality-assurance/",
+        **feed,
+    )
 
 
 def get_notification_targets() -> dict:
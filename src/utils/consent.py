@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .browser_state import BrowserState, capture_state, inject_state, load_states, origin_of, save_states
+
+
+# OneTrust stores the consent decision in these cookies / storage keys
+CONSENT_COOKIE_PREFIXES = ("OptanonAlertBoxClosed", "OptanonConsent")
+CONSENT_STORAGE_PREFIXES = ("OptanonConsent", "onetrust")
+
+# One roundtrip: click the first visible banner control, return what was clicked (or null)
+_DISMISS_SCRIPT = """
+const visible = (el) => {
+  const r = el.getBoundingClientRect();
+  const st = getComputedStyle(el);
+  return r.width > 0 && r.height > 0 && st.visibility !== 'hidden' && st.display !== 'none' && !el.disabled;
+};
+const byText = (sel, text) => Array.from(document.querySelectorAll(sel))
+  .filter((el) => (el.textContent || '').replace(/\\s+/g, ' ').trim() === text);
+const candidates = [
+  ...document.querySelectorAll('#onetrust-accept-btn-handler, button[id*="onetrust-accept"]'),
+  ...byText('button', 'Accept All'),
+  ...document.querySelectorAll('a[id*="onetrust-accept"], a[class*="icon-close"]'),
+  ...byText('a', 'Accept All'),
+];
+const el = candidates.find(visible);
+if (!el) return null;
+el.click();
+return el.id || el.className || el.tagName;
+"""
+
+
+class ConsentStore:
+    """Cookie-consent state captured once per session (or pre-seeded from disk) and injected into
+    every new browser before its first navigation, so banner handling becomes a zero-wait check.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._states: Dict[str, BrowserState] = load_states(self.path) if self.path else {}
+        self._seeded: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def state_for(self, url: str) -> Optional[BrowserState]:
+        state = self._states.get(origin_of(url))
+        if state is None or state.is_expired():
+            return None
+        return state
+
+    def seed(self, driver: WebDriver, url: str) -> bool:
+        """Inject the stored consent for url's origin; returns True when the driver was seeded."""
+        state = self.state_for(url)
+        if state is None:
+            return False
+        try:
+            inject_state(driver, state)
+        except Exception:
+            return False
+        self._seeded.add(self._key(driver))
+        return True
+
+    def is_seeded(self, driver: WebDriver) -> bool:
+        return self._key(driver) in self._seeded
+
+    def capture(self, driver: WebDriver) -> Optional[BrowserState]:
+        try:
+            state = capture_state(driver, CONSENT_COOKIE_PREFIXES, CONSENT_STORAGE_PREFIXES)
+        except Exception:
+            return None
+        if not state.cookies and not state.local_storage:
+            return None
+        with self._lock:
+            self._states[state.origin] = state
+            if self.path:
+                save_states(self.path, self._states)
+        self._seeded.add(self._key(driver))
+        return state
+
+    def handle_banner(self, driver: WebDriver, timeout: float = 3, interval: float = 0.25) -> bool:
+        """Dismiss the consent banner if shown; returns True when something was clicked.
+
+        Seeded drivers get a single zero-wait check. Otherwise poll up to `timeout` and capture the
+        resulting consent state so every later browser in this session is seeded.
+        """
+        if self.is_seeded(driver):
+            return self._dismiss(driver)
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._dismiss(driver):
+                self.capture(driver)
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+
+    @staticmethod
+    def _key(driver: WebDriver) -> str:
+        # Per window: with --browser-contexts one session hosts many isolated user contexts
+        return f"{driver.session_id}:{driver.current_window_handle}"
+
+    @staticmethod
+    def _dismiss(driver: WebDriver) -> bool:
+        try:
+            return driver.execute_script(_DISMISS_SCRIPT) is not None
+        except Exception:
+            return False
+
+
+_store: Optional[ConsentStore] = None
+
+
+def get_consent_store() -> ConsentStore:
+    """Process-wide store (one per xdist worker); persisted to CONSENT_STATE_FILE."""
+    global _store
+    if _store is None:
+        _store = ConsentStore(Path(os.environ.get("CONSENT_STATE_FILE", ".state/consent.json")))
+    return _store
@@ -13,7 +13,29 @@ from selenium.webdriver.firefox.service import Service as FirefoxService
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 
-from .browser_downloader import ensure_chrome_for_testing, ensure_chromedriver_for_testing
+from .browser_downloader import (
+    ensure_chrome_for_testing,
+    ensure_chrome_headless_shell,
+    ensure_chromedriver_for_testing,
+)
+
+SUPPORTED_BROWSERS = ("chrome", "chrome-headless-shell", "firefox")
+
+# chrome-headless-shell is headless by construction; keep only what matters for a short-lived test session
+HEADLESS_SHELL_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+    "--metrics-recording-only",
+    "--disable-features=Translate,OptimizationHints,MediaRouter",
+)
 
 
 def _find_browser_binary(browser: str) -> Optional[str]:
@@ -39,6 +61,11 @@ def _find_browser_binary(browser: str) -> Optional[str]:
             for c in candidates:
                 if os.path.exists(c):
                     return c
+    elif browser == "chrome-headless-shell":
+        env_bin = os.environ.get("CHROME_HEADLESS_SHELL_BINARY")
+        if env_bin and os.path.exists(env_bin):
+            return env_bin
+        return shutil.which("chrome-headless-shell") or shutil.which("chrome-headless-shell.exe")
     elif browser == "firefox":
         env_bin = os.environ.get("FIREFOX_BINARY")
         if env_bin and os.path.exists(env_bin):
@@ -57,16 +84,61 @@ def _find_browser_binary(browser: str) -> Optional[str]:
     return None
 
 
+def _logging_prefs(performance_log: bool) -> dict:
+    # Console logs for failure artifacts; network/page events via driver.get_log("performance") on request
+    prefs = {"browser": "ALL"}
+    if performance_log:
+        prefs["performance"] = "ALL"
+    return prefs
+
+
+def _create_headless_shell(window_size: str, performance_log: bool, bidi: bool = False) -> webdriver.Chrome:
+    options = ChromeOptions()
+    options.enable_bidi = bidi
+    options.add_argument(f"--window-size={window_size}")
+    for arg in HEADLESS_SHELL_ARGS:
+        options.add_argument(arg)
+    options.set_capability("goog:loggingPrefs", _logging_prefs(performance_log))
+    shell_binary = _find_browser_binary("chrome-headless-shell")
+    driver_path = None
+    if not shell_binary:
+        auto_bin = ensure_chrome_headless_shell()
+        if auto_bin:
+            shell_binary = str(auto_bin)
+            driver_path = ensure_chromedriver_for_testing(auto_bin.parent.parent.name)
+    if not shell_binary:
+        raise RuntimeError(
+            "Failed to provision chrome-headless-shell. Set CHROME_HEADLESS_SHELL_BINARY to the executable, "
+            "ensure the Chrome for Testing feed is reachable, or use --browser chrome."
+        )
+    options.binary_location = shell_binary
+    try:
+        if driver_path and os.path.exists(driver_path):
+            return webdriver.Chrome(service=ChromeService(str(driver_path)), options=options)
+        return webdriver.Chrome(options=options)
+    except Exception as e:
+        raise RuntimeError(f"Failed to start chrome-headless-shell ({shell_binary}). Original error: {e}") from e
+
+
 def create_driver(
-    browser: Literal["chrome", "firefox"] = "chrome",
+    browser: Literal["chrome", "chrome-headless-shell", "firefox"] = "chrome",
     headless: bool = False,
     window_size: str = "1920,1080",
+    performance_log: bool = False,
+    bidi: bool = False,
 ) -> webdriver.Remote:
+    """Start a local browser session.
+
+    `bidi=True` requests a WebDriver BiDi connection (needed for isolated user contexts, see
+    src/utils/browser_contexts.py).
+    """
     browser = browser.lower()
-    if browser not in ("chrome", "firefox"):
-        raise ValueError("Unsupported browser. Use 'chrome' or 'firefox'.")
+    if browser not in SUPPORTED_BROWSERS:
+        raise ValueError("Unsupported browser. Use 'chrome', 'chrome-headless-shell' or 'firefox'.")
 
     width, height = map(int, window_size.split(","))
+    if browser == "chrome-headless-shell":
+        return _create_headless_shell(window_size, performance_log, bidi)
     # In CI, prefer headless by default unless explicitly disabled
     ci_mode = os.environ.get("CI", "").lower() == "true"
     env_headless_flag = os.environ.get("HEADLESS", "").lower() in ("1", "true", "yes")
@@ -74,12 +146,14 @@ def create_driver(
 
     if browser == "chrome":
         options = ChromeOptions()
+        options.enable_bidi = bidi
         options.add_argument(f"--window-size={window_size}")
         options.add_argument("--disable-gpu")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         if effective_headless:
             options.add_argument("--headless=new")
+        options.set_capability("goog:loggingPrefs", _logging_prefs(performance_log))
         chrome_binary = _find_browser_binary("chrome")
         portable_driver_path = None
         portable_mode = False
@@ -125,6 +199,7 @@ def create_driver(
         driver.set_window_size(width, height)
     else:
         options = FirefoxOptions()
+        options.enable_bidi = bidi
         if effective_headless:
             options.add_argument("-headless")
         firefox_binary = _find_browser_binary("firefox")
@@ -138,6 +213,7 @@ def create_driver(
             if not effective_headless:
                 try:
                     options_retry = FirefoxOptions()
+                    options_retry.enable_bidi = bidi
                     options_retry.add_argument("-headless")
                     if firefox_binary:
                         options_retry.binary = firefox_binary
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+import requests
+
+from .api_client import ApiClient
+
+LEVER_HOSTS = ("jobs.lever.co",)
+
+
+def effective_host(url: str) -> str:
+    """Host a URL stands for; replayed URLs (http://127.0.0.1:port/_h/<host>/...) map back to <host>."""
+    parts = urlsplit(url)
+    if parts.path.startswith("/_h/"):
+        return parts.path[len("/_h/"):].partition("/")[0].lower()
+    return parts.hostname or ""
+
+
+@dataclass
+class LinkCheck:
+    url: str
+    status: Optional[int] = None
+    final_url: str = ""
+    redirects: List[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    error: str = ""
+
+    def problem(self, allowed_hosts: Sequence[str]) -> Optional[str]:
+        """Why this link is broken, or None when it resolved to an allowed host with a 2xx status."""
+        if self.error:
+            return f"{self.url}: {self.error}"
+        if self.status is None or not 200 <= self.status < 300:
+            return f"{self.url}: HTTP {self.status} after {len(self.redirects)} redirects ({self.final_url})"
+        host = effective_host(self.final_url)
+        if not any(host == h or host.endswith("." + h) for h in allowed_hosts):
+            return f"{self.url}: ended on unexpected host '{host}' ({self.final_url})"
+        return None
+
+
+class LinkChecker:
+    """Checks many links concurrently over one shared connection pool.
+
+    Worker threads each use their own `ApiClient.clone()` (requests Sessions are not thread-safe,
+    same as PetPool) mounted on the client's pooled adapter, so keep-alive connections are reused
+    across threads. Each link is fetched with redirects followed; the chain, final status/URL and latency are kept
+    per link. Bodies are not downloaded (`stream=True`), only headers are awaited.
+    """
+
+    def __init__(
+        self,
+        client: Optional[ApiClient] = None,
+        max_workers: int = 8,
+        timeout: float = 15,
+        allowed_hosts: Sequence[str] = LEVER_HOSTS,
+    ):
+        self.client = client or ApiClient(base_url="", pool_size=max_workers)
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.allowed_hosts = tuple(allowed_hosts)
+        self._local = threading.local()
+        self._clients: List[ApiClient] = []
+        self._clients_lock = threading.Lock()
+
+    def _thread_client(self) -> ApiClient:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.client.clone()
+            with self._clients_lock:
+                self._clients.append(client)
+        return client
+
+    def check(self, url: str) -> LinkCheck:
+        result = LinkCheck(url=url)
+        start = time.perf_counter()
+        try:
+            with self._thread_client().get(url, allow_redirects=True, stream=True, timeout=self.timeout) as resp:
+                result.status = resp.status_code
+                result.final_url = resp.url
+                result.redirects = [f"{r.status_code} {r.url}" for r in resp.history]
+        except requests.RequestException as e:
+            result.error = f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"
+        result.elapsed_ms = (time.perf_counter() - start) * 1000.0
+        return result
+
+    def check_all(self, urls: Iterable[str]) -> List[LinkCheck]:
+        """Results in input order; duplicate URLs are fetched once."""
+        urls = list(urls)
+        unique = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="links") as pool:
+            by_url = dict(zip(unique, pool.map(self.check, unique)))
+        return [by_url[u] for u in urls]
+
+    def problems(self, results: Iterable[LinkCheck]) -> List[str]:
+        return [p for p in (r.problem(self.allowed_hosts) for r in results) if p]
+
+    def close(self) -> None:
+        with self._clients_lock:
+            clients, self._clients = self._clients, []
+        for client in clients + [self.client]:
+            client.session.close()
+
+
+def latency_report(results: Sequence[LinkCheck]) -> str:
+    """Plain-text table: one line per link (slowest first) plus a percentile summary."""
+    if not results:
+        return "no links checked"
+    rows = sorted(results, key=lambda r: r.elapsed_ms, reverse=True)
+    lines = [f"{'ms':>8}  {'status':>6}  {'hops':>4}  url"]
+    for r in rows:
+        lines.append(f"{r.elapsed_ms:8.1f}  {r.status if r.status is not None else 'ERR':>6}  {len(r.redirects):>4}  {r.url}")
+    ordered = sorted(r.elapsed_ms for r in results)
+
+    def pct(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    lines.append(f"links={len(results)} p50={pct(0.5):.1f}ms p95={pct(0.95):.1f}ms max={ordered[-1]:.1f}ms")
+    return "\n".join(lines)
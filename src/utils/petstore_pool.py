@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import os
+import queue
+import random
+import string
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Set
+
+from .api_client import ApiClient
+
+
+class IdAllocator:
+    """Collision-free pet IDs: run slot (shared by all xdist workers of a run) + worker number + counter.
+
+    IDs stay below 2**53 so they survive JSON round-trips through JavaScript-based backends.
+    """
+
+    def __init__(self, run_id: Optional[str] = None, worker_id: Optional[str] = None):
+        run_id = run_id or os.environ.get("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+        worker_id = worker_id or os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+        worker_num = int(worker_id[2:]) if worker_id[2:].isdigit() else 0
+        run_slot = int(hashlib.sha256(run_id.encode()).hexdigest(), 16) % 900_000 + 100_000
+        self._base = (run_slot * 1000 + worker_num % 1000) * 100_000
+        self._counter = itertools.count(1)
+
+    def next_id(self) -> int:
+        n = next(self._counter)
+        if n >= 100_000:
+            raise RuntimeError("Pet ID space for this worker is exhausted")
+        return self._base + n
+
+
+@dataclass
+class PoolStats:
+    seeded: int = 0
+    create_failures: int = 0
+    on_demand: int = 0
+    provision_seconds: float = 0.0
+    sequential_seconds: float = 0.0
+    deleted: int = 0
+    delete_failures: int = 0
+    cleanup_seconds: float = 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """Setup time not spent inside tests: serial create+verify cost minus concurrent wall time."""
+        return max(0.0, self.sequential_seconds - self.provision_seconds)
+
+    def to_dict(self) -> dict:
+        return dict(asdict(self), saved_seconds=self.saved_seconds)
+
+
+def rand_name(prefix: str = "pet") -> str:
+    return f"{prefix}-" + "".join(random.choices(string.ascii_lowercase + string.digits, k=6))
+
+
+class PetPool:
+    """Session-level pool of pre-created, verified pets.
+
+    Seeds are created concurrently before tests need them and handed out exclusively via `acquire()`.
+    Released and unused pets, plus any IDs registered with `new_id()`, are deleted by a background
+    thread that runs during the session and is drained at session end.
+    """
+
+    def __init__(
+        self,
+        client: ApiClient,
+        allocator: Optional[IdAllocator] = None,
+        max_workers: int = 8,
+        poll_attempts: int = 3,
+        poll_interval: float = 0.5,
+    ):
+        self.client = client
+        self.allocator = allocator or IdAllocator()
+        self.max_workers = max_workers
+        self.poll_attempts = poll_attempts
+        self.poll_interval = poll_interval
+        self.stats = PoolStats()
+        self._available: "queue.Queue[dict]" = queue.Queue()
+        self._tracked: Set[int] = set()
+        self._tracked_lock = threading.Lock()
+        self._local = threading.local()
+        self._deletes: "queue.Queue[Optional[int]]" = queue.Queue()
+        self._cleaner: Optional[threading.Thread] = None
+
+    # Each thread gets its own requests.Session (Session objects are not thread-safe)
+    def _thread_client(self) -> ApiClient:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self.client.clone()
+            self._local.client = client
+        return client
+
+    def new_id(self) -> int:
+        """Allocate an ID for a pet the test creates itself; it is deleted at session end."""
+        pet_id = self.allocator.next_id()
+        with self._tracked_lock:
+            self._tracked.add(pet_id)
+        return pet_id
+
+    def _create(self) -> tuple[dict, float]:
+        client = self._thread_client()
+        start = time.perf_counter()
+        payload = {"id": self.new_id(), "name": rand_name(), "status": "available"}
+        resp = client.post("/pet", json=payload)
+        resp.raise_for_status()
+        # Wait until the pet is readable so tests never need their own create -> poll-get loop
+        for _ in range(self.poll_attempts):
+            if client.get(f"/pet/{payload['id']}").status_code == 200:
+                break
+            time.sleep(self.poll_interval)
+        return payload, time.perf_counter() - start
+
+    def provision(self, count: int) -> None:
+        if count <= 0:
+            return
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, count)) as pool:
+            futures = [pool.submit(self._create) for _ in range(count)]
+            for fut in futures:
+                try:
+                    payload, elapsed = fut.result()
+                except Exception:
+                    # Tests fall back to on-demand creation; the summary shows how many seeds were lost
+                    self.stats.create_failures += 1
+                    continue
+                self._available.put(payload)
+                self.stats.seeded += 1
+                self.stats.sequential_seconds += elapsed
+        self.stats.provision_seconds += time.perf_counter() - start
+
+    def acquire(self) -> dict:
+        try:
+            return self._available.get_nowait()
+        except queue.Empty:
+            self.stats.on_demand += 1
+            payload, _ = self._create()
+            return payload
+
+    def release(self, pet_id: int) -> None:
+        """Queue a pet for background deletion as soon as its test is done with it."""
+        with self._tracked_lock:
+            self._tracked.discard(pet_id)
+        self._ensure_cleaner()
+        self._deletes.put(pet_id)
+
+    def _ensure_cleaner(self) -> None:
+        if self._cleaner is None:
+            self._cleaner = threading.Thread(target=self._cleanup_loop, name="pet-pool-cleanup", daemon=True)
+            self._cleaner.start()
+
+    def _cleanup_loop(self) -> None:
+        client = self._thread_client()
+        while True:
+            pet_id = self._deletes.get()
+            if pet_id is None:
+                return
+            start = time.perf_counter()
+            try:
+                resp = client.delete(f"/pet/{pet_id}")
+                # 404: the test already deleted it
+                if resp.status_code in (200, 404):
+                    self.stats.deleted += 1
+                else:
+                    self.stats.delete_failures += 1
+            except Exception:
+                self.stats.delete_failures += 1
+            finally:
+                self.stats.cleanup_seconds += time.perf_counter() - start
+
+    def close(self, timeout: float = 30.0) -> None:
+        """Delete everything still tracked (unused seeds, test-created pets) and stop the cleaner."""
+        with self._tracked_lock:
+            remaining: List[int] = sorted(self._tracked)
+            self._tracked.clear()
+        self._ensure_cleaner()
+        for pet_id in remaining:
+            self._deletes.put(pet_id)
+        self._deletes.put(None)
+        self._cleaner.join(timeout)
+
+    def summary(self) -> Dict[str, float]:
+        return self.stats.to_dict()
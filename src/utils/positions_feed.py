@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .api_client import ApiClient
+
+
+def _norm(text: str) -> str:
+    return re.sub(r"\s+", " ", text or "").strip().lower()
+
+
+def posting_id(url: str) -> str:
+    """Lever posting id: last path segment of a hosted/apply URL (also for replayed URLs)."""
+    path = urlsplit(url or "").path.rstrip("/")
+    if path.endswith("/apply"):
+        path = path[: -len("/apply")]
+    return path.rsplit("/", 1)[-1]
+
+
+@dataclass(frozen=True)
+class Posting:
+    id: str
+    title: str
+    team: str
+    location: str
+    all_locations: Tuple[str, ...] = ()
+    hosted_url: str = ""
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Posting":
+        categories = data.get("categories") or {}
+        location = categories.get("location") or ""
+        return cls(
+            id=str(data.get("id") or posting_id(data.get("hostedUrl", ""))),
+            title=data.get("text") or "",
+            # The careers page labels Lever's team as the department
+            team=categories.get("team") or categories.get("department") or "",
+            location=location,
+            all_locations=tuple(categories.get("allLocations") or ([location] if location else [])),
+            hosted_url=data.get("hostedUrl") or "",
+        )
+
+
+@dataclass
+class FeedDiff:
+    department: str
+    location: str
+    expected: int = 0
+    rendered: int = 0
+    missing: List[Posting] = field(default_factory=list)
+    unexpected: List[str] = field(default_factory=list)
+    mismatched: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.unexpected or self.mismatched)
+
+    def report(self) -> str:
+        lines = [
+            f"filter: department~'{self.department}' location~'{self.location}'",
+            f"feed postings: {self.expected}, rendered cards: {self.rendered}",
+        ]
+        lines += [f"missing from page: {p.title} [{p.team} / {p.location}] {p.hosted_url}" for p in self.missing]
+        lines += [f"not in feed selection: {u}" for u in self.unexpected]
+        lines += [f"field mismatch: {m}" for m in self.mismatched]
+        return "\n".join(lines)
+
+
+class PositionsFeed:
+    """Lever postings indexed by (team, location) and by posting id, for diffing the rendered listing."""
+
+    def __init__(self, postings: Iterable[Posting]):
+        self.postings = list(postings)
+        self.by_id: Dict[str, Posting] = {p.id: p for p in self.postings}
+        self.index: Dict[Tuple[str, str], List[Posting]] = {}
+        for p in self.postings:
+            for location in p.all_locations or (p.location,):
+                self.index.setdefault((_norm(p.team), _norm(location)), []).append(p)
+
+    @classmethod
+    def fetch(cls, url: str, client: Optional[ApiClient] = None, timeout: float = 30) -> "PositionsFeed":
+        """Download and index the feed at `url` (`EnvConfig.positions_feed_url`).
+
+        A client created here is closed afterwards; a passed-in client is left open for the caller.
+        """
+        owned = client is None
+        client = client or ApiClient(base_url="")
+        try:
+            resp = client.get(url, timeout=timeout)
+            resp.raise_for_status()
+            return cls(Posting.from_json(item) for item in resp.json())
+        finally:
+            if owned:
+                client.session.close()
+
+    def select(self, department: str, location: str) -> List[Posting]:
+        """Postings whose team contains `department` and any location contains `location` (case-insensitive)."""
+        dept, loc = _norm(department), _norm(location)
+        seen: Dict[str, Posting] = {}
+        for (team, where), postings in self.index.items():
+            if dept in team and loc in where:
+                for p in postings:
+                    seen.setdefault(p.id, p)
+        return list(seen.values())
+
+    def diff(self, cards: Sequence, department: str, location: str) -> FeedDiff:
+        """Compare rendered cards (objects with title/department/location/href) with the feed selection."""
+        expected = {p.id: p for p in self.select(department, location)}
+        result = FeedDiff(department, location, expected=len(expected), rendered=len(cards))
+        rendered_ids = set()
+        for card in cards:
+            pid = posting_id(card.href)
+            rendered_ids.add(pid)
+            posting = expected.get(pid)
+            if posting is None:
+                result.unexpected.append(f"{card.title} [{card.department} / {card.location}] {card.href}")
+                continue
+            if _norm(card.title) != _norm(posting.title):
+                result.mismatched.append(f"{pid} title '{card.title}' != '{posting.title}'")
+            if _norm(card.department) != _norm(posting.team):
+                result.mismatched.append(f"{pid} department '{card.department}' != '{posting.team}'")
+            if _norm(card.location) not in {_norm(posting.location), *map(_norm, posting.all_locations)}:
+                result.mismatched.append(f"{pid} location '{card.location}' != '{posting.location}'")
+        result.missing = [p for pid, p in expected.items() if pid not in rendered_ids]
+        return result
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import math
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+def _children_map() -> Dict[int, List[int]]:
+    children: Dict[int, List[int]] = {}
+    for stat in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            # Fields after the command name, which is wrapped in parentheses and may contain spaces
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+            children.setdefault(int(fields[1]), []).append(int(stat.parent.name))
+        except (OSError, IndexError, ValueError):
+            continue
+    return children
+
+
+def _rss_linux(pid: int) -> int:
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss(pid: int, include_root: bool = True) -> Optional[int]:
+    """Resident memory (bytes) of pid and all its descendants; None when it cannot be measured.
+
+    Uses psutil when installed, /proc on Linux otherwise.
+    """
+    try:
+        import psutil  # optional
+
+        root = psutil.Process(pid)
+        procs = root.children(recursive=True) + ([root] if include_root else [])
+        total = 0
+        for p in procs:
+            try:
+                total += p.memory_info().rss
+            except psutil.Error:
+                continue
+        return total
+    except ImportError:
+        pass
+    except Exception:
+        return None
+    if not Path("/proc").is_dir():
+        return None
+    children = _children_map()
+    stack, total = list(children.get(pid, [])), _rss_linux(pid) if include_root else 0
+    while stack:
+        child = stack.pop()
+        total += _rss_linux(child)
+        stack.extend(children.get(child, []))
+    return total
+
+
+def driver_browser_rss(driver) -> Optional[int]:
+    """RSS of the browser processes behind a local WebDriver session (driver binary excluded)."""
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    if process is None:
+        return None
+    return process_tree_rss(process.pid, include_root=False)
+
+
+def _cgroup_memory_headroom() -> Optional[int]:
+    """Bytes left under the cgroup memory limit (containers, CI runners); None when unlimited/unknown."""
+    for limit_file, usage_file in (
+        ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory.current"),
+        ("/sys/fs/cgroup/memory/memory.limit_in_bytes", "/sys/fs/cgroup/memory/memory.usage_in_bytes"),
+    ):
+        try:
+            limit = Path(limit_file).read_text().strip()
+            usage = int(Path(usage_file).read_text().strip())
+        except (OSError, ValueError):
+            continue
+        # cgroup v1 reports "unlimited" as a huge page-aligned number
+        if limit == "max" or int(limit) >= 1 << 60:
+            return None
+        return max(0, int(limit) - usage)
+    return None
+
+
+def available_memory() -> Optional[int]:
+    """Bytes of memory available to new processes (host MemAvailable capped by a cgroup limit)."""
+    available = None
+    try:
+        import psutil  # optional
+
+        available = psutil.virtual_memory().available
+    except ImportError:
+        try:
+            for line in Path("/proc/meminfo").read_text().splitlines():
+                if line.startswith("MemAvailable:"):
+                    available = int(line.split()[1]) * 1024
+                    break
+        except OSError:
+            pass
+    headroom = _cgroup_memory_headroom()
+    if headroom is not None:
+        available = headroom if available is None else min(available, headroom)
+    return available
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: affinity mask, capped by a cgroup v2 CPU quota."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return max(1, cpus)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .auth import get_auth_token
+from .browser_state import BrowserState, capture_state, inject_state, load_states, origin_of, save_states
+
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """`exp` claim of a JWT (no signature check), or None for opaque tokens."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        return float(exp) if exp else None
+    except Exception:
+        return None
+
+
+def token_fingerprint(token: str) -> str:
+    """Stable, non-reversible id of a token, used to detect rotation of the token the state was built from.
+
+    The token itself is still part of the state (cookie/storage values), which save_states() writes
+    owner-only (0600).
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+class AuthStateCache:
+    """Turns an API token (or a one-time UI login) into browser cookies/storage, cached per env on disk.
+
+    Injection is opt-in: the driver fixture calls `apply()` only for tests marked `authenticated`,
+    or for every test when `AUTH_COOKIE_NAME` is set explicitly (`opted_in`), so the API credential
+    is never sent to a site that did not ask for it. Expired state is rebuilt from
+    `get_auth_token(force_refresh=True)`; state built from a token that has since been rotated is
+    rebuilt from the current one.
+    """
+
+    def __init__(
+        self,
+        env_name: str,
+        directory: Path | str = ".state",
+        cookie_name: Optional[str] = None,
+        storage_key: Optional[str] = None,
+        ttl: Optional[float] = None,
+        refresh_margin: float = 60.0,
+    ):
+        self.path = Path(directory) / f"auth-{env_name}.json"
+        self.opted_in = bool(cookie_name or os.environ.get("AUTH_COOKIE_NAME"))
+        self.cookie_name = cookie_name or os.environ.get("AUTH_COOKIE_NAME", "auth_token")
+        self.storage_key = storage_key or os.environ.get("AUTH_STORAGE_KEY") or None
+        self.ttl = ttl if ttl is not None else float(os.environ.get("AUTH_STATE_TTL", "3600"))
+        self.refresh_margin = refresh_margin
+        self._states: Dict[str, BrowserState] = load_states(self.path)
+        self._lock = threading.Lock()
+
+    def from_token(self, token: str, origin: str) -> BrowserState:
+        expires_at = _jwt_expiry(token) or time.time() + self.ttl
+        cookie = {
+            "name": self.cookie_name,
+            "value": token,
+            "path": "/",
+            "secure": origin.startswith("https://"),
+            "expiry": int(expires_at),
+        }
+        storage = {self.storage_key: token} if self.storage_key else {}
+        return BrowserState(
+            origin=origin,
+            cookies=[cookie],
+            local_storage=storage,
+            expires_at=expires_at,
+            token_fingerprint=token_fingerprint(token),
+        )
+
+    def get_state(self, url: str) -> Optional[BrowserState]:
+        """Valid cached state for url's origin, rebuilt from the API token when missing, expiring or stale."""
+        origin = origin_of(url)
+        with self._lock:
+            state = self._states.get(origin)
+            fresh = state is not None and not state.is_expired(self.refresh_margin)
+            if fresh and state.token_fingerprint is None:
+                return state  # captured from a UI login, not derived from a token
+            token = get_auth_token(force_refresh=state is not None and not fresh)
+            if not token:
+                return None
+            if fresh and state.token_fingerprint == token_fingerprint(token):
+                return state
+            state = self.from_token(token, origin)
+            self._store(state)
+            return state
+
+    def apply(self, driver: WebDriver, url: str, login: Optional[Callable[[WebDriver], None]] = None) -> bool:
+        """Inject auth state for url's origin into driver; returns True if the browser is authenticated.
+
+        Without a token, `login` (a one-time UI login against the same driver) is run once and the
+        resulting cookies/storage are captured for every later test in this env.
+        """
+        state = self.get_state(url)
+        if state is None and login is not None:
+            login(driver)
+            state = capture_state(driver)
+            if state.expires_at is None:
+                state.expires_at = time.time() + self.ttl
+            with self._lock:
+                self._store(state)
+            return True
+        if state is None:
+            return False
+        inject_state(driver, state)
+        return True
+
+    def invalidate(self, url: str) -> None:
+        """Drop cached state (e.g. after the app rejected it) so the next apply() refreshes."""
+        with self._lock:
+            if self._states.pop(origin_of(url), None) is not None:
+                save_states(self.path, self._states)
+
+    def _store(self, state: BrowserState) -> None:
+        self._states[state.origin] = state
+        save_states(self.path, self._states)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+Event = Tuple[float, str, str, Dict[str, object]]
+
+
+class Tracer:
+    """In-memory ring buffer of structured events, formatted only when someone asks (a failing test).
+
+    `event()` stores a timestamp, a category, a name and the raw field values; nothing is formatted
+    or sent anywhere on the happy path. `defer()` registers expensive debug collection (e.g. a dump
+    of the rendered cards) that only runs from `collect_deferred()`, i.e. on failure while the
+    browser is still alive.
+    """
+
+    def __init__(self, capacity: int = 512):
+        self._events: Deque[Event] = deque(maxlen=capacity)
+        self._deferred: Dict[str, Callable[[], object]] = {}
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self.dropped = 0
+
+    def event(self, category: str, name: str, **fields) -> None:
+        if len(self._events) == self._events.maxlen:
+            self.dropped += 1
+        self._events.append((time.perf_counter(), category, name, fields))
+
+    def defer(self, name: str, collect: Callable[[], object]) -> None:
+        """Register (or replace) a failure-time collector; only the latest one per name is kept."""
+        with self._lock:
+            self._deferred[name] = collect
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._deferred.clear()
+            self._start = time.perf_counter()
+            self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def events(self) -> List[Event]:
+        return list(self._events)
+
+    def collect_deferred(self) -> None:
+        """Run deferred collectors and record their results (or errors) as `deferred` events."""
+        with self._lock:
+            deferred, self._deferred = self._deferred, {}
+        for name, collect in deferred.items():
+            try:
+                self.event("deferred", name, result=collect())
+            except Exception as e:
+                self.event("deferred", name, error=f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}")
+
+    def format(self) -> str:
+        lines = []
+        if self.dropped:
+            lines.append(f"... {self.dropped} older events dropped (capacity {self._events.maxlen})")
+        for ts, category, name, fields in self.events():
+            detail = " ".join(f"{k}={v!r}" for k, v in fields.items())
+            lines.append(f"+{ts - self._start:8.3f}s [{category}] {name} {detail}".rstrip())
+        return "\n".join(lines)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer (one per xdist worker; tests run one at a time per worker)."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import random
-import string
 import time
 import pytest
 import allure
@@ -10,26 +8,25 @@ from src.utils.api_assertions import (
     assert_status,
     assert_json_field_equals,
     assert_json_has_keys,
+    assert_response_schema,
 )
-
-
-def _rand_name(prefix: str = "pet") -> str:
-    return f"{prefix}-" + "".join(random.choices(string.ascii_lowercase + string.digits, k=6))
+from src.utils.petstore_pool import rand_name
 
 
 @allure.feature("Petstore API")
 @pytest.mark.api
 @pytest.mark.smoke
-def test_create_pet_happy(api_client):
-    pet_id = random.randint(1000000, 9999999)
+def test_create_pet_happy(api_client, pet_pool):
+    pet_id = pet_pool.new_id()
     payload = {
         "id": pet_id,
-        "name": _rand_name(),
+        "name": rand_name(),
         "status": "available",
     }
     resp = api_client.post("/pet", json=payload)
     assert_status(resp, 200, "Create pet should return 200")
     assert_json_has_keys(resp, ["id", "name", "status"])
+    assert_response_schema(resp)
     assert_json_field_equals(resp, "id", pet_id)
     assert_json_field_equals(resp, "name", payload["name"])
 
@@ -37,53 +34,31 @@ def test_create_pet_happy(api_client):
 @allure.feature("Petstore API")
 @pytest.mark.api
 @pytest.mark.smoke
-def test_get_pet_happy(api_client):
-    # Create first
-    pet_id = random.randint(1000000, 9999999)
-    payload = {"id": pet_id, "name": _rand_name(), "status": "available"}
-    r = api_client.post("/pet", json=payload)
-    assert_status(r, 200, "Create before get should succeed")
-    assert_json_has_keys(r, ["id", "name", "status"])
-    body = r.json()
-    got_id = body.get("id", pet_id)
-    # small retry for eventual consistency
-    for _ in range(3):
-        resp = api_client.get(f"/pet/{got_id}")
-        if resp.status_code == 200:
-            break
-        time.sleep(0.5)
+def test_get_pet_happy(api_client, pet):
+    # Pool pets are already created and verified readable
+    resp = api_client.get(f"/pet/{pet['id']}")
     assert_status(resp, 200, "Get pet should return 200 after creation")
-    assert_json_field_equals(resp, "id", got_id)
+    assert_response_schema(resp)
+    assert_json_field_equals(resp, "id", pet["id"])
+    assert_json_field_equals(resp, "name", pet["name"])
 
 
 @allure.feature("Petstore API")
 @pytest.mark.api
 @pytest.mark.smoke
-def test_update_pet_happy(api_client):
-    pet_id = random.randint(1000000, 9999999)
-    payload = {"id": pet_id, "name": _rand_name(), "status": "available"}
-    r = api_client.post("/pet", json=payload)
-    assert_status(r, 200, "Create before update should succeed")
-    update_payload = {"id": pet_id, "name": _rand_name("updated"), "status": "pending"}
+def test_update_pet_happy(api_client, pet):
+    update_payload = {"id": pet["id"], "name": rand_name("updated"), "status": "pending"}
     resp = api_client.put("/pet", json=update_payload)
     assert_status(resp, 200, "Update pet should be 200")
+    assert_response_schema(resp)
     assert_json_field_equals(resp, "status", "pending")
 
 
 @allure.feature("Petstore API")
 @pytest.mark.api
 @pytest.mark.smoke
-def test_delete_pet_happy(api_client):
-    pet_id = random.randint(1000000, 9999999)
-    payload = {"id": pet_id, "name": _rand_name(), "status": "available"}
-    r = api_client.post("/pet", json=payload)
-    assert_status(r, 200, "Create before delete should succeed")
-    # ensure created before delete
-    for _ in range(3):
-        g = api_client.get(f"/pet/{pet_id}")
-        if g.status_code == 200:
-            break
-        time.sleep(0.5)
+def test_delete_pet_happy(api_client, pet):
+    pet_id = pet["id"]
     resp = api_client.delete(f"/pet/{pet_id}")
     assert_status(resp, 200, "Delete pet should return 200")
     # Confirm delete with small retry
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / ".github" / "scripts" / "allure_summary.py"
+
+
+@pytest.fixture(scope="module")
+def allure_summary():
+    spec = importlib.util.spec_from_file_location("allure_summary", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    # Scripts are not a package; dataclasses need the module registered to resolve annotations
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    yield module
+    sys.modules.pop(spec.name, None)
+
+
+def _result(path: Path, uuid: str, history: str, status: str, start: int, steps: list) -> None:
+    data = {
+        "uuid": uuid,
+        "historyId": history,
+        "name": history,
+        "fullName": f"tests.api#{history}",
+        "status": status,
+        "start": start,
+        "stop": start + 1000,
+        "steps": steps,
+        "attachments": [{"name": "log", "source": f"{uuid}-attachment.txt", "type": "text/plain"}],
+        "statusDetails": {"message": "AssertionError: boom"} if status == "failed" else {},
+    }
+    (path / f"{uuid}-result.json").write_text(json.dumps(data))
+
+
+@pytest.mark.unit
+def test_summary_folds_retries_and_highlights_slowest_steps(tmp_path, allure_summary):
+    results = tmp_path / "allure-results"
+    results.mkdir()
+    slow_step = {"name": "Create pet", "status": "passed", "start": 0, "stop": 4200, "steps": []}
+    fast_step = {"name": "Get pet", "status": "passed", "start": 0, "stop": 15, "steps": []}
+    _result(results, "a1", "test_crud", "failed", 100, [fast_step])
+    _result(results, "a2", "test_crud", "passed", 5000, [slow_step, fast_step])
+    _result(results, "b1", "test_find", "failed", 200, [fast_step])
+    (results / "c-container.json").write_text(
+        json.dumps({"children": ["b1"], "befores": [{"name": "pet_pool", "start": 0, "stop": 9000}]})
+    )
+    (results / "broken-result.json").write_text("{not json")
+
+    out = tmp_path / "summary" / "index.html"
+    md = tmp_path / "summary.md"
+    assert allure_summary.main([str(results), "--html", str(out), "--markdown", str(md), "--top", "2"]) == 0
+
+    tests, slow = allure_summary.collect(str(results), 2)
+    assert [(t.name, t.status, t.attempts) for t in tests] == [("test_crud", "passed", 2), ("test_find", "failed", 1)]
+    assert slow.rows() == [(9000, "[setup] pet_pool", "tests.api#test_find"), (4200, "Create pet", "tests.api#test_crud")]
+
+    page = out.read_text()
+    assert "Create pet" in page and "2 attempts" in page
+    assert 'href="../allure-results/a2-attachment.txt"' in page
+    summary = md.read_text()
+    assert "passed: 1 | failed: 1" in summary
+    assert "**tests.api#test_find** (failed, 1.00s) AssertionError: boom" in summary
+
+
+@pytest.mark.unit
+def test_missing_results_dir_is_not_an_error(tmp_path, allure_summary):
+    out = tmp_path / "summary" / "index.html"
+    assert allure_summary.main([str(tmp_path / "allure-results"), "--html", str(out)]) == 0
+    assert not out.exists()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import base64
+
+import pytest
+
+from src.utils.artifacts import ArtifactCollector
+
+
+class FakeDriver:
+    log_types = ["browser"]
+
+    def __init__(self, dom: str):
+        self.page_source = dom
+
+    def get_screenshot_as_base64(self):
+        return base64.b64encode(b"\x89PNG fake").decode()
+
+    def execute_script(self, script):
+        return [{"name": "https://useinsider.com/", "type": "navigation", "duration": 120}]
+
+    def get_log(self, kind):
+        if kind != "browser":
+            raise ValueError(kind)
+        return [{"level": "SEVERE", "message": "boom"}]
+
+
+class NoLogsDriver(FakeDriver):
+    log_types = []
+
+    def get_log(self, kind):
+        raise NotImplementedError("get_log is not supported")
+
+
+@pytest.mark.unit
+def test_collect_compresses_large_text_and_respects_budget():
+    collector = ArtifactCollector(budget_bytes=4096, compress_over=256)
+    manifest = collector.process(collector.grab(FakeDriver("<p>x</p>" * 20000)), "t1")
+    assert manifest["screenshot"].endswith("(png)")
+    assert manifest["console"].endswith("(json)")
+    # 160 KB of repetitive HTML gzips far below the remaining budget
+    assert manifest["dom"].endswith("(html.gz)")
+
+
+@pytest.mark.unit
+def test_collect_skips_over_budget_and_notes_unavailable_logs():
+    collector = ArtifactCollector(budget_bytes=300, compress_over=10**9)
+    manifest = collector.process(collector.grab(NoLogsDriver("<p>" + "y" * 5000 + "</p>")), "t2")
+    assert manifest["dom"].startswith("skipped")
+    assert manifest["console"].startswith("unavailable")
+
+
+@pytest.mark.unit
+def test_collect_processes_on_background_thread():
+    job = ArtifactCollector().collect(FakeDriver("<p/>"), "t3")
+    assert job.name == "artifacts-t3"
+    job.join(timeout=5)
+    assert not job.is_alive()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import os
+import stat
+
+import pytest
+
+from src.utils.session_state import AuthStateCache
+
+URL = "https://useinsider.com/careers/"
+
+
+@pytest.mark.unit
+def test_state_rebuilt_when_token_rotates(monkeypatch, tmp_path):
+    monkeypatch.delenv("AUTH_TOKEN_URL", raising=False)
+    monkeypatch.delenv("AUTH_COOKIE_NAME", raising=False)
+    monkeypatch.setenv("API_TOKEN", "old-token")
+    cache = AuthStateCache("qa", directory=tmp_path, ttl=3600)
+    assert not cache.opted_in
+
+    first = cache.get_state(URL)
+    assert first.cookies[0]["value"] == "old-token"
+    assert cache.get_state(URL) is first
+    # Another worker/session reading the disk cache sees the same token fingerprint
+    assert AuthStateCache("qa", directory=tmp_path).get_state(URL).token_fingerprint == first.token_fingerprint
+
+    monkeypatch.setenv("API_TOKEN", "new-token")
+    rotated = AuthStateCache("qa", directory=tmp_path).get_state(URL)
+    assert rotated.cookies[0]["value"] == "new-token"
+    assert rotated.token_fingerprint != first.token_fingerprint
+    assert "new-token" not in rotated.token_fingerprint
+    if os.name != "nt":
+        # The persisted state contains the token, so it must not be readable by other users
+        assert stat.S_IMODE((tmp_path / "auth-qa.json").stat().st_mode) == 0o600
+
+
+@pytest.mark.unit
+def test_injection_opt_in_follows_explicit_cookie_name(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUTH_COOKIE_NAME", "session")
+    assert AuthStateCache("qa", directory=tmp_path).opted_in
+    monkeypatch.delenv("AUTH_COOKIE_NAME")
+    assert AuthStateCache("qa", directory=tmp_path, cookie_name="sid").opted_in
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import errno
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils import auth
+from src.utils.auth import TokenProvider, _FileLock
+
+
+class FakeTokenEndpoint(BaseHTTPRequestHandler):
+    hits = 0
+    expires_in = 3600
+    delay = 0.0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.lock:
+            type(self).hits += 1
+            n = type(self).hits
+        time.sleep(self.delay)
+        body = json.dumps({"access_token": f"token-{n}", "expires_in": self.expires_in}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def token_url(local_server):
+    handler = type("Endpoint", (FakeTokenEndpoint,), {"hits": 0, "expires_in": 3600, "delay": 0.0})
+    url = local_server(handler) + "/oauth/token"
+    return url, handler
+
+
+def _provider(url, tmp_path, **kwargs):
+    return TokenProvider(url, client_id="cid", client_secret="secret", cache_path=tmp_path / "cache.json", **kwargs)
+
+
+@pytest.mark.unit
+def test_token_cached_in_memory_and_on_disk(token_url, tmp_path):
+    url, endpoint = token_url
+    first = _provider(url, tmp_path)
+    assert first.get_token() == "token-1"
+    assert first.get_token() == "token-1"
+    # A second provider (another xdist worker) reuses the on-disk token
+    assert _provider(url, tmp_path).get_token() == "token-1"
+    assert endpoint.hits == 1
+
+
+@pytest.mark.unit
+def test_short_lived_token_reused_until_half_its_lifetime(token_url, tmp_path):
+    url, endpoint = token_url
+    endpoint.expires_in = 30
+    provider = _provider(url, tmp_path, refresh_margin=60)
+    # TTL below the margin: the margin is clamped to ttl/2, so the token is reused, not re-fetched
+    assert provider.get_token() == "token-1"
+    assert provider.get_token() == "token-1"
+    assert _provider(url, tmp_path, refresh_margin=60).get_token() == "token-1"
+    assert endpoint.hits == 1
+
+
+@pytest.mark.unit
+def test_token_refreshed_before_expiry(token_url, tmp_path):
+    url, endpoint = token_url
+    endpoint.expires_in = 1
+    provider = _provider(url, tmp_path, refresh_margin=60)
+    assert provider.get_token() == "token-1"
+    time.sleep(0.6)
+    # Past half of its 1s lifetime: refreshed proactively, before it actually expires
+    assert provider.get_token() == "token-2"
+    assert endpoint.hits == 2
+
+
+@pytest.mark.unit
+def test_force_refresh_is_single_flight_across_providers(token_url, tmp_path):
+    url, endpoint = token_url
+    a, b = _provider(url, tmp_path), _provider(url, tmp_path)
+    assert a.get_token() == b.get_token() == "token-1"
+    assert a.get_token(force_refresh=True) == "token-2"
+    # b also saw token-1 rejected; a already refreshed it, so b picks token-2 up from disk
+    assert b.get_token(force_refresh=True) == "token-2"
+    assert endpoint.hits == 2
+
+
+@pytest.mark.unit
+def test_concurrent_first_fetch_hits_endpoint_once(token_url, tmp_path):
+    url, endpoint = token_url
+    endpoint.delay = 0.2
+    providers = [_provider(url, tmp_path) for _ in range(6)]
+    results = []
+    threads = [threading.Thread(target=lambda p=p: results.append(p.get_token())) for p in providers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == ["token-1"] * 6
+    assert endpoint.hits == 1
+
+
+@pytest.mark.unit
+def test_windows_lock_waits_only_for_contention_and_is_bounded(monkeypatch, tmp_path):
+    failures = []
+
+    def locking(fd, mode, nbytes):
+        raise OSError(failures[0], "locking failed")
+
+    monkeypatch.setitem(sys.modules, "msvcrt", SimpleNamespace(locking=locking, LK_NBLCK=2, LK_UNLCK=0))
+    monkeypatch.setattr(auth.os, "name", "nt")
+
+    failures[:] = [errno.EACCES]
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        _FileLock(tmp_path / "cache.lock", timeout=0.2).__enter__()
+    assert 0.2 <= time.monotonic() - start < 2
+
+    failures[:] = [errno.EBADF]
+    start = time.monotonic()
+    with pytest.raises(OSError) as info:
+        _FileLock(tmp_path / "cache.lock", timeout=30).__enter__()
+    assert info.value.errno == errno.EBADF and time.monotonic() - start < 1
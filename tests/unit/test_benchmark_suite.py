@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmarks.fixtures import write_junit_report
+from benchmarks.suite import _load_parse_junit, compare, main
+
+
+def _results(**medians) -> dict:
+    return {"metrics": {name.replace("_", "."): {"median": value} for name, value in medians.items()}}
+
+
+@pytest.mark.unit
+def test_compare_flags_regressions_beyond_threshold_and_noise_floor():
+    baseline = _results(cards_snapshot=100.0, junit_parse=2.0, api_sequential=50.0, driver_startup=900.0)
+    current = _results(cards_snapshot=125.0, junit_parse=2.6, api_sequential=30.0, select2_collect=5.0)
+
+    rows = {r.metric: r for r in compare(baseline, current, threshold_pct=20, min_delta_ms=1.0)}
+    assert rows["cards.snapshot"].status == "regressed" and rows["cards.snapshot"].delta_pct == 25.0
+    # +30% but only 0.6 ms: below the noise floor
+    assert rows["junit.parse"].status == "ok"
+    assert rows["api.sequential"].status == "improved"
+    assert rows["driver.startup"].status == "missing"
+    assert rows["select2.collect"].status == "new"
+    assert compare(baseline, current, threshold_pct=30)[0].status == "ok"
+
+
+@pytest.mark.unit
+def test_compare_exit_code_fails_on_missing_metrics_unless_allowed(tmp_path):
+    baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+    baseline.write_text(json.dumps(_results(api_sequential=50.0, driver_startup=900.0)))
+    current.write_text(json.dumps(_results(api_sequential=50.0)))
+    args = ["compare", str(current), "--baseline", str(baseline)]
+    assert main(args) == 1
+    assert main(args + ["--allow-missing"]) == 0
+
+    current.write_text(json.dumps(_results(api_sequential=80.0)))
+    assert main(args + ["--allow-missing"]) == 1  # regressions still fail
+
+
+@pytest.mark.unit
+def test_parse_junit_totals_for_both_report_shapes(tmp_path):
+    parse_junit = _load_parse_junit()
+    summary = parse_junit(str(write_junit_report(tests=400, suites=4, directory=tmp_path)))
+    assert (summary.tests, summary.failures, summary.passed, summary.passrate) == (400, 8, 392, 98.0)
+
+    single = tmp_path / "single.xml"
+    single.write_text('<testsuite tests="3" failures="1" errors="1" skipped="0"><testcase name="a"/></testsuite>')
+    assert parse_junit(str(single)).outputs() == {
+        "tests": 3, "passed": 1, "failures": 1, "errors": 1, "skipped": 0, "passrate": 33.33,
+    }
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from src.pages.careers_page import CareersPage
+
+
+class FakeDriver:
+    def __init__(self, result):
+        self.result = result
+        self.timeouts = SimpleNamespace(script=30)
+        self.script_timeouts = []
+        self.async_calls = []
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+        self.timeouts.script = seconds
+
+    def execute_async_script(self, script, *args):
+        self.async_calls.append(args)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def no_consent_banner(monkeypatch):
+    # Banner handling has its own tests; here it would only poll for its timeout
+    monkeypatch.setattr(CareersPage, "_dismiss_cookies_if_any", lambda self: None)
+
+
+@pytest.mark.unit
+def test_snapshot_blocks_single_roundtrip_restores_script_timeout():
+    rows = [
+        {"key": "locations", "found": True, "id": "career-our-location", "heading": "Our Locations",
+         "visible": True, "in_viewport": True, "rect": {"x": 0, "y": 900, "width": 1200, "height": 400}},
+        {"key": "teams", "found": True, "heading": "Find your calling", "visible": True},
+        {"key": "life", "found": False},
+    ]
+    driver = FakeDriver(rows)
+    sections = CareersPage(driver, timeout=5).snapshot_blocks()
+
+    assert list(sections) == ["locations", "teams", "life"]
+    assert sections["locations"].visible and sections["locations"].rect["y"] == 900
+    assert not sections["life"].found
+    specs, timeout_ms = driver.async_calls[0]
+    assert len(driver.async_calls) == 1 and timeout_ms == 5000
+    assert [s["key"] for s in specs] == ["locations", "teams", "life"]
+    assert driver.script_timeouts == [15, 30] and driver.timeouts.script == 30
+
+
+@pytest.mark.unit
+def test_snapshot_blocks_restores_timeout_on_script_errors():
+    driver = FakeDriver({"error": "ReferenceError: x"})
+    with pytest.raises(TimeoutException):
+        CareersPage(driver, timeout=5).snapshot_blocks()
+    assert driver.timeouts.script == 30
+
+    driver = FakeDriver(TimeoutException("script timeout"))
+    with pytest.raises(TimeoutException):
+        CareersPage(driver, timeout=5).snapshot_blocks()
+    assert driver.script_timeouts == [15, 30]
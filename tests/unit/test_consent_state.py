@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from src.utils.browser_state import BrowserState, capture_state, inject_state, load_states, save_states
+from src.utils.consent import ConsentStore
+
+ORIGIN = "https://useinsider.com"
+
+
+class FakeDriver:
+    """Non-Chromium driver: cookies/storage, navigation and a banner that can be clicked once."""
+
+    def __init__(self, session="s1", banner=False):
+        self.session_id = session
+        self.current_window_handle = "w1"
+        self.current_url = ORIGIN + "/careers/"
+        self.banner = banner
+        self.cookies = [
+            {"name": "OptanonConsent", "value": "groups=1", "path": "/", "expiry": int(time.time()) + 600, "size": 9},
+            {"name": "_ga", "value": "GA1", "path": "/"},
+        ]
+        self.storage = {"OptanonConsent": "x", "theme": "dark"}
+        self.cdp_calls = []
+        self.visited = []
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_script(self, script, *args):
+        if "localStorage.length" in script:
+            return dict(self.storage)
+        if "Object.entries(arguments[0])" in script:
+            self.storage.update(args[0])
+            return None
+        # Consent banner dismiss script
+        if self.banner:
+            self.banner = False
+            return "onetrust-accept-btn-handler"
+        return None
+
+
+class FakeChromium(FakeDriver):
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_calls.append((cmd, params))
+
+
+@pytest.mark.unit
+def test_capture_filters_and_state_roundtrips_on_disk(tmp_path):
+    state = capture_state(FakeDriver(), ("Optanon",), ("OptanonConsent",))
+    assert state.origin == ORIGIN
+    assert [c["name"] for c in state.cookies] == ["OptanonConsent"]
+    assert "size" not in state.cookies[0]
+    assert state.local_storage == {"OptanonConsent": "x"}
+    assert state.expires_at == state.cookies[0]["expiry"] and not state.is_expired()
+
+    path = tmp_path / "states.json"
+    save_states(path, {ORIGIN: state})
+    assert load_states(path) == {ORIGIN: state}
+    path.write_text("{not json")
+    assert load_states(path) == {}
+    assert BrowserState(ORIGIN, expires_at=time.time() + 30).is_expired(margin=60)
+
+
+@pytest.mark.unit
+def test_inject_uses_cdp_without_navigation_or_one_visit_otherwise():
+    state = BrowserState(ORIGIN, cookies=[{"name": "OptanonConsent", "value": "v", "path": "/"}], local_storage={"k": "v"})
+    chromium = FakeChromium()
+    inject_state(chromium, state)
+    assert [c for c, _ in chromium.cdp_calls] == ["Network.setCookies", "Page.addScriptToEvaluateOnNewDocument"]
+    assert chromium.cdp_calls[0][1]["cookies"][0]["url"] == ORIGIN and chromium.visited == []
+
+    firefox = FakeDriver()
+    inject_state(firefox, state)
+    assert firefox.visited == [ORIGIN + "/robots.txt"]
+    assert firefox.cookies[-1]["name"] == "OptanonConsent" and firefox.storage["k"] == "v"
+
+
+@pytest.mark.unit
+def test_banner_dismissed_once_then_later_browsers_are_seeded(tmp_path):
+    store = ConsentStore(tmp_path / "consent.json")
+    first = FakeChromium(banner=True)
+    assert not store.seed(first, ORIGIN + "/")
+    assert store.handle_banner(first, timeout=0)
+    assert store.is_seeded(first) and store.state_for(ORIGIN + "/careers/") is not None
+
+    # A new browser (another session) in a later worker loads the persisted state
+    second = FakeChromium(session="s2")
+    reloaded = ConsentStore(tmp_path / "consent.json")
+    assert reloaded.seed(second, ORIGIN + "/")
+    assert reloaded.is_seeded(second) and second.cdp_calls
+    # Seeded: a single zero-wait check, nothing to click
+    start = time.monotonic()
+    assert not reloaded.handle_banner(second, timeout=5)
+    assert time.monotonic() - start < 1
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.plugins.test_impact import ImpactRecorder, affected, changed_files, is_global_change
+from src.utils.config import get_env_config
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.mark.unit
+def test_recorder_attributes_called_src_files_to_current_scope():
+    recorder = ImpactRecorder(ROOT)
+    recorder.push()
+    recorder.start()
+    try:
+        get_env_config("qa")
+    finally:
+        recorder.stop()
+    files = recorder.pop()
+    assert "src/utils/config.py" in files
+    assert not any(f.startswith("src/plugins/") for f in files)
+
+
+@pytest.mark.unit
+def test_selection_rules():
+    impact_map = {
+        "tests/api/test_a.py::test_crud": ["src/utils/api_client.py"],
+        "tests/ui/test_b.py::test_jobs": ["src/pages/qa_jobs_page.py", "src/utils/driver_factory.py"],
+    }
+    changed = {"src/pages/qa_jobs_page.py", "README.md"}
+    assert not affected("tests/api/test_a.py::test_crud", "tests/api/test_a.py", impact_map, changed)
+    assert affected("tests/ui/test_b.py::test_jobs", "tests/ui/test_b.py", impact_map, changed)
+    # Unknown tests and edited test files always run
+    assert affected("tests/api/test_a.py::test_new", "tests/api/test_a.py", impact_map, set())
+    assert affected("tests/api/test_a.py::test_crud", "tests/api/test_a.py", impact_map, {"tests/api/test_a.py"})
+
+    assert is_global_change("conftest.py") and is_global_change("tests/unit/conftest.py")
+    assert is_global_change("src/plugins/startup_profile.py") and is_global_change("src/specs/petstore.json")
+    assert not is_global_change("src/utils/api_client.py") and not is_global_change("README.md")
+
+
+@pytest.mark.unit
+def test_changed_files_includes_uncommitted_and_untracked(tmp_path):
+    def git(*args):
+        subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.py").write_text("b = 1\n")
+    git("add", ".")
+    git("commit", "-qm", "base")
+    git("tag", "base")
+    (tmp_path / "a.py").write_text("a = 2\n")
+    git("commit", "-qam", "change a")
+    (tmp_path / "b.py").write_text("b = 2\n")
+    (tmp_path / "c.py").write_text("c = 1\n")
+
+    assert changed_files("base", tmp_path) == ["a.py", "b.py", "c.py"]
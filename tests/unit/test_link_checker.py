@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from src.utils.api_client import ApiClient
+from src.utils.link_checker import LinkChecker, effective_host, latency_report
+
+
+class FakeLinks(BaseHTTPRequestHandler):
+    # Per-server state lives on a subclass made by the `links_server` fixture
+    hits: dict
+    in_flight: int
+    peak: int
+    lock: threading.Lock
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.hits[self.path] = cls.hits.get(self.path, 0) + 1
+        if self.path.startswith("/job/"):
+            self.send_response(302)
+            self.send_header("Location", "/posting/" + self.path.rsplit("/", 1)[-1])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        time.sleep(0.2)
+        with cls.lock:
+            cls.in_flight -= 1
+        status = 200 if self.path.startswith("/posting/") else 404
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def links_server(local_server):
+    handler = type("Links", (FakeLinks,), {"hits": {}, "in_flight": 0, "peak": 0, "lock": threading.Lock()})
+    return local_server(handler), handler
+
+
+@pytest.mark.unit
+def test_links_checked_concurrently_with_redirect_chains(links_server):
+    base, handler = links_server
+    checker = LinkChecker(max_workers=8, allowed_hosts=("127.0.0.1",))
+    urls = [f"{base}/job/{i}" for i in range(8)] + [f"{base}/job/0", f"{base}/gone"]
+
+    results = checker.check_all(urls)
+    threads = len(checker._clients)
+    checker.close()
+
+    # Requests overlapped on the server, each worker thread used its own session, the duplicate
+    # was fetched once
+    assert handler.peak > 1
+    assert 1 < threads <= 8
+    assert handler.hits["/job/0"] == 1
+    assert [r.url for r in results] == urls
+    first = results[0]
+    assert first.status == 200 and first.final_url == f"{base}/posting/0"
+    assert first.redirects == [f"302 {base}/job/0"]
+    assert first.elapsed_ms >= 200
+    assert checker.problems(results) == [f"{base}/gone: HTTP 404 after 0 redirects ({base}/gone)"]
+    assert "links=10" in latency_report(results)
+
+
+@pytest.mark.unit
+def test_host_check_and_absolute_urls():
+    checker = LinkChecker(client=ApiClient("https://petstore.swagger.io/v2", pool_size=4))
+    assert checker.client._url("https://jobs.lever.co/useinsider/1") == "https://jobs.lever.co/useinsider/1"
+    assert checker.client._url("pet/1") == "https://petstore.swagger.io/v2/pet/1"
+    assert effective_host("http://127.0.0.1:8000/_h/jobs.lever.co/useinsider/1") == "jobs.lever.co"
+
+    clone = checker.client.clone()
+    assert clone.session is not checker.client.session and clone.adapter is checker.client.adapter
+
+    result = checker.check("http://127.0.0.1:9/unreachable")
+    assert result.error and result.problem(checker.allowed_hosts)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from src.pages.base_page import BasePage, Loc
+
+
+class FakeElement:
+    def __init__(self, name):
+        self.name = name
+        self.stale = False
+
+    def is_enabled(self):
+        if self.stale:
+            raise StaleElementReferenceException(self.name)
+        return True
+
+
+class FakeDriver:
+    def __init__(self):
+        self.calls = []
+        self.script_result = None
+
+    def find_element(self, by, value):
+        self.calls.append(("find_element", by, value))
+        return FakeElement(value)
+
+    def execute_script(self, script, specs, root, all_matches):
+        self.calls.append(("script", specs, all_matches))
+        return self.script_result
+
+
+@pytest.mark.unit
+def test_loc_specs_and_native_form():
+    plain = Loc("a[href*='/careers']")
+    assert plain.native == (By.CSS_SELECTOR, "a[href*='/careers']")
+    loc = Loc("a, button", text="See All QA Jobs", ignore_case=True, fallback=Loc("section", text=("Teams", "Calling"), within="h2"))
+    assert loc.native is None
+    assert loc.specs() == [
+        {"css": "a, button", "texts": ["see all qa jobs"], "exact": False, "ci": True, "within": None},
+        {"css": "section", "texts": ["Teams", "Calling"], "exact": False, "ci": False, "within": "h2"},
+    ]
+
+
+@pytest.mark.unit
+def test_find_uses_native_css_or_one_matcher_roundtrip():
+    driver = FakeDriver()
+    page = BasePage(driver)
+    assert page.find(Loc("#id")).name == "#id"
+    assert driver.calls == [("find_element", By.CSS_SELECTOR, "#id")]
+
+    text_loc = Loc("a", text="Careers", exact=True)
+    driver.script_result = FakeElement("careers-link")
+    assert page.find(text_loc).name == "careers-link"
+    assert driver.calls[-1] == ("script", text_loc.specs(), False)
+
+    driver.script_result = None
+    with pytest.raises(NoSuchElementException):
+        page.find(text_loc)
+
+
+@pytest.mark.unit
+def test_element_cache_reuses_until_stale_or_invalidated():
+    driver = FakeDriver()
+    page = BasePage(driver)
+    cached = Loc("span.select2-selection", cache=True)
+
+    first = page.find(cached)
+    assert page.find(cached) is first and len(driver.calls) == 1
+
+    first.stale = True
+    second = page.find(cached)
+    assert second is not first and len(driver.calls) == 2
+
+    page.invalidate_cache()
+    assert page.find(cached) is not second and len(driver.calls) == 3
+    # Uncached locators always resolve again
+    page.find(Loc("span.select2-selection"))
+    page.find(Loc("span.select2-selection"))
+    assert len(driver.calls) == 5
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from src.utils.api_client import ApiClient
+from src.utils.petstore_pool import IdAllocator, PetPool
+
+
+class FakePetstore(BaseHTTPRequestHandler):
+    pets: dict = {}
+    lock = threading.Lock()
+
+    def _send(self, status: int, body: dict | None = None):
+        data = json.dumps(body or {}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _pet_id(self):
+        m = re.match(r"^/v2/pet/(\d+)$", self.path)
+        return int(m.group(1)) if m else None
+
+    def do_POST(self):
+        pet = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.lock:
+            self.pets[pet["id"]] = pet
+        self._send(200, pet)
+
+    def do_GET(self):
+        pet = self.pets.get(self._pet_id())
+        self._send(200, pet) if pet else self._send(404)
+
+    def do_DELETE(self):
+        with self.lock:
+            found = self.pets.pop(self._pet_id(), None)
+        self._send(200 if found else 404)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def petstore(local_server):
+    handler = type("Petstore", (FakePetstore,), {"pets": {}})
+    return ApiClient(local_server(handler) + "/v2"), handler
+
+
+@pytest.mark.unit
+def test_ids_unique_across_workers_of_a_run():
+    ids = set()
+    for worker in ("gw0", "gw1", "gw12"):
+        alloc = IdAllocator(run_id="run-1", worker_id=worker)
+        ids.update(alloc.next_id() for _ in range(1000))
+    assert len(ids) == 3000
+    assert max(ids) < 2**53
+
+
+@pytest.mark.unit
+def test_pool_provisions_hands_out_and_cleans_up(petstore):
+    client, store = petstore
+    pool = PetPool(client, IdAllocator(run_id="run-2"))
+    pool.provision(4)
+    assert len(store.pets) == 4
+
+    first, second = pool.acquire(), pool.acquire()
+    assert first["id"] != second["id"]
+    pool.release(first["id"])
+    own = pool.new_id()
+    client.post("/pet", json={"id": own, "name": "mine", "status": "available"})
+
+    pool.close()
+    assert store.pets == {}
+    assert pool.stats.seeded == 4
+    assert pool.stats.create_failures == 0
+    assert pool.stats.deleted == 5
+    assert pool.stats.delete_failures == 0
+
+
+@pytest.mark.unit
+def test_failed_seeds_are_counted_and_reported(local_server):
+    def do_POST(self):
+        pet = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if pet["id"] % 2:
+            return self._send(500)
+        with self.lock:
+            self.pets[pet["id"]] = pet
+        self._send(200, pet)
+
+    handler = type("FlakyPetstore", (FakePetstore,), {"pets": {}, "do_POST": do_POST})
+    pool = PetPool(ApiClient(local_server(handler) + "/v2"), IdAllocator(run_id="run-3"), poll_attempts=1)
+    pool.provision(4)
+    pool.close()
+    assert (pool.stats.seeded, pool.stats.create_failures) == (2, 2)
+    assert pool.summary()["create_failures"] == 2
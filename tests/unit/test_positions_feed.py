@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from src.pages.qa_jobs_page import JobCard
+from src.utils import positions_feed
+from src.utils.api_client import ApiClient
+from src.utils.positions_feed import PositionsFeed, posting_id
+
+LEVER = "https://jobs.lever.co/useinsider"
+FEED = [
+    {"id": "a1", "text": "Senior QA Engineer", "hostedUrl": f"{LEVER}/a1",
+     "categories": {"team": "Quality Assurance", "location": "Istanbul, Turkiye", "allLocations": ["Istanbul, Turkiye"]}},
+    {"id": "a2", "text": "QA Automation Engineer", "hostedUrl": f"{LEVER}/a2",
+     "categories": {"team": "Quality Assurance", "location": "Istanbul, Turkiye"}},
+    {"id": "a3", "text": "Test Lead", "hostedUrl": f"{LEVER}/a3",
+     "categories": {"team": "Quality Assurance", "location": "Remote", "allLocations": ["Remote", "Istanbul, Turkiye"]}},
+    {"id": "b1", "text": "QA Engineer", "hostedUrl": f"{LEVER}/b1",
+     "categories": {"team": "Quality Assurance", "location": "London, UK"}},
+    {"id": "c1", "text": "Backend Engineer", "hostedUrl": f"{LEVER}/c1",
+     "categories": {"team": "Engineering", "location": "Istanbul, Turkiye"}},
+]
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps(FEED).encode()
+        self.send_response(200 if self.path.startswith("/v0/postings/useinsider") else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.unit
+def test_feed_diff_against_rendered_cards(local_server):
+    base = local_server(FeedHandler)
+    feed = PositionsFeed.fetch(f"{base}/v0/postings/useinsider?mode=json")
+    assert len(feed.postings) == 5
+
+    selected = {p.id for p in feed.select("quality assurance", "Istanbul")}
+    assert selected == {"a1", "a2", "a3"}
+
+    cards = [
+        JobCard("Senior QA Engineer", "Quality Assurance", "Istanbul, Turkiye", f"{LEVER}/a1"),
+        # Replayed hrefs still resolve to the posting id
+        JobCard("QA Automation  Engineer", "Quality Assurance", "Istanbul, Turkiye", f"{base}/_h/jobs.lever.co/useinsider/a2"),
+        JobCard("QA Engineer", "Quality Assurance", "Istanbul, Turkiye", f"{LEVER}/b1"),
+    ]
+    diff = feed.diff(cards, "Quality Assurance", "Istanbul, Turkiye")
+    assert not diff.ok
+    assert (diff.expected, diff.rendered) == (3, 3)
+    assert [p.id for p in diff.missing] == ["a3"]
+    assert diff.unexpected == [f"QA Engineer [Quality Assurance / Istanbul, Turkiye] {LEVER}/b1"]
+    assert diff.mismatched == []
+    assert "missing from page: Test Lead" in diff.report()
+
+    cards[0] = JobCard("Senior QA Engineer", "Engineering", "Ankara", f"{LEVER}/a1/apply")
+    mismatched = feed.diff(cards, "Quality Assurance", "Istanbul, Turkiye").mismatched
+    assert mismatched == ["a1 department 'Engineering' != 'Quality Assurance'", "a1 location 'Ankara' != 'Istanbul, Turkiye'"]
+    assert posting_id(f"{LEVER}/a1/") == "a1"
+
+
+@pytest.mark.unit
+def test_fetch_closes_only_the_client_it_created(local_server, monkeypatch):
+    url = local_server(FeedHandler) + "/v0/postings/useinsider?mode=json"
+    created = []
+
+    class TrackedClient(ApiClient):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.closed = False
+            self.session.close = lambda: setattr(self, "closed", True)
+            created.append(self)
+
+    monkeypatch.setattr(positions_feed, "ApiClient", TrackedClient)
+    PositionsFeed.fetch(url)
+    assert [c.closed for c in created] == [True]
+
+    mine = TrackedClient(base_url="")
+    PositionsFeed.fetch(url, client=mine)
+    assert not mine.closed
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+import requests
+
+from src.replay.archive import Archive, ArchiveWriter
+from src.replay.server import ReplayServer
+
+
+@pytest.fixture()
+def archive(tmp_path):
+    writer = ArchiveWriter()
+    writer.add(
+        "https://useinsider.com/careers/",
+        200,
+        {"Content-Type": "text/html; charset=utf-8", "Set-Cookie": "dropped=1"},
+        b'<a href="https://useinsider.com/careers/quality-assurance/">QA</a>'
+        b'<script src="//cdn.example.net/app.js"></script>'
+        b'<a href="https://jobs.lever.co/useinsider/123">Role</a>',
+    )
+    writer.add("https://useinsider.com/careers", 301, {"Location": "https://useinsider.com/careers/"}, b"")
+    writer.add("https://cdn.example.net/app.js", 200, {"content-type": "application/javascript"}, b"var a = 1;")
+    writer.add(
+        "https://api.lever.co/v0/postings/useinsider?mode=json",
+        200,
+        {"content-type": "application/json"},
+        b'[{"hostedUrl": "https:\\/\\/jobs.lever.co\\/useinsider\\/123"}]',
+    )
+    writer.add("https://jobs.lever.co/useinsider/123", 200, {"content-type": "text/html"}, b"<title>Lever</title>")
+    return Archive.load(writer.save(tmp_path / "capture.zip"))
+
+
+@pytest.mark.unit
+def test_replay_rewrites_recorded_hosts_to_local_server(archive):
+    with ReplayServer(archive) as server:
+        page = requests.get(server.url + "careers/")
+        assert page.status_code == 200
+        assert "set-cookie" not in page.headers
+        assert f'href="{server.url}careers/quality-assurance/"' in page.text
+        assert f'src="{server.url}_h/cdn.example.net/app.js"' in page.text
+        assert f"{server.url}_h/jobs.lever.co/useinsider/123" in page.text
+
+        assert requests.get(server.url + "_h/cdn.example.net/app.js?v=42").text == "var a = 1;"
+        feed = requests.get(server.url + "_h/api.lever.co/v0/postings/useinsider?mode=json").json()
+        assert feed[0]["hostedUrl"] == f"{server.url}_h/jobs.lever.co/useinsider/123"
+
+        redirect = requests.get(server.url + "careers", allow_redirects=False)
+        assert redirect.status_code == 301
+        assert redirect.headers["location"] == server.url + "careers/"
+
+        assert requests.get(server.url + "not-recorded").status_code == 404
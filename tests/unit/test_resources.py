@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from src.plugins.resources import WORKER_RSS, _expects_ui, plan_workers
+from src.utils.browser_contexts import SharedBrowser
+
+MIB = 1024 * 1024
+
+
+@pytest.mark.unit
+def test_plan_workers_limits():
+    # 8 CPUs but 4 GiB free: (4096 - 1024) // (450 + 120) = 5 browsers fit
+    ui = plan_workers(cpus=8, available_bytes=4096 * MIB, ui=True, browser_rss=450 * MIB)
+    assert (ui.workers, ui.limited_by) == (5, "memory")
+    # Plenty of memory: CPUs bound UI runs, API runs get two workers per CPU up to their cap
+    assert plan_workers(cpus=4, available_bytes=64 * 1024 * MIB, ui=True).workers == 4
+    api = plan_workers(cpus=4, available_bytes=64 * 1024 * MIB, ui=False, max_api=6)
+    assert (api.workers, api.limited_by, api.browser_rss) == (6, "cap", 0)
+    # Never below one worker, and unknown memory falls back to CPUs
+    assert plan_workers(cpus=2, available_bytes=512 * MIB, ui=True).workers == 1
+    assert plan_workers(cpus=3, available_bytes=None, ui=True).limited_by == "cpu"
+    assert plan_workers(cpus=1, available_bytes=1024 * MIB + 3 * WORKER_RSS, ui=False).workers == 2
+
+
+class FakeDriver:
+    ids = itertools.count(1)
+
+    def __init__(self):
+        self.rss = 0
+        self.quit_called = False
+        self.current_window_handle = "home"
+        self.browser = SimpleNamespace(
+            create_user_context=lambda: f"uc{next(self.ids)}", remove_user_context=lambda uc: None
+        )
+        self.browsing_context = SimpleNamespace(create=lambda type, user_context: f"tab-{user_context}")
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+
+    def set_window_size(self, width, height):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "markexpr, args, ui",
+    [
+        ("api", [], False),
+        ("smoke and api", ["tests"], False),
+        ("api or ui", [], True),
+        ("not api", [], True),
+        ("rapid", [], True),  # substring of "api", not the marker
+        ("api and build", [], False),  # "build" contains "ui"
+        ("", ["tests/api", "tests/unit/test_resources.py::test_plan_workers_limits"], False),
+        ("", ["tests/ui"], True),
+    ],
+)
+def test_expects_ui_matches_whole_marker_names(markexpr, args, ui):
+    options = {"markexpr": markexpr, "--tags": ""}
+    config = SimpleNamespace(getoption=lambda name, default=None: options.get(name, default), args=args)
+    assert _expects_ui(config) is ui
+
+
+@pytest.mark.unit
+def test_shared_browser_recycles_over_rss_threshold(monkeypatch):
+    started = []
+
+    def factory():
+        started.append(FakeDriver())
+        return started[-1]
+
+    shared = SharedBrowser(factory, recycle_rss=1000 * MIB)
+    monkeypatch.setattr(shared, "rss", lambda: shared._driver.rss)
+
+    first = shared.open_context()
+    started[0].rss = 800 * MIB
+    first.close()
+    second = shared.open_context()
+    assert second.driver is started[0]
+    started[0].rss = 1200 * MIB
+    second.close()
+
+    assert started[0].quit_called and shared.recycles == 1 and shared.peak_rss == 1200 * MIB
+    assert shared.open_context().driver is started[1]
+    assert shared.contexts_served == 3 and shared.restarts == 0
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from src.utils.response_schema import get_spec, refresh_spec
+
+PET = {
+    "id": 9223372036854775807,
+    "category": {"id": 1, "name": "dogs"},
+    "name": "doggie",
+    "photoUrls": ["https://example.test/1.png"],
+    "tags": [{"id": 0, "name": "string"}],
+    "status": "available",
+}
+
+
+@pytest.mark.unit
+def test_operation_lookup_and_validator_cache():
+    spec = get_spec()
+    assert spec.template_for("https://petstore.swagger.io/v2/pet/123") == "/pet/{petId}"
+    assert spec.template_for("/v2/pet/findByStatus?status=sold") == "/pet/findByStatus"
+    assert spec.template_for("/v2/nope") is None
+
+    by_status = spec.validator("GET", "/v2/pet/findByStatus", 200)
+    assert by_status is spec.validator("get", "https://petstore.swagger.io/v2/pet/findByStatus?status=sold", 200)
+    assert by_status([PET, dict(PET, status="sold")]) and by_status([])
+    # Create/update only document error codes; the echoed body is checked against the body parameter
+    assert spec.validator("POST", "/v2/pet", 200).schema == {"$ref": "#/definitions/Pet"}
+    assert spec.validator("DELETE", "/v2/pet/1", 200) is None
+    inventory = spec.validator("GET", "/v2/store/inventory", 200)
+    assert inventory({"available": 3, "sold": 1}) and not inventory({"available": "3"})
+
+
+@pytest.mark.unit
+def test_errors_point_at_offending_fields():
+    spec = get_spec()
+    pets = spec.validator("GET", "/v2/pet/findByStatus", 200)
+    bad = [
+        PET,
+        {"id": 1, "name": "x", "photoUrls": [], "status": "lost"},
+        {"id": 2.5, "photoUrls": "nope", "tags": [{"id": True}]},
+    ]
+    assert not pets(bad)
+    assert pets.errors(bad) == [
+        "$[1].status: 'lost' not in ['available', 'pending', 'sold']",
+        "$[2]: missing required 'name'",
+        "$[2].id: expected integer, got number 2.5",
+        "$[2].photoUrls: expected array, got string 'nope'",
+        "$[2].tags[0].id: expected integer, got boolean True",
+    ]
+    assert len(pets.errors(bad, limit=2)) == 2
+    assert spec.definition("Order").errors({"quantity": 2**40}) == ["$.quantity: 1099511627776 out of int32 range"]
+    with pytest.raises(KeyError):
+        spec.definition("Dog")
+
+
+class SpecHandler(BaseHTTPRequestHandler):
+    body = b""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.unit
+def test_refresh_vendors_the_published_bytes_unmodified(local_server, tmp_path):
+    published = b'{"swagger":"2.0","paths":{},"definitions":{}}'
+    url = local_server(type("Published", (SpecHandler,), {"body": published})) + "/v2/swagger.json"
+    target = refresh_spec(url, tmp_path / "petstore_swagger.json")
+    assert target.read_bytes() == published
+
+    with pytest.raises(ValueError):
+        refresh_spec(local_server(type("ErrorPage", (SpecHandler,), {"body": b"<html>"})), target)
+    assert target.read_bytes() == published
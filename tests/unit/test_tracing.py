@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+from src.utils.artifacts import ArtifactCollector
+from src.utils.tracing import Tracer
+
+
+class FakeDriver:
+    log_types = []
+    page_source = "<p/>"
+
+    def get_screenshot_as_base64(self):
+        return ""
+
+    def execute_script(self, script):
+        return []
+
+    def get_log(self, kind):
+        raise NotImplementedError(kind)
+
+
+@pytest.mark.unit
+def test_ring_buffer_keeps_latest_events_and_formats_lazily():
+    tracer = Tracer(capacity=3)
+    for attempt in range(1, 6):
+        tracer.event("select2", "attempt", attempt=attempt, options=["All"])
+    assert len(tracer) == 3 and tracer.dropped == 2
+    text = tracer.format()
+    assert text.splitlines()[0] == "... 2 older events dropped (capacity 3)"
+    assert "[select2] attempt attempt=5 options=['All']" in text
+    assert "attempt=2 " not in text
+
+    tracer.clear()
+    assert len(tracer) == 0 and tracer.format() == ""
+
+
+@pytest.mark.unit
+def test_deferred_collection_runs_only_on_failure_grab():
+    tracer = Tracer()
+    calls = []
+    tracer.defer("cards", lambda: calls.append(1) or {"total": 0})
+    tracer.defer("cards", lambda: calls.append(2) or {"total": 3})
+    tracer.defer("broken", lambda: 1 / 0)
+    tracer.event("loc", "clicked", option="Istanbul, Turkiye")
+    assert calls == []
+
+    collector = ArtifactCollector()
+    raw = collector.grab(FakeDriver(), tracer)
+    assert calls == [2]
+    assert "[deferred] cards result={'total': 3}" in raw.trace
+    assert "[deferred] broken error='ZeroDivisionError: division by zero'" in raw.trace
+    assert collector.process(raw, "t4")["trace"].endswith("(txt)")
+    # Deferred collectors are consumed by the failure that ran them
+    tracer.collect_deferred()
+    assert calls == [2]